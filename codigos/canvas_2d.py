@@ -2,10 +2,12 @@
 Canvas 2D para desenho de polígonos e preenchimento com scanline
 """
 from typing import List, Tuple, Optional
-from PyQt5.QtCore import Qt, QPoint
-from PyQt5.QtGui import QPainter, QPen, QColor
+import weakref
+import numpy as np
+from PyQt5.QtCore import Qt, QRect, QTimer
+from PyQt5.QtGui import QPainter, QPen, QColor, QPixmap, QPolygon, QPainterPath, QImage
 from PyQt5.QtWidgets import QWidget, QMessageBox
-from polygon_fill import build_edge_table_and_fill
+from polygon_fill import build_edge_table_and_fill, fill_triangle, points_collinear
 import geometry3d as geo3d
 
 Point = Tuple[int, int]
@@ -18,23 +20,122 @@ class Canvas(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)
-        self.points: List[Point] = []
-        self.is_closed: bool = False
+        # Conteúdo ancorado no canto superior esquerdo: ao redimensionar, o Qt
+        # só repinta a área recém-exposta
+        self.setAttribute(Qt.WA_StaticContents)
+        # Vértices em buffer (N, 2) int32 que cresce por duplicação;
+        # self.points é uma visão das _n primeiras linhas
+        self._xy = np.empty((16, 2), dtype=np.int32)
+        self._n: int = 0
+        self._is_closed: bool = False
         self.stroke_color = QColor(0, 0, 0)
         self.fill_color = QColor(10, 132, 255)
         self.stroke_width: int = 2
-        self.filled_spans: Optional[List[Span]] = None
+        self.filled_spans: Optional[np.ndarray] = None  # (n, 3) int16/int32, linhas (y, x_start, x_end)
+        self._fill_pixmap: Optional[QPixmap] = None  # preenchimento já rasterizado
         self.extruded_object: Optional[geo3d.Object3D] = None
         self.extrusion_depth: float = 100.0
+        # (versão, profundidade, referência fraca ao objeto): não prende o objeto removido da cena
+        self._extrude_cache: Optional[Tuple[int, float, weakref.ref]] = None
         self.on_polygon_changed = None  # Callback para notificar mudanças
+        # Agrupa notificações em sequência (ex.: vários undos) em uma só reextrusão
+        self._polygon_changed_timer = QTimer(self)
+        self._polygon_changed_timer.setSingleShot(True)
+        self._polygon_changed_timer.setInterval(16)
+        self._polygon_changed_timer.timeout.connect(self._emit_polygon_changed)
+        # Canetas reutilizadas entre pinturas, atualizadas pelos setters
+        self._stroke_pen = QPen(self.stroke_color)
+        self._dot_pen = QPen(self.stroke_color)
+        self._dot_pen.setCapStyle(Qt.RoundCap)
+        self._update_stroke_pens()
+        # Versão dos pontos: incrementada a cada mutação, invalida caches
+        self._points_version: int = 0
+        self._points_arr: Optional[np.ndarray] = None
+        self._points_arr_version: int = -1
+        self._collinear_cache: Optional[Tuple[int, bool]] = None  # (versão, resultado)
+        self._qpoly: Optional[QPolygon] = None
+        self._qpoly_version: int = -1
+        # Contorno já com a aresta de fechamento embutida quando fechado;
+        # invalidado por mudança nos pontos ou em is_closed
+        self._poly_path: Optional[QPainterPath] = None
+        self._poly_path_version: int = -1
+        # Caixa de alerta única, reaproveitada a cada aviso
+        self._alert_box = QMessageBox(self)
+        self._alert_box.setIcon(QMessageBox.Warning)
+        self._alert_box.setStandardButtons(QMessageBox.Ok)
         self.setMinimumSize(800, 600)
 
+    def _emit_polygon_changed(self):
+        """Dispara o callback de mudança do polígono"""
+        if self.on_polygon_changed:
+            self.on_polygon_changed()
+
+    def _mark_points_changed(self):
+        """Registra que a lista de pontos foi alterada"""
+        self._points_version += 1
+
+    @property
+    def points(self) -> np.ndarray:
+        """Vértices do polígono como array (n, 2) int32 (visão, sem cópia)"""
+        return self._xy[:self._n]
+
+    @property
+    def is_closed(self) -> bool:
+        """Indica se o polígono está fechado"""
+        return self._is_closed
+
+    @is_closed.setter
+    def is_closed(self, closed: bool):
+        if closed != self._is_closed:
+            self._is_closed = closed
+            self._poly_path = None
+
+    def _append_point(self, x: int, y: int):
+        """Adiciona um vértice ao buffer, dobrando a capacidade quando cheio"""
+        if self._n == len(self._xy):
+            grown = np.empty((2 * len(self._xy), 2), dtype=np.int32)
+            grown[:self._n] = self._xy
+            self._xy = grown
+        self._xy[self._n] = (x, y)
+        self._n += 1
+        path_current = self._poly_path is not None and self._poly_path_version == self._points_version
+        self._mark_points_changed()
+        # Caminho aberto em dia: basta estender com um lineTo
+        if path_current and not self._is_closed and self._n > 1:
+            self._poly_path.lineTo(x, y)
+            self._poly_path_version = self._points_version
+
+    def _points_array(self) -> np.ndarray:
+        """Retorna os pontos como array (n, 2) int64, reaproveitando entre chamadas"""
+        if self._points_arr_version != self._points_version:
+            self._points_arr = self.points.astype(np.int64)
+            self._points_arr_version = self._points_version
+        return self._points_arr
+
+    def _update_stroke_pens(self):
+        """Sincroniza as canetas de contorno e de vértices com cor/espessura atuais"""
+        self._stroke_pen.setColor(self.stroke_color)
+        self._stroke_pen.setWidth(self.stroke_width)
+        # Pontos com ponta redonda e largura 2r equivalem a círculos de raio r
+        self._dot_pen.setColor(self.stroke_color)
+        self._dot_pen.setWidth(2 * max(2, self.stroke_width))
+
+    def _dirty_rect(self, pts: np.ndarray) -> QRect:
+        """Retângulo que cobre os vértices dados, incluindo traço e marcadores"""
+        margin = max(2, self.stroke_width) + self.stroke_width + 1
+        x0, y0 = pts.min(axis=0).tolist()
+        x1, y1 = pts.max(axis=0).tolist()
+        return QRect(x0 - margin, y0 - margin, x1 - x0 + 2 * margin + 1, y1 - y0 + 2 * margin + 1)
+
     def clear(self):
         """Limpa o canvas"""
-        self.points.clear()
+        self._n = 0
+        self._mark_points_changed()
         self.is_closed = False
         self.filled_spans = None
+        self._fill_pixmap = None
         self.extruded_object = None
+        self._polygon_changed_timer.stop()
         if self.on_polygon_changed:
             self.on_polygon_changed()
         self.update()
@@ -44,31 +145,50 @@ class Canvas(QWidget):
         if self.filled_spans is not None:
             # Se já preenchido, undo limpa o preenchimento primeiro
             self.filled_spans = None
-        elif self.points:
-            self.points.pop()
+            self._fill_pixmap = None
+            self.update()
+        elif self._n:
+            self._n -= 1
+            self._mark_points_changed()
+            # Região afetada: vértice removido, seu vizinho e (se fechado) o primeiro
+            # vértice; o vértice removido continua no buffer logo após o fim
+            lo = max(0, self._n - 1)
+            affected = self._xy[lo:self._n + 1]
+            if self.is_closed:
+                affected = np.vstack((affected, self._xy[:1]))
+            self.update(self._dirty_rect(affected))
             # Notificar mudança se há objeto extrudado
             if self.extruded_object and self.on_polygon_changed:
-                self.on_polygon_changed()
-        self.update()
+                self._polygon_changed_timer.start()
+        else:
+            self.update()
 
     def set_stroke_color(self, color: QColor):
         """Define a cor do contorno"""
         self.stroke_color = color
-        self.update()
+        self._update_stroke_pens()
+        if self.filled_spans is None and self._n:
+            # Sem preenchimento, só o contorno precisa ser repintado
+            self.update(self._dirty_rect(self.points))
+        else:
+            self.update()
 
     def set_fill_color(self, color: QColor):
         """Define a cor de preenchimento"""
         self.fill_color = color
+        self._fill_pixmap = None
         self.update()
 
     def set_stroke_width(self, width: int):
         """Define a espessura do contorno"""
         self.stroke_width = max(1, int(width))
+        self._update_stroke_pens()
         self.update()
 
     def mousePressEvent(self, event):
         """Trata eventos de clique do mouse"""
         if event.button() == Qt.LeftButton:
+            reopened = self.is_closed
             if self.is_closed:
                 if self.extruded_object:
                     # Se já tem objeto extrudado, permitir edição: reabrir polígono para adicionar ponto
@@ -76,25 +196,17 @@ class Canvas(QWidget):
                 else:
                     # Iniciar novo polígono após fechar (apenas se não há objeto extrudado)
                     self.clear()
-            self.points.append((event.x(), event.y()))
-            self.update()
+            self._append_point(event.x(), event.y())
+            if reopened:
+                self.update()
+            else:
+                # Só mudam o novo vértice e a aresta até o anterior
+                self.update(self._dirty_rect(self._xy[max(0, self._n - 2):self._n]))
         elif event.button() == Qt.RightButton:
             # Tentar fechar polígono com validação
-            if len(self.points) < 3:
-                self._show_alert(
-                    "Polígono Inválido",
-                    "Um polígono precisa de pelo menos 3 pontos.\n"
-                    "Adicione mais pontos antes de fechar o polígono."
-                )
-                return
-            
-            # Verificar se os pontos são colineares
-            if self._are_points_collinear(self.points):
-                self._show_alert(
-                    "Polígono Inválido",
-                    "Os pontos são colineares (estão todos na mesma linha).\n"
-                    "Um polígono válido precisa de pontos que formem uma área."
-                )
+            error = self._validate_polygon()
+            if error:
+                self._show_alert(*error)
                 return
             
             was_closed = self.is_closed
@@ -102,197 +214,195 @@ class Canvas(QWidget):
             self.update()
             # Notificar mudança ao fechar polígono
             if self.extruded_object and self.on_polygon_changed:
-                self.on_polygon_changed()
+                self._polygon_changed_timer.start()
 
-    def _are_points_collinear(self, points: List[Point], tolerance: float = 1e-6) -> bool:
+    def _are_points_collinear(self, points: Optional[List[Point]] = None) -> bool:
         """
         Verifica se todos os pontos são colineares
         
+        As coordenadas são inteiras (pixels), então o produto vetorial é
+        exato e o teste é feito sem tolerância.
+        
         Args:
-            points: Lista de pontos
-            tolerance: Tolerância para considerar pontos colineares
+            points: Lista de pontos (padrão: vértices do canvas)
             
         Returns:
             True se todos os pontos são colineares, False caso contrário
         """
-        if len(points) < 3:
-            return False
-        
-        # Para 3 pontos, verificar se estão na mesma linha
-        if len(points) == 3:
-            x1, y1 = points[0]
-            x2, y2 = points[1]
-            x3, y3 = points[2]
-            
-            # Calcular área do triângulo (determinante)
-            # Se área = 0, pontos são colineares
-            area = abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1))
-            return area < tolerance
-        
-        # Para mais de 3 pontos, verificar se todos estão na mesma linha
-        # Usar os dois primeiros pontos para definir a linha
-        x1, y1 = points[0]
-        x2, y2 = points[1]
+        if points is not None:
+            if len(points) < 3:
+                return False
+            return points_collinear(np.asarray(points, dtype=np.int64).reshape(-1, 2))
         
-        # Calcular vetor diretor
-        dx = x2 - x1
-        dy = y2 - y1
+        if self._n < 3:
+            return False
         
-        # Se os dois primeiros pontos são iguais, não podemos definir uma linha
-        if abs(dx) < tolerance and abs(dy) < tolerance:
-            return True
+        # Fechar, preencher e extrudar testam os mesmos pontos em sequência
+        cache = self._collinear_cache
+        if cache is not None and cache[0] == self._points_version:
+            return cache[1]
+        result = points_collinear(self._points_array())
+        self._collinear_cache = (self._points_version, result)
+        return result
+    
+    def _validate_polygon(self, require_closed: bool = False,
+                          action: str = "fechar o polígono") -> Optional[Tuple[str, str]]:
+        """
+        Valida o polígono atual
         
-        # Verificar se todos os outros pontos estão na mesma linha
-        for i in range(2, len(points)):
-            x3, y3 = points[i]
-            
-            # Calcular área do triângulo formado pelos pontos 0, 1 e i
-            area = abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1))
+        Args:
+            require_closed: Exige que o polígono já esteja fechado
+            action: Ação tentada, usada na mensagem de pontos insuficientes
             
-            if area > tolerance:
-                return False
+        Returns:
+            (título, mensagem) do alerta, ou None se o polígono é válido
+        """
+        if len(self.points) < 3:
+            return ("Polígono Inválido",
+                    "Um polígono precisa de pelo menos 3 pontos.\n"
+                    f"Adicione mais pontos antes de {action}.")
         
-        return True
-    
+        if require_closed and not self.is_closed:
+            return ("Polígono Não Fechado",
+                    "O polígono precisa estar fechado antes de preencher.\n"
+                    "Clique com o botão direito ou use o botão 'Close Polygon' para fechar.")
+        
+        if self._are_points_collinear():
+            return ("Polígono Inválido",
+                    "Os pontos são colineares (estão todos na mesma linha).\n"
+                    "Um polígono válido precisa de pontos que formem uma área.")
+        return None
+
     def _show_alert(self, title: str, message: str):
         """Mostra um alerta ao usuário"""
-        msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Warning)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(message)
-        msg_box.setStandardButtons(QMessageBox.Ok)
-        msg_box.exec_()
+        self._alert_box.setWindowTitle(title)
+        self._alert_box.setText(message)
+        self._alert_box.exec_()
     
     def close_polygon(self):
         """Fecha o polígono com validações"""
-        # Verificar se há menos de 3 pontos
-        if len(self.points) < 3:
-            self._show_alert(
-                "Polígono Inválido",
-                "Um polígono precisa de pelo menos 3 pontos.\n"
-                "Adicione mais pontos antes de fechar o polígono."
-            )
-            return
-        
-        # Verificar se os pontos são colineares
-        if self._are_points_collinear(self.points):
-            self._show_alert(
-                "Polígono Inválido",
-                "Os pontos são colineares (estão todos na mesma linha).\n"
-                "Um polígono válido precisa de pontos que formem uma área."
-            )
+        error = self._validate_polygon()
+        if error:
+            self._show_alert(*error)
             return
         
         self.is_closed = True
         # Notificar mudança ao fechar polígono
         if self.extruded_object and self.on_polygon_changed:
-            self.on_polygon_changed()
+            self._polygon_changed_timer.start()
         self.update()
     
     def update_extruded_object(self, depth: Optional[float] = None):
         """Atualiza o objeto 3D extrudado quando o polígono muda"""
-        # Verificar se há menos de 3 pontos
-        if len(self.points) < 3:
-            return None
-        
-        # Verificar se o polígono está fechado
-        if not self.is_closed:
-            return None
-        
-        # Verificar se os pontos são colineares
-        if self._are_points_collinear(self.points):
-            # Não mostrar alerta aqui, pois pode ser chamado automaticamente
-            # O alerta já foi mostrado ao tentar fechar o polígono
+        # Não mostrar alerta aqui, pois pode ser chamado automaticamente
+        # O alerta já foi mostrado ao tentar fechar o polígono
+        if self._validate_polygon(require_closed=True):
             return None
         try:
             if depth is None:
                 depth = self.extrusion_depth if hasattr(self, 'extrusion_depth') else 100.0
             else:
                 self.extrusion_depth = depth
-                
-            obj_3d = geo3d.extrude_polygon_2d(self.points, depth)
             
-            # Preservar transformações do objeto anterior se existir
-            if self.extruded_object:
-                old_transform = self.extruded_object.transform
-                obj_3d.transform = old_transform
-                obj_3d._update_vertices()
+            # Nada mudou desde a última extrusão: reaproveitar o objeto atual
+            cache = self._extrude_cache
+            if (cache is not None and cache[0] == self._points_version and cache[1] == depth
+                    and self.extruded_object is not None and cache[2]() is self.extruded_object):
+                return self.extruded_object
+            
+            # Reescrever a malha no objeto já extrudado (mantém transformação, cor e
+            # o lugar na cena); só cria um objeto novo na primeira extrusão
+            obj_3d = geo3d.extrude_polygon_2d(self.points, depth, target=self.extruded_object)
             
             self.extruded_object = obj_3d
+            self._extrude_cache = (self._points_version, depth, weakref.ref(obj_3d))
             return obj_3d
         except Exception:
             return None
 
     def fill_polygon(self):
         """Preenche o polígono usando scanline com validações"""
-        # Verificar se há menos de 3 pontos
-        if len(self.points) < 3:
-            self._show_alert(
-                "Polígono Inválido",
-                "Um polígono precisa de pelo menos 3 pontos.\n"
-                "Adicione mais pontos antes de preencher."
-            )
-            return
-        
-        # Verificar se o polígono está fechado
-        if not self.is_closed:
-            self._show_alert(
-                "Polígono Não Fechado",
-                "O polígono precisa estar fechado antes de preencher.\n"
-                "Clique com o botão direito ou use o botão 'Close Polygon' para fechar."
-            )
-            return
-        
-        # Verificar se os pontos são colineares
-        if self._are_points_collinear(self.points):
-            self._show_alert(
-                "Polígono Inválido",
-                "Os pontos são colineares (estão todos na mesma linha).\n"
-                "Um polígono válido precisa de pontos que formem uma área."
-            )
+        error = self._validate_polygon(require_closed=True, action="preencher")
+        if error:
+            self._show_alert(*error)
             return
         
-        spans = build_edge_table_and_fill(self.points)
+        if self._n == 3:
+            spans = fill_triangle(self.points)
+        else:
+            # Coordenadas de tela cabem em int16 (metade da memória); senão ficam int32
+            spans = build_edge_table_and_fill(self.points, dtype=np.int16)
         self.filled_spans = spans
+        self._fill_pixmap = None
         self.update()
 
+    def resizeEvent(self, event):
+        """Descarta o preenchimento em cache (tamanho do pixmap mudou)"""
+        self._fill_pixmap = None
+        super().resizeEvent(event)
+
+    def _render_fill_pixmap(self) -> QPixmap:
+        """Rasteriza os spans preenchidos uma única vez em um QPixmap"""
+        w, h = self.width(), self.height()
+        spans = self.filled_spans
+        # Recortar spans à área do widget
+        ys = spans[:, 0]
+        x0s = np.maximum(spans[:, 1], 0)
+        x1s = np.minimum(spans[:, 2], w - 1)
+        keep = (ys >= 0) & (ys < h) & (x0s <= x1s)
+        ys, x0s, x1s = ys[keep], x0s[keep], x1s[keep]
+        
+        # Máscara por diferenças: +1 no início de cada span, -1 após o fim
+        diff = np.zeros((h, w + 1), dtype=np.int32)
+        np.add.at(diff, (ys, x0s), 1)
+        np.add.at(diff, (ys, x1s + 1), -1)
+        mask = np.cumsum(diff[:, :w], axis=1) > 0
+        
+        buf = np.zeros((h, w), dtype=np.uint32)
+        buf[mask] = self.fill_color.rgba()
+        image = QImage(buf.data, w, h, 4 * w, QImage.Format_ARGB32)
+        return QPixmap.fromImage(image)
+
+    def _polygon(self) -> QPolygon:
+        """QPolygon dos vértices, reconstruído apenas quando os pontos mudam"""
+        if self._qpoly_version != self._points_version:
+            self._qpoly = QPolygon(self.points.ravel().tolist())
+            self._qpoly_version = self._points_version
+        return self._qpoly
+
+    def _path(self) -> QPainterPath:
+        """Contorno do polígono como QPainterPath, reconstruído só quando necessário"""
+        if self._poly_path is None or self._poly_path_version != self._points_version:
+            path = QPainterPath()
+            if self._n:
+                pts = self.points.tolist()
+                path.moveTo(*pts[0])
+                for x, y in pts[1:]:
+                    path.lineTo(x, y)
+                if self._is_closed:
+                    path.closeSubpath()
+            self._poly_path = path
+            self._poly_path_version = self._points_version
+        return self._poly_path
+
     def paintEvent(self, event):
         """Renderiza o canvas"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Desenhar preenchimento primeiro se existir
-        if self.filled_spans:
-            painter.save()
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(self.fill_color)
-            color_pen = QPen(self.fill_color)
-            color_pen.setWidth(1)
-            painter.setPen(color_pen)
-            for (y, x0, x1) in self.filled_spans:
-                painter.drawLine(x0, y, x1, y)
-            painter.restore()
+        if self.filled_spans is not None and len(self.filled_spans):
+            if self._fill_pixmap is None:
+                self._fill_pixmap = self._render_fill_pixmap()
+            painter.drawPixmap(0, 0, self._fill_pixmap)
 
         # Desenhar arestas do polígono
-        pen = QPen(self.stroke_color)
-        pen.setWidth(self.stroke_width)
-        painter.setPen(pen)
-
-        for i in range(1, len(self.points)):
-            x0, y0 = self.points[i - 1]
-            x1, y1 = self.points[i]
-            painter.drawLine(x0, y0, x1, y1)
+        painter.setPen(self._stroke_pen)
 
-        # Desenhar aresta de fechamento se fechado
-        if self.is_closed and len(self.points) >= 2:
-            x0, y0 = self.points[-1]
-            x1, y1 = self.points[0]
-            painter.drawLine(x0, y0, x1, y1)
+        # Caminho fechado já inclui a aresta de fechamento
+        painter.drawPath(self._path())
 
-        # Desenhar vértices
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(self.stroke_color)
-        r = max(2, self.stroke_width)
-        for (x, y) in self.points:
-            painter.drawEllipse(QPoint(x, y), r, r)
+        # Desenhar vértices (uma única chamada, ver _update_stroke_pens)
+        painter.setPen(self._dot_pen)
+        painter.drawPoints(self._polygon())
 
@@ -1,8 +1,10 @@
 """
 Módulo para geometria 3D: pontos, transformações e projeções
 """
+import functools
 import math
-from typing import List, Tuple, Optional
+from itertools import chain
+from typing import List, Tuple, Optional, Union
 import numpy as np
 
 Point3D = Tuple[float, float, float]
@@ -11,6 +13,8 @@ Point2D = Tuple[float, float]
 
 class Vector3D:
     """Classe para representar um vetor 3D"""
+    __slots__ = ('x', 'y', 'z')
+    
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         self.x = float(x)
         self.y = float(y)
@@ -39,12 +43,14 @@ class Vector3D:
         )
     
     def length(self):
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        x, y, z = self.x, self.y, self.z
+        return math.sqrt(x * x + y * y + z * z)
     
     def normalize(self):
         l = self.length()
         if l > 0:
-            return Vector3D(self.x / l, self.y / l, self.z / l)
+            inv = 1.0 / l
+            return Vector3D(self.x * inv, self.y * inv, self.z * inv)
         return Vector3D(0, 0, 0)
     
     def to_tuple(self) -> Point3D:
@@ -53,13 +59,79 @@ class Vector3D:
     @staticmethod
     def from_tuple(p: Point3D):
         return Vector3D(p[0], p[1], p[2])
+    
+    @staticmethod
+    def from_array(a: np.ndarray):
+        """Cria o vetor a partir de um array (3,) sem passar por tupla intermediária"""
+        x, y, z = a.tolist()
+        return Vector3D(x, y, z)
+
+
+# Tipos de transformação, do mais simples ao mais geral; a composição de duas
+# transformações tem o tipo mais geral entre os dois (max)
+TRANSFORM_IDENTITY = 0
+TRANSFORM_TRANSLATION = 1  # Bloco 3x3 = I, só a coluna de translação
+TRANSFORM_RIGID = 2        # Rotação + translação
+TRANSFORM_AFFINE = 3       # Qualquer matriz afim (escala, cisalhamento, ...)
+
+
+# Ângulos das rotações por eixo são quantizados em 1e-6 rad para reaproveitar
+# as matrizes já calculadas (animações repetem os mesmos ângulos)
+_ANGLE_QUANTA_PER_RAD = 1e6
+# Par de linhas/colunas (i, j) afetado pela rotação em torno de cada eixo
+_ROTATION_PLANES = ((1, 2), (2, 0), (0, 1))
+
+
+@functools.lru_cache(maxsize=4096)
+def _rotation_matrix(axis: int, angle_quantum: int) -> np.ndarray:
+    """Matriz 4x4 (float32, somente leitura) da rotação em torno de `axis` (0=X, 1=Y, 2=Z)"""
+    angle_rad = angle_quantum / _ANGLE_QUANTA_PER_RAD
+    cos_a = math.cos(angle_rad)
+    sin_a = math.sin(angle_rad)
+    i, j = _ROTATION_PLANES[axis]
+    m = np.eye(4, dtype=np.float32)
+    m[i, i] = cos_a
+    m[i, j] = -sin_a
+    m[j, i] = sin_a
+    m[j, j] = cos_a
+    m.flags.writeable = False
+    return m
 
 
 class Transform3D:
-    """Classe para matrizes de transformação 3D"""
-    def __init__(self):
+    """Classe para matrizes de transformação 3D
+    
+    A matriz é float32 por padrão: para visualização a precisão (~7 dígitos
+    significativos, erro relativo ~1e-7 por operação) é de sobra, e metade dos
+    bytes por elemento reduz a banda de memória nas transformações em lote.
+    Composições muito longas acumulam erro mais rápido que em float64; passe
+    dtype=np.float64 quando isso importar.
+    
+    `kind` diz quanto da matriz precisa ser aplicado (identidade, translação,
+    rígida ou afim) e é usado nos atalhos de apply_to_points e do OpenGLViewer.
+    Atribuir `matrix` volta `kind` para TRANSFORM_AFFINE, que é sempre correto;
+    os construtores internos definem o tipo mais estreito depois da atribuição.
+    Escritas elemento a elemento (`t.matrix[0, 3] = x`) não passam pelo setter:
+    quem altera a matriz no lugar deve ajustar `kind` também.
+    """
+    def __init__(self, dtype=np.float32):
         # Matriz 4x4 de transformação (homogênea)
-        self.matrix = np.eye(4, dtype=float)
+        self.matrix = np.eye(4, dtype=dtype)
+        self.kind = TRANSFORM_IDENTITY
+        # Buffers reaproveitados por apply_to_point (ponto homogêneo de entrada/saída)
+        self._tmp = np.empty(4, dtype=dtype)
+        self._out = np.empty(4, dtype=dtype)
+    
+    @property
+    def matrix(self) -> np.ndarray:
+        """Matriz 4x4 homogênea"""
+        return self._matrix
+    
+    @matrix.setter
+    def matrix(self, value: np.ndarray):
+        # Matriz arbitrária: não dá para presumir nada mais estreito que afim
+        self._matrix = value
+        self.kind = TRANSFORM_AFFINE
     
     @staticmethod
     def translation(tx: float, ty: float, tz: float):
@@ -68,6 +140,7 @@ class Transform3D:
         T.matrix[0, 3] = tx
         T.matrix[1, 3] = ty
         T.matrix[2, 3] = tz
+        T.kind = TRANSFORM_TRANSLATION
         return T
     
     @staticmethod
@@ -77,75 +150,129 @@ class Transform3D:
         S.matrix[0, 0] = sx
         S.matrix[1, 1] = sy
         S.matrix[2, 2] = sz
+        S.kind = TRANSFORM_AFFINE
         return S
     
     @staticmethod
-    def rotation_x(angle_rad: float):
-        """Rotação em torno do eixo X"""
+    def _rotation(axis: int, angle_rad: float):
+        """Rotação em torno de um eixo, com a matriz (somente leitura) vinda do cache"""
         R = Transform3D()
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        R.matrix[1, 1] = cos_a
-        R.matrix[1, 2] = -sin_a
-        R.matrix[2, 1] = sin_a
-        R.matrix[2, 2] = cos_a
+        R.matrix = _rotation_matrix(axis, round(angle_rad * _ANGLE_QUANTA_PER_RAD))
+        R.kind = TRANSFORM_RIGID
         return R
     
+    @staticmethod
+    def rotation_x(angle_rad: float):
+        """Rotação em torno do eixo X"""
+        return Transform3D._rotation(0, angle_rad)
+    
     @staticmethod
     def rotation_y(angle_rad: float):
         """Rotação em torno do eixo Y"""
-        R = Transform3D()
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        R.matrix[0, 0] = cos_a
-        R.matrix[0, 2] = sin_a
-        R.matrix[2, 0] = -sin_a
-        R.matrix[2, 2] = cos_a
-        return R
+        return Transform3D._rotation(1, angle_rad)
     
     @staticmethod
     def rotation_z(angle_rad: float):
         """Rotação em torno do eixo Z"""
-        R = Transform3D()
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        R.matrix[0, 0] = cos_a
-        R.matrix[0, 1] = -sin_a
-        R.matrix[1, 0] = sin_a
-        R.matrix[1, 1] = cos_a
-        return R
+        return Transform3D._rotation(2, angle_rad)
     
     @staticmethod
     def rotation_euler(rx: float, ry: float, rz: float):
-        """Rotação usando ângulos de Euler (em radianos)"""
-        return (Transform3D.rotation_x(rx) * 
-                Transform3D.rotation_y(ry) * 
-                Transform3D.rotation_z(rz))
+        """Rotação usando ângulos de Euler (em radianos)
+        
+        Equivale a rotation_x(rx) * rotation_y(ry) * rotation_z(rz), escrita
+        diretamente na forma fechada (sem as três matrizes intermediárias).
+        """
+        cx, sx = math.cos(rx), math.sin(rx)
+        cy, sy = math.cos(ry), math.sin(ry)
+        cz, sz = math.cos(rz), math.sin(rz)
+        R = Transform3D()
+        M = R.matrix
+        M[0, 0] = cy * cz
+        M[0, 1] = -cy * sz
+        M[0, 2] = sy
+        M[1, 0] = cx * sz + sx * sy * cz
+        M[1, 1] = cx * cz - sx * sy * sz
+        M[1, 2] = -sx * cy
+        M[2, 0] = sx * sz - cx * sy * cz
+        M[2, 1] = sx * cz + cx * sy * sz
+        M[2, 2] = cx * cy
+        R.kind = TRANSFORM_RIGID
+        return R
+    
+    def translated(self, tx: float, ty: float, tz: float):
+        """Equivale a translation(tx, ty, tz) * self, sem o produto de matrizes
+        
+        Como a linha w de uma transformação afim é [0, 0, 0, 1], transladar à
+        esquerda só soma (tx, ty, tz) à coluna de translação.
+        """
+        result = Transform3D(self.matrix.dtype)
+        result.matrix = self.matrix.copy()
+        result.matrix[0, 3] += tx
+        result.matrix[1, 3] += ty
+        result.matrix[2, 3] += tz
+        result.kind = max(self.kind, TRANSFORM_TRANSLATION)
+        return result
     
     def __mul__(self, other):
         """Composição de transformações"""
         if isinstance(other, Transform3D):
             result = Transform3D()
             result.matrix = np.dot(self.matrix, other.matrix)
+            result.kind = max(self.kind, other.kind)
             return result
         elif isinstance(other, Vector3D):
-            # Aplicar transformação a um ponto
-            p = np.array([other.x, other.y, other.z, 1.0])
-            transformed = np.dot(self.matrix, p)
+            # Aplicar transformação a um ponto (afim: a linha w é sempre [0, 0, 0, 1])
+            m = self.matrix
+            transformed = np.dot(m[:3, :3], (other.x, other.y, other.z)) + m[:3, 3]
             return Vector3D(transformed[0], transformed[1], transformed[2])
         return None
     
+    def apply_to_points(self, points: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Aplica a transformação a um array (N, 3) de pontos: p' = R·p + t
+        
+        A identidade devolve o próprio array (sem cópia, `out` não é usado) e a
+        translação pura dispensa o produto matricial. Com `out`, o resultado é
+        escrito nesse buffer (N, 3) em vez de alocar um novo.
+        """
+        if self.kind == TRANSFORM_IDENTITY:
+            return points
+        m = self.matrix
+        if self.kind == TRANSFORM_TRANSLATION:
+            return np.add(points, m[:3, 3], out=out)
+        out = np.matmul(points, m[:3, :3].T, out=out)
+        out += m[:3, 3]
+        return out
+    
     def apply_to_point(self, point: Point3D) -> Point3D:
         """Aplica transformação a um ponto"""
-        v = Vector3D.from_tuple(point)
-        result = self * v
-        return result.to_tuple()
+        tmp = self._tmp
+        if tmp.dtype != self.matrix.dtype:
+            # A matriz foi substituída por outra de outro tipo (ex.: composição float64)
+            tmp = self._tmp = np.empty(4, dtype=self.matrix.dtype)
+            self._out = np.empty(4, dtype=self.matrix.dtype)
+        tmp[:3] = point
+        tmp[3] = 1
+        out = np.dot(self.matrix, tmp, out=self._out)
+        return (float(out[0]), float(out[1]), float(out[2]))
 
 
 class Projection:
     """Classe base para projeções 3D -> 2D"""
     def project(self, point: Point3D) -> Point2D:
         raise NotImplementedError
+    
+    def project_batch(self, points: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Projeta um array (N, 3) de pontos de uma vez, retornando (N, 2)
+        
+        Com `out` (array (N, 2) float32), o resultado é escrito nesse buffer.
+        """
+        raise NotImplementedError
+    
+    def project_transformed(self, points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Transforma (matriz afim 4x4) e projeta um array (N, 3) de pontos em uma passada,
+        sem materializar os vértices transformados do objeto"""
+        return self.project_batch(points @ matrix[:3, :3].T + matrix[:3, 3])
 
 
 class OrthographicProjection(Projection):
@@ -160,6 +287,22 @@ class OrthographicProjection(Projection):
         x = point[0] * self.scale + self.center_x
         y = point[1] * self.scale + self.center_y
         return (x, y)
+    
+    def project_batch(self, points: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Projeção ortográfica de um array (N, 3) de pontos"""
+        pts = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        center = np.array((self.center_x, self.center_y), dtype=np.float32)
+        out = np.multiply(pts[:, :2], self.scale, out=out)
+        out += center
+        return out
+    
+    def project_transformed(self, points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Escala e centro embutidos nas linhas X/Y da matriz: um único produto (N, 3) x (3, 2)"""
+        pts = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        m = np.asarray(matrix, dtype=np.float32)
+        linear = m[:2, :3] * np.float32(self.scale)
+        offset = m[:2, 3] * np.float32(self.scale) + np.array((self.center_x, self.center_y), dtype=np.float32)
+        return pts @ linear.T + offset
 
 
 class PerspectiveProjection(Projection):
@@ -181,46 +324,154 @@ class PerspectiveProjection(Projection):
         """
         x, y, z = point
         
-        # Evitar divisão por zero ou valores muito próximos
-        if z + self.distance <= 0:
-            z = -self.distance + 0.1
+        # Evitar divisão por zero ou valores muito próximos (clamp sem desvio)
+        z_factor = self.distance / max(z + self.distance, 0.1)
         
         # Fórmula de projeção perspectiva
-        z_factor = self.distance / (z + self.distance)
         x_proj = x * z_factor * self.scale + self.center_x
         y_proj = y * z_factor * self.scale + self.center_y
         
         return (x_proj, y_proj)
+    
+    def project_batch(self, points: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Projeção perspectiva de um array (N, 3) de pontos (mesmas fórmulas de project)"""
+        pts = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        # Evitar divisão por zero ou valores muito próximos (clamp sem desvio)
+        z_factor = self.distance / np.maximum(pts[:, 2] + self.distance, np.float32(0.1))
+        center = np.array((self.center_x, self.center_y), dtype=np.float32)
+        out = np.multiply(pts[:, :2], z_factor[:, None], out=out)
+        out *= self.scale
+        out += center
+        return out
+    
+    def project_transformed(self, points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Transformação e projeção perspectiva fundidas: cada coordenada é uma linha da
+        matriz 3x4 (escala já embutida em X/Y) aplicada aos pontos, sem o array (N, 3) intermediário"""
+        pts = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        m = np.asarray(matrix, dtype=np.float32)
+        sc = np.float32(self.scale)
+        d = np.float32(self.distance)
+        x = pts @ (m[0, :3] * sc) + m[0, 3] * sc
+        y = pts @ (m[1, :3] * sc) + m[1, 3] * sc
+        z_factor = d / np.maximum(pts @ m[2, :3] + (m[2, 3] + d), np.float32(0.1))
+        out = np.empty((len(pts), 2), dtype=np.float32)
+        np.multiply(x, z_factor, out=out[:, 0])
+        np.multiply(y, z_factor, out=out[:, 1])
+        out += np.array((self.center_x, self.center_y), dtype=np.float32)
+        return out
 
 
 class Object3D:
     """Classe base para objetos 3D"""
-    def __init__(self, vertices: List[Point3D], edges: List[Tuple[int, int]], 
-                 faces: Optional[List[List[int]]] = None, color: Optional[Tuple[float, float, float, float]] = None):
-        self.vertices = vertices.copy()  # Cópia dos vértices originais
-        self.current_vertices = vertices.copy()  # Vértices após transformações
-        self.edges = edges  # Lista de arestas: [(i1, i2), ...]
-        self.faces = faces if faces else []  # Lista de faces: [[i1, i2, i3, ...], ...]
+    def __init__(self, vertices: Union[List[Point3D], np.ndarray], edges: Union[List[Tuple[int, int]], np.ndarray], 
+                 faces: Optional[Union[List[List[int]], np.ndarray]] = None,
+                 color: Optional[Tuple[float, float, float, float]] = None,
+                 dtype=np.float32):
+        # Cópia dos vértices originais como array contíguo (N, 3); float32 por padrão
+        # (veja Transform3D), dtype=np.float64 para quem precisar de precisão dupla
+        self.vertices = np.array(vertices, dtype=dtype).reshape(-1, 3)
+        self._current_vertices = self.vertices.copy()  # Vértices após transformações (array (N, 3))
+        self._current_buffer = self._current_vertices  # Reaproveitado a cada recálculo
+        self._vertices_dirty = False  # current_vertices desatualizado em relação a transform
+        self.edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)  # Arestas: array (E, 2) de (i1, i2)
+        if isinstance(faces, np.ndarray):
+            faces = faces.tolist()
+        # Faces poligonais (triângulos e quads misturados): [[i1, i2, i3, ...], ...]
+        self.faces = faces if faces else []
         self.transform = Transform3D()
+        # Incrementado sempre que vertices/faces mudam (caches de normais dependem disso)
+        self.geom_version = 0
         # Cor do objeto (R, G, B, Alpha) - valores de 0.0 a 1.0
         self.color = color if color is not None else (0.5, 0.6, 0.8, 1.0)  # Cor padrão azul claro
+        # Faces trianguladas em leque: array (M, 3) int32
+        self.triangles = np.empty((0, 3), dtype=np.int32)
+        self.triangle_faces = np.empty(0, dtype=np.int32)  # Índice da face de origem de cada triângulo
+        if self.faces:
+            self._triangulate()
+    
+    def _triangulate(self):
+        """Triangula as faces em leque (na criação e quando a geometria muda)
+        
+        Triângulos com índices fora do intervalo de vértices são descartados aqui, de modo que
+        quem desenha a partir de `triangles` não precisa repetir a verificação.
+        """
+        lengths = np.fromiter(map(len, self.faces), dtype=np.int64, count=len(self.faces))
+        flat = np.fromiter(chain.from_iterable(self.faces), dtype=np.int64, count=int(lengths.sum()))
+        # Face com k vértices gera k - 2 triângulos (face[0], face[i], face[i + 1]), i = 1..k-2
+        tri_counts = np.maximum(lengths - 2, 0)
+        triangle_faces = np.repeat(np.arange(len(lengths)), tri_counts)
+        first = (np.cumsum(lengths) - lengths)[triangle_faces]
+        local = np.arange(len(triangle_faces)) - np.repeat(np.cumsum(tri_counts) - tri_counts, tri_counts)
+        triangles = np.stack([flat[first], flat[first + local + 1], flat[first + local + 2]], axis=1)
+        valid = (triangles.min(axis=1) >= 0) & (triangles.max(axis=1) < len(self.vertices))
+        self.triangles = triangles[valid].astype(np.int32)
+        self.triangle_faces = triangle_faces[valid].astype(np.int32)
+    
+    def mark_geometry_changed(self, topology_changed: bool = True):
+        """Sinaliza que vertices/faces foram alterados no lugar (invalida caches de normais
+        e refaz a triangulação)
+        
+        Com topology_changed=False (só posições mudaram, mesmas faces e mesmo número de
+        vértices) a triangulação atual é mantida.
+        """
+        self.geom_version += 1
+        if topology_changed:
+            if self.faces:
+                self._triangulate()
+            else:
+                self.triangles = np.empty((0, 3), dtype=np.int32)
+                self.triangle_faces = np.empty(0, dtype=np.int32)
+            self._current_buffer = np.empty_like(self.vertices)
+        self._update_vertices()
+    
+    def set_geometry(self, vertices: np.ndarray, edges: Optional[np.ndarray] = None,
+                     faces: Optional[List[List[int]]] = None):
+        """Substitui a malha no próprio objeto (mantém transformação, cor e identidade)
+        
+        Sem edges/faces só as posições mudam: vertices deve ter o mesmo número de
+        vértices e a triangulação é reaproveitada.
+        """
+        if edges is None and faces is None:
+            self.vertices[...] = vertices
+            self.mark_geometry_changed(topology_changed=False)
+            return
+        self.vertices = np.array(vertices, dtype=self.vertices.dtype).reshape(-1, 3)
+        if edges is not None:
+            self.edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        if faces is not None:
+            self.faces = faces
+        self.mark_geometry_changed()
     
     def apply_transform(self, transform: Transform3D):
         """Aplica uma transformação ao objeto"""
         self.transform = transform * self.transform
         self._update_vertices()
     
+    def set_transform(self, transform: Transform3D):
+        """Substitui a transformação do objeto (sem compor com a atual)"""
+        self.transform = transform
+        self._update_vertices()
+    
     def _update_vertices(self):
-        """Atualiza os vértices após transformação"""
-        self.current_vertices = [self.transform.apply_to_point(v) for v in self.vertices]
+        """Marca os vértices transformados para recálculo; feito uma vez, no próximo acesso
+        (várias mudanças de transformação seguidas custam um único produto)"""
+        self._vertices_dirty = True
+    
+    @property
+    def current_vertices(self) -> np.ndarray:
+        """Vértices após transformações (array (N, 3)), recalculados só se a transformação mudou"""
+        if self._vertices_dirty:
+            self._current_vertices = self.transform.apply_to_points(self.vertices, out=self._current_buffer)
+            self._vertices_dirty = False
+        return self._current_vertices
     
     def reset_transform(self):
         """Reseta as transformações"""
         self.transform = Transform3D()
         self._update_vertices()
     
-    def get_transformed_vertices(self) -> List[Point3D]:
-        """Retorna os vértices transformados"""
+    def get_transformed_vertices(self) -> np.ndarray:
+        """Retorna os vértices transformados (array (N, 3); use .tolist() se precisar de listas)"""
         return self.current_vertices
 
 
@@ -273,69 +524,57 @@ def create_pyramid(size: float = 100.0, height: float = 150.0) -> Object3D:
     return Object3D(vertices, edges, faces)
 
 
-def extrude_polygon_2d(points_2d: List[Tuple[int, int]], depth: float = 1.0) -> Object3D:
+def extrude_polygon_2d(points_2d: List[Tuple[int, int]], depth: float = 1.0,
+                       target: Optional[Object3D] = None) -> Object3D:
     """
     Extrusão de um polígono 2D para criar um objeto 3D
     
     Args:
         points_2d: Lista de pontos 2D (x, y) em coordenadas de tela
         depth: Profundidade da extrusão (ao longo do eixo Z)
+        target: Objeto extrudado anteriormente; se dado, a malha é reescrita nele
+            (mesmo número de pontos: só as posições mudam)
     
     Returns:
-        Object3D criado pela extrusão
+        Object3D criado pela extrusão (ou target, atualizado)
     """
     if len(points_2d) < 3:
         raise ValueError("Polígono precisa de pelo menos 3 pontos")
     
-    # Calcular centro do polígono para centralizar na origem
-    min_x = min(p[0] for p in points_2d)
-    max_x = max(p[0] for p in points_2d)
-    min_y = min(p[1] for p in points_2d)
-    max_y = max(p[1] for p in points_2d)
-    center_x = (min_x + max_x) / 2.0
-    center_y = (min_y + max_y) / 2.0
-    
-    n = len(points_2d)
-    vertices = []
-    edges = []
-    faces = []
+    # Calcular centro do polígono (centro da caixa envolvente) para centralizar na origem
+    pts = np.asarray(points_2d, dtype=np.float64).reshape(-1, 2)
+    center = (pts.min(axis=0) + pts.max(axis=0)) / 2.0
+    n = len(pts)
     
     # Criar vértices: face inferior (z=-depth/2) e face superior (z=depth/2)
     # Centralizar e inverter Y (coordenadas de tela para 3D: Y cresce para cima)
-    for x, y in points_2d:
-        # Centralizar e converter coordenadas
-        x3d = float(x - center_x)
-        y3d = float(center_y - y)  # Inverter Y
-        vertices.append((x3d, y3d, -depth / 2.0))  # Face inferior
-    
-    for x, y in points_2d:
-        x3d = float(x - center_x)
-        y3d = float(center_y - y)  # Inverter Y
-        vertices.append((x3d, y3d, depth / 2.0))  # Face superior
+    xy = pts - center
+    xy[:, 1] = -xy[:, 1]
+    bottom = np.column_stack([xy, np.full(n, -depth / 2.0)])
+    top = np.column_stack([xy, np.full(n, depth / 2.0)])
+    vertices = np.vstack([bottom, top])
     
-    # Arestas da face inferior
-    for i in range(n):
-        edges.append((i, (i + 1) % n))
+    if target is not None and len(target.vertices) == 2 * n:
+        # Mesma topologia (mesmo número de pontos): atualizar só as posições
+        target.set_geometry(vertices)
+        return target
     
-    # Arestas da face superior
-    for i in range(n):
-        edges.append((n + i, n + (i + 1) % n))
+    i = np.arange(n)
+    next_i = (i + 1) % n
+    ring = np.stack([i, next_i], axis=1)
     
-    # Arestas conectando faces (extrusão)
-    for i in range(n):
-        edges.append((i, n + i))
+    # Arestas da face inferior, da face superior e conectando as faces (extrusão)
+    edges = np.concatenate([ring, ring + n, np.stack([i, n + i], axis=1)])
     
-    # Face inferior
-    faces.append(list(range(n)))
-    
-    # Face superior (ordem reversa para normal correta)
-    faces.append([n + i for i in range(n - 1, -1, -1)])
+    # Face inferior e superior (ordem reversa para normal correta)
+    faces = [list(range(n)), list(range(2 * n - 1, n - 1, -1))]
     
     # Faces laterais
-    for i in range(n):
-        next_i = (i + 1) % n
-        faces.append([i, next_i, n + next_i, n + i])
+    faces += np.stack([i, next_i, n + next_i, n + i], axis=1).tolist()
     
+    if target is not None:
+        target.set_geometry(vertices, edges, faces)
+        return target
     return Object3D(vertices, edges, faces)
 
 
@@ -351,52 +590,50 @@ def create_cylinder(radius: float = 50.0, height: float = 100.0, segments: int =
     Returns:
         Object3D criado
     """
-    vertices = []
-    edges = []
-    faces = []
-    
-    # Gerar vértices da base inferior (z = -height/2)
-    for i in range(segments):
-        angle = 2.0 * math.pi * i / segments
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        z = -height / 2.0
-        vertices.append((x, y, z))
-    
-    # Gerar vértices da base superior (z = height/2)
-    for i in range(segments):
-        angle = 2.0 * math.pi * i / segments
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        z = height / 2.0
-        vertices.append((x, y, z))
-    
-    # Arestas da base inferior
-    for i in range(segments):
-        edges.append((i, (i + 1) % segments))
-    
-    # Arestas da base superior
-    for i in range(segments):
-        edges.append((segments + i, segments + (i + 1) % segments))
-    
-    # Arestas verticais (lateral do cilindro)
-    for i in range(segments):
-        edges.append((i, segments + i))
-    
-    # Face inferior (base)
-    faces.append(list(range(segments)))
-    
-    # Face superior (base) - ordem reversa
-    faces.append([segments + i for i in range(segments - 1, -1, -1)])
+    # Anel da base inferior (z = -height/2); o superior é o mesmo anel deslocado
+    cos_a, sin_a = _circle_table(segments)
+    bottom = np.column_stack([radius * cos_a, radius * sin_a, np.full(segments, -height / 2.0)])
+    top = bottom + (0.0, 0.0, height)
+    vertices = np.vstack([bottom, top])
+    
+    i = np.arange(segments)
+    next_i = (i + 1) % segments
+    ring = np.stack([i, next_i], axis=1)
+    
+    # Arestas da base inferior, da base superior e verticais (lateral do cilindro)
+    edges = np.concatenate([ring, ring + segments, np.stack([i, segments + i], axis=1)]).tolist()
+    
+    # Face inferior (base) e superior (ordem reversa)
+    faces = [list(range(segments)), list(range(2 * segments - 1, segments - 1, -1))]
     
     # Faces laterais (retângulos)
-    for i in range(segments):
-        next_i = (i + 1) % segments
-        faces.append([i, next_i, segments + next_i, segments + i])
+    faces += np.stack([i, next_i, segments + next_i, segments + i], axis=1).tolist()
     
     return Object3D(vertices, edges, faces)
 
 
+def _circle_table(segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Tabelas de cos/sin para os ângulos 2π·j/segments, j = 0..segments-1"""
+    angles = 2.0 * np.pi * np.arange(segments) / segments
+    return np.cos(angles), np.sin(angles)
+
+
+def _hemisphere_vertices(radius: float, segments: int) -> np.ndarray:
+    """Vértices da semiesfera: polo norte seguido de `segments` camadas circulares"""
+    cos_phi, sin_phi = _circle_table(segments)
+    # Ângulo vertical de cada camada: de π/2/segments (topo) até π/2 (base)
+    theta = np.pi / 2.0 * np.arange(1, segments + 1) / segments
+    layer_radius = radius * np.sin(theta)
+    
+    vertices = np.empty((1 + segments * segments, 3), dtype=np.float64)
+    vertices[0] = (0.0, 0.0, radius)  # Vértice do topo (polo norte)
+    rings = vertices[1:].reshape(segments, segments, 3)
+    rings[:, :, 0] = np.outer(layer_radius, cos_phi)
+    rings[:, :, 1] = np.outer(layer_radius, sin_phi)
+    rings[:, :, 2] = (radius * np.cos(theta))[:, None]
+    return vertices
+
+
 def create_hemisphere(radius: float = 50.0, segments: int = 16) -> Object3D:
     """
     Cria uma semiesfera
@@ -408,67 +645,34 @@ def create_hemisphere(radius: float = 50.0, segments: int = 16) -> Object3D:
     Returns:
         Object3D criado
     """
-    vertices = []
-    edges = []
-    faces = []
-    
-    # Vértice do topo (polo norte)
-    top_idx = 0
-    vertices.append((0.0, 0.0, radius))
-    
-    # Gerar vértices em camadas circulares (do topo até a base)
+    vertices = _hemisphere_vertices(radius, segments)
     vertices_per_layer = segments
-    for layer in range(1, segments + 1):
-        # Ângulo vertical: de 0 (topo) até π/2 (base)
-        theta = math.pi / 2.0 * layer / segments
-        z = radius * math.cos(theta)
-        layer_radius = radius * math.sin(theta)
-        
-        # Vértices nesta camada circular
-        for i in range(vertices_per_layer):
-            # Ângulo horizontal na camada
-            phi = 2.0 * math.pi * i / vertices_per_layer
-            x = layer_radius * math.cos(phi)
-            y = layer_radius * math.sin(phi)
-            vertices.append((x, y, z))
-    
-    # Arestas: conectar vértice do topo à primeira camada
+    top_idx = 0
     first_layer_start = 1
-    for i in range(vertices_per_layer):
-        next_i = (i + 1) % vertices_per_layer
-        edges.append((top_idx, first_layer_start + i))
-        edges.append((first_layer_start + i, first_layer_start + next_i))
-    
-    # Arestas entre camadas
-    for layer in range(1, segments):
-        layer_start = 1 + (layer - 1) * vertices_per_layer
-        next_layer_start = 1 + layer * vertices_per_layer
-        
-        for i in range(vertices_per_layer):
-            next_i = (i + 1) % vertices_per_layer
-            # Arestas verticais
-            edges.append((layer_start + i, next_layer_start + i))
-            # Arestas horizontais
-            edges.append((next_layer_start + i, next_layer_start + next_i))
+    
+    i = np.arange(vertices_per_layer)
+    next_i = (i + 1) % vertices_per_layer
+    
+    # Arestas: conectar vértice do topo à primeira camada (raio e contorno alternados)
+    top = np.full(vertices_per_layer, top_idx)
+    top_edges = np.stack([np.stack([top, first_layer_start + i], axis=-1),
+                          np.stack([first_layer_start + i, first_layer_start + next_i], axis=-1)], axis=1)
+    
+    # Arestas entre camadas: grade (camada, i) com início de cada camada
+    layer_start = (1 + np.arange(segments - 1) * vertices_per_layer)[:, None]
+    next_layer_start = layer_start + vertices_per_layer
+    cur, cur_next = layer_start + i, layer_start + next_i
+    below, below_next = next_layer_start + i, next_layer_start + next_i
+    # Arestas verticais e horizontais alternadas
+    layer_edges = np.stack([np.stack([cur, below], axis=-1),
+                            np.stack([below, below_next], axis=-1)], axis=2)
+    edges = np.concatenate([top_edges.reshape(-1, 2), layer_edges.reshape(-1, 2)]).tolist()
     
     # Faces do topo (triângulos do topo para a primeira camada)
-    for i in range(vertices_per_layer):
-        next_i = (i + 1) % vertices_per_layer
-        faces.append([top_idx, first_layer_start + i, first_layer_start + next_i])
+    faces = np.stack([top, first_layer_start + i, first_layer_start + next_i], axis=-1).tolist()
     
     # Faces entre camadas (quadriláteros)
-    for layer in range(1, segments):
-        layer_start = 1 + (layer - 1) * vertices_per_layer
-        next_layer_start = 1 + layer * vertices_per_layer
-        
-        for i in range(vertices_per_layer):
-            next_i = (i + 1) % vertices_per_layer
-            faces.append([
-                layer_start + i,
-                layer_start + next_i,
-                next_layer_start + next_i,
-                next_layer_start + i
-            ])
+    faces += np.stack([cur, cur_next, below_next, below], axis=-1).reshape(-1, 4).tolist()
     
     # Face da base (círculo plano - última camada)
     base_start = 1 + (segments - 1) * vertices_per_layer
@@ -479,6 +683,19 @@ def create_hemisphere(radius: float = 50.0, segments: int = 16) -> Object3D:
     return Object3D(vertices, edges, faces)
 
 
+def _sphere_vertices(radius: float, segments: int, stacks: int) -> np.ndarray:
+    """Vértices da esfera: (stacks + 1) anéis de `segments` vértices, do polo +Y ao -Y"""
+    cos_phi, sin_phi = _circle_table(segments)
+    theta = np.pi * np.arange(stacks + 1) / stacks  # De 0 a π
+    ring_radius = radius * np.sin(theta)
+    
+    vertices = np.empty((stacks + 1, segments, 3), dtype=np.float64)
+    vertices[:, :, 0] = np.outer(ring_radius, cos_phi)
+    vertices[:, :, 1] = (radius * np.cos(theta))[:, None]
+    vertices[:, :, 2] = np.outer(ring_radius, sin_phi)
+    return vertices.reshape(-1, 3)
+
+
 def create_sphere(radius: float = 50.0, segments: int = 16, stacks: int = 16) -> Object3D:
     """
     Cria uma esfera completa
@@ -491,65 +708,53 @@ def create_sphere(radius: float = 50.0, segments: int = 16, stacks: int = 16) ->
     Returns:
         Object3D criado
     """
-    vertices = []
-    edges = []
-    faces = []
-    
-    # Gerar vértices
-    for i in range(stacks + 1):
-        theta = math.pi * i / stacks  # De 0 a π
-        sin_theta = math.sin(theta)
-        cos_theta = math.cos(theta)
-        y = radius * cos_theta
-        
-        for j in range(segments):
-            phi = 2.0 * math.pi * j / segments  # De 0 a 2π
-            sin_phi = math.sin(phi)
-            cos_phi = math.cos(phi)
-            
-            x = radius * sin_theta * cos_phi
-            z = radius * sin_theta * sin_phi
-            vertices.append((x, y, z))
-    
-    # Gerar arestas
-    for i in range(stacks):
-        for j in range(segments):
-            idx = i * segments + j
-            next_idx = i * segments + (j + 1) % segments
-            below_idx = (i + 1) * segments + j
-            below_next_idx = (i + 1) * segments + (j + 1) % segments
-            
-            # Arestas horizontais
-            edges.append((idx, next_idx))
-            if i < stacks - 1:
-                edges.append((below_idx, below_next_idx))
-            
-            # Arestas verticais
-            if i < stacks:
-                edges.append((idx, below_idx))
+    vertices = _sphere_vertices(radius, segments, stacks)
+    
+    # Índices em grade (anel i, segmento j)
+    ii, jj = np.meshgrid(np.arange(stacks), np.arange(segments), indexing='ij')
+    idx = ii * segments + jj
+    next_idx = ii * segments + (jj + 1) % segments
+    below_idx = idx + segments
+    below_next_idx = next_idx + segments
+    
+    # Gerar arestas: horizontal, horizontal do anel de baixo (exceto no último) e vertical
+    horizontal = np.stack([idx, next_idx], axis=-1)
+    horizontal_below = np.stack([below_idx, below_next_idx], axis=-1)
+    vertical = np.stack([idx, below_idx], axis=-1)
+    edges = np.concatenate([
+        np.stack([horizontal[:-1], horizontal_below[:-1], vertical[:-1]], axis=2).reshape(-1, 2),
+        np.stack([horizontal[-1], vertical[-1]], axis=1).reshape(-1, 2)
+    ]).tolist()
     
     # Gerar faces
-    for i in range(stacks):
-        for j in range(segments):
-            idx = i * segments + j
-            next_idx = i * segments + (j + 1) % segments
-            below_idx = (i + 1) * segments + j
-            below_next_idx = (i + 1) * segments + (j + 1) % segments
-            
-            # Criar quad (ou dois triângulos)
-            if i == 0:
-                # Topo: triângulo
-                faces.append([idx, below_next_idx, below_idx])
-            elif i == stacks - 1:
-                # Base: triângulo
-                faces.append([idx, next_idx, below_idx])
-            else:
-                # Meio: quadrilátero
-                faces.append([idx, next_idx, below_next_idx, below_idx])
+    # Topo: triângulo
+    faces = np.stack([idx[0], below_next_idx[0], below_idx[0]], axis=-1).tolist()
+    if stacks > 2:
+        # Meio: quadrilátero
+        faces += np.stack([idx[1:-1], next_idx[1:-1], below_next_idx[1:-1], below_idx[1:-1]],
+                          axis=-1).reshape(-1, 4).tolist()
+    if stacks > 1:
+        # Base: triângulo
+        faces += np.stack([idx[-1], next_idx[-1], below_idx[-1]], axis=-1).tolist()
     
     return Object3D(vertices, edges, faces)
 
 
+def _torus_vertices(major_radius: float, minor_radius: float,
+                    major_segments: int, minor_segments: int) -> np.ndarray:
+    """Vértices do torus: `major_segments` anéis de `minor_segments` vértices"""
+    cos_major, sin_major = _circle_table(major_segments)
+    cos_minor, sin_minor = _circle_table(minor_segments)
+    
+    # Distância de cada vértice ao eixo Y: centro do tubo + posição relativa
+    ring = major_radius + minor_radius * cos_minor
+    vertices = np.empty((major_segments, minor_segments, 3), dtype=np.float64)
+    vertices[:, :, 0] = np.outer(cos_major, ring)
+    vertices[:, :, 1] = minor_radius * sin_minor
+    vertices[:, :, 2] = np.outer(sin_major, ring)
+    return vertices.reshape(-1, 3)
+
+
 def create_torus(major_radius: float = 50.0, minor_radius: float = 20.0, 
                  major_segments: int = 32, minor_segments: int = 16) -> Object3D:
     """
@@ -564,51 +769,23 @@ def create_torus(major_radius: float = 50.0, minor_radius: float = 20.0,
     Returns:
         Object3D criado
     """
-    vertices = []
-    edges = []
-    faces = []
-    
-    # Gerar vértices
-    for i in range(major_segments):
-        major_angle = 2.0 * math.pi * i / major_segments
-        cos_major = math.cos(major_angle)
-        sin_major = math.sin(major_angle)
-        center_x = major_radius * cos_major
-        center_z = major_radius * sin_major
-        
-        for j in range(minor_segments):
-            minor_angle = 2.0 * math.pi * j / minor_segments
-            cos_minor = math.cos(minor_angle)
-            sin_minor = math.sin(minor_angle)
-            
-            # Posição relativa ao centro do tubo
-            rel_x = minor_radius * cos_minor * cos_major
-            rel_y = minor_radius * sin_minor
-            rel_z = minor_radius * cos_minor * sin_major
-            
-            x = center_x + rel_x
-            y = rel_y
-            z = center_z + rel_z
-            
-            vertices.append((x, y, z))
-    
-    # Gerar arestas e faces
-    for i in range(major_segments):
-        for j in range(minor_segments):
-            idx = i * minor_segments + j
-            next_j = (j + 1) % minor_segments
-            next_i = (i + 1) % major_segments
-            
-            next_j_idx = i * minor_segments + next_j
-            next_i_idx = next_i * minor_segments + j
-            next_both_idx = next_i * minor_segments + next_j
-            
-            # Arestas
-            edges.append((idx, next_j_idx))  # Horizontal (ao redor do tubo)
-            edges.append((idx, next_i_idx))  # Vertical (ao redor do torus)
-            
-            # Faces (quadriláteros)
-            faces.append([idx, next_j_idx, next_both_idx, next_i_idx])
+    vertices = _torus_vertices(major_radius, minor_radius, major_segments, minor_segments)
+    
+    # Índices em grade (anel maior i, segmento do tubo j), ambos circulares
+    ii, jj = np.meshgrid(np.arange(major_segments), np.arange(minor_segments), indexing='ij')
+    next_j = (jj + 1) % minor_segments
+    next_i = (ii + 1) % major_segments
+    idx = ii * minor_segments + jj
+    next_j_idx = ii * minor_segments + next_j
+    next_i_idx = next_i * minor_segments + jj
+    next_both_idx = next_i * minor_segments + next_j
+    
+    # Arestas: horizontal (ao redor do tubo) e vertical (ao redor do torus) alternadas
+    edges = np.stack([np.stack([idx, next_j_idx], axis=-1),
+                      np.stack([idx, next_i_idx], axis=-1)], axis=2).reshape(-1, 2).tolist()
+    
+    # Faces (quadriláteros)
+    faces = np.stack([idx, next_j_idx, next_both_idx, next_i_idx], axis=-1).reshape(-1, 4).tolist()
     
     return Object3D(vertices, edges, faces)
 
@@ -625,42 +802,48 @@ def create_cone(base_radius: float = 50.0, height: float = 100.0, segments: int
     Returns:
         Object3D criado
     """
-    vertices = []
-    edges = []
-    faces = []
-    
-    # Vértice do topo
+    # Vértice do topo seguido dos vértices da base
     top_idx = 0
-    vertices.append((0.0, height / 2.0, 0.0))
-    
-    # Vértices da base
     base_start = 1
-    for i in range(segments):
-        angle = 2.0 * math.pi * i / segments
-        x = base_radius * math.cos(angle)
-        z = base_radius * math.sin(angle)
-        vertices.append((x, -height / 2.0, z))
+    cos_a, sin_a = _circle_table(segments)
+    vertices = np.empty((segments + 1, 3), dtype=np.float64)
+    vertices[0] = (0.0, height / 2.0, 0.0)
+    vertices[1:, 0] = base_radius * cos_a
+    vertices[1:, 1] = -height / 2.0
+    vertices[1:, 2] = base_radius * sin_a
     
-    # Arestas da base
-    for i in range(segments):
-        edges.append((base_start + i, base_start + (i + 1) % segments))
+    base = base_start + np.arange(segments)
+    base_next = base_start + (np.arange(segments) + 1) % segments
+    apex = np.full(segments, top_idx)
     
-    # Arestas do topo para a base
-    for i in range(segments):
-        edges.append((top_idx, base_start + i))
+    # Arestas da base e arestas do topo para a base
+    edges = np.concatenate([np.stack([base, base_next], axis=1),
+                            np.stack([apex, base], axis=1)])
     
     # Face da base
-    base_face = list(range(base_start, base_start + segments))
-    faces.append(base_face)
+    faces = [list(range(base_start, base_start + segments))]
     
     # Faces laterais (triângulos)
-    for i in range(segments):
-        next_i = (i + 1) % segments
-        faces.append([top_idx, base_start + i, base_start + next_i])
+    faces += np.stack([apex, base, base_next], axis=1).tolist()
     
     return Object3D(vertices, edges, faces)
 
 
+def _grid_strip_indices(strips: int, columns: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Arestas e quads de uma grade de (strips + 1) linhas de `columns` vértices, circular
+    nas colunas. Para cada vértice (i, j), i < strips: arestas (ao longo da linha, para a
+    linha seguinte) e a face [idx, next_j, next_both, next_i]."""
+    ii, jj = np.meshgrid(np.arange(strips), np.arange(columns), indexing='ij')
+    idx = ii * columns + jj
+    next_j_idx = ii * columns + (jj + 1) % columns
+    next_i_idx = idx + columns
+    next_both_idx = next_j_idx + columns
+    edges = np.stack([np.stack([idx, next_j_idx], axis=-1),
+                      np.stack([idx, next_i_idx], axis=-1)], axis=2).reshape(-1, 2)
+    faces = np.stack([idx, next_j_idx, next_both_idx, next_i_idx], axis=-1).reshape(-1, 4)
+    return edges, faces
+
+
 def create_teapot(size: float = 50.0) -> Object3D:
     """
     Cria uma versão simplificada do Utah Teapot
@@ -672,10 +855,6 @@ def create_teapot(size: float = 50.0) -> Object3D:
     Returns:
         Object3D criado
     """
-    vertices = []
-    edges = []
-    faces = []
-    
     scale = size / 50.0
     
     # Simplificação: criar teapot usando múltiplos cilindros e esferas
@@ -687,137 +866,81 @@ def create_teapot(size: float = 50.0) -> Object3D:
     body_radius_z = 30.0 * scale
     body_center_y = 0.0
     
-    for i in range(body_stacks + 1):
-        theta = math.pi * i / body_stacks
-        sin_theta = math.sin(theta)
-        cos_theta = math.cos(theta)
-        y = body_center_y + body_radius_y * cos_theta
-        
-        for j in range(body_segments):
-            phi = 2.0 * math.pi * j / body_segments
-            sin_phi = math.sin(phi)
-            cos_phi = math.cos(phi)
-            
-            x = body_radius_x * sin_theta * cos_phi
-            z = body_radius_z * sin_theta * sin_phi
-            vertices.append((x, y, z))
-    
-    num_body_vertices = len(vertices)
-    
-    # Bico (cone alongado)
+    # Mesma parametrização da esfera unitária, esticada por eixo
+    body_vertices = _sphere_vertices(1.0, body_segments, body_stacks) * (body_radius_x, body_radius_y, body_radius_z)
+    body_vertices[:, 1] += body_center_y
+    body_edges, body_faces = _grid_strip_indices(body_stacks, body_segments)
+    
+    # Bico (cone alongado): base e ponta intercaladas por segmento
     spout_segments = 12
     spout_length = 25.0 * scale
     spout_start_y = body_center_y
-    spout_radius_start = 8.0 * scale
-    spout_radius_end = 3.0 * scale
-    
-    for i in range(spout_segments):
-        angle = 2.0 * math.pi * i / spout_segments
-        # Base do bico
-        x_start = (body_radius_x + 5.0 * scale) * math.cos(angle)
-        z_start = (body_radius_z + 5.0 * scale) * math.sin(angle)
-        y_start = spout_start_y
-        vertices.append((x_start, y_start, z_start))
-        
-        # Fim do bico (mais estreito)
-        x_end = x_start + spout_length * math.cos(angle) * 0.3
-        z_end = z_start + spout_length * math.sin(angle) * 0.3
-        y_end = spout_start_y + 5.0 * scale
-        vertices.append((x_end, y_end, z_end))
     
-    num_spout_vertices = len(vertices) - num_body_vertices
+    cos_a, sin_a = _circle_table(spout_segments)
+    spout_vertices = np.empty((spout_segments, 2, 3), dtype=np.float64)
+    spout_vertices[:, 0, 0] = (body_radius_x + 5.0 * scale) * cos_a
+    spout_vertices[:, 0, 1] = spout_start_y
+    spout_vertices[:, 0, 2] = (body_radius_z + 5.0 * scale) * sin_a
+    # Fim do bico (mais estreito)
+    spout_vertices[:, 1, 0] = spout_vertices[:, 0, 0] + spout_length * cos_a * 0.3
+    spout_vertices[:, 1, 1] = spout_start_y + 5.0 * scale
+    spout_vertices[:, 1, 2] = spout_vertices[:, 0, 2] + spout_length * sin_a * 0.3
+    spout_vertices = spout_vertices.reshape(-1, 3)
+    
+    base_idx = np.arange(spout_segments) * 2
+    tip_idx = base_idx + 1
+    next_base_idx = np.roll(base_idx, -1)
+    next_tip_idx = next_base_idx + 1
+    spout_edges = np.stack([np.stack([base_idx, tip_idx], axis=-1),
+                            np.stack([base_idx, next_base_idx], axis=-1),
+                            np.stack([tip_idx, next_tip_idx], axis=-1)], axis=1).reshape(-1, 2)
+    spout_faces = np.stack([base_idx, next_base_idx, next_tip_idx, tip_idx], axis=-1)
     
     # Alça (torus parcial)
     handle_segments = 16
+    handle_minor_segments = 8
     handle_radius = 8.0 * scale
     handle_major = 15.0 * scale
     
-    for i in range(handle_segments):
-        major_angle = math.pi * (i / handle_segments)  # Apenas meio círculo
-        for j in range(8):
-            minor_angle = 2.0 * math.pi * j / 8
-            x = (handle_major + handle_radius * math.cos(minor_angle)) * math.cos(major_angle)
-            y = body_center_y + handle_radius * math.sin(minor_angle) + 10.0 * scale
-            z = -(body_radius_z + handle_major) + (handle_major + handle_radius * math.cos(minor_angle)) * math.sin(major_angle)
-            vertices.append((x, y, z))
-    
-    num_handle_vertices = len(vertices) - num_body_vertices - num_spout_vertices
-    
-    # Tampa (disco com pequeno botão)
+    major_angle = np.pi * (np.arange(handle_segments) / handle_segments)  # Apenas meio círculo
+    cos_minor, sin_minor = _circle_table(handle_minor_segments)
+    ring = handle_major + handle_radius * cos_minor
+    handle_vertices = np.empty((handle_segments, handle_minor_segments, 3), dtype=np.float64)
+    handle_vertices[:, :, 0] = np.outer(np.cos(major_angle), ring)
+    handle_vertices[:, :, 1] = body_center_y + handle_radius * sin_minor + 10.0 * scale
+    handle_vertices[:, :, 2] = -(body_radius_z + handle_major) + np.outer(np.sin(major_angle), ring)
+    handle_vertices = handle_vertices.reshape(-1, 3)
+    handle_edges, handle_faces = _grid_strip_indices(handle_segments - 1, handle_minor_segments)
+    
+    # Tampa (disco com pequeno botão): centro seguido da borda
     lid_segments = 16
     lid_radius = 20.0 * scale
     lid_y = body_radius_y + 5.0 * scale
     
-    # Centro da tampa
-    vertices.append((0.0, lid_y, 0.0))
-    lid_center_idx = len(vertices) - 1
-    
-    # Borda da tampa
-    lid_start = len(vertices)
-    for i in range(lid_segments):
-        angle = 2.0 * math.pi * i / lid_segments
-        x = lid_radius * math.cos(angle)
-        z = lid_radius * math.sin(angle)
-        vertices.append((x, lid_y, z))
-    
-    # Arestas do corpo
-    for i in range(body_stacks):
-        for j in range(body_segments):
-            idx = i * body_segments + j
-            next_j = (j + 1) % body_segments
-            next_i_idx = (i + 1) * body_segments + j
-            next_j_idx = i * body_segments + next_j
-            next_both_idx = (i + 1) * body_segments + next_j
-            
-            edges.append((idx, next_j_idx))
-            if i < body_stacks:
-                edges.append((idx, next_i_idx))
-            
-            if i == 0:
-                faces.append([idx, next_j_idx, next_both_idx, next_i_idx])
-            elif i == body_stacks - 1:
-                faces.append([idx, next_j_idx, next_both_idx, next_i_idx])
-            else:
-                faces.append([idx, next_j_idx, next_both_idx, next_i_idx])
-    
-    # Arestas e faces do bico
-    spout_start = num_body_vertices
-    for i in range(spout_segments):
-        base_idx = spout_start + i * 2
-        tip_idx = spout_start + i * 2 + 1
-        next_base_idx = spout_start + ((i + 1) % spout_segments) * 2
-        next_tip_idx = spout_start + ((i + 1) % spout_segments) * 2 + 1
-        
-        edges.append((base_idx, tip_idx))
-        edges.append((base_idx, next_base_idx))
-        edges.append((tip_idx, next_tip_idx))
-        
-        faces.append([base_idx, next_base_idx, next_tip_idx, tip_idx])
-    
-    # Arestas e faces da alça
-    handle_start = num_body_vertices + num_spout_vertices
-    for i in range(handle_segments - 1):
-        for j in range(8):
-            idx = handle_start + i * 8 + j
-            next_j = (j + 1) % 8
-            next_i_idx = handle_start + (i + 1) * 8 + j
-            next_j_idx = handle_start + i * 8 + next_j
-            next_both_idx = handle_start + (i + 1) * 8 + next_j
-            
-            edges.append((idx, next_j_idx))
-            edges.append((idx, next_i_idx))
-            
-            faces.append([idx, next_j_idx, next_both_idx, next_i_idx])
-    
-    # Faces da tampa
-    for i in range(lid_segments):
-        next_i = (i + 1) % lid_segments
-        vertex_idx = lid_start + i
-        next_vertex_idx = lid_start + next_i
-        
-        edges.append((lid_center_idx, vertex_idx))
-        edges.append((vertex_idx, next_vertex_idx))
-        faces.append([lid_center_idx, vertex_idx, next_vertex_idx])
+    cos_a, sin_a = _circle_table(lid_segments)
+    lid_vertices = np.empty((lid_segments + 1, 3), dtype=np.float64)
+    lid_vertices[0] = (0.0, lid_y, 0.0)
+    lid_vertices[1:, 0] = lid_radius * cos_a
+    lid_vertices[1:, 1] = lid_y
+    lid_vertices[1:, 2] = lid_radius * sin_a
+    
+    rim_idx = 1 + np.arange(lid_segments)
+    next_rim_idx = np.roll(rim_idx, -1)
+    center = np.zeros(lid_segments, dtype=int)
+    lid_edges = np.stack([np.stack([center, rim_idx], axis=-1),
+                          np.stack([rim_idx, next_rim_idx], axis=-1)], axis=1).reshape(-1, 2)
+    lid_faces = np.stack([center, rim_idx, next_rim_idx], axis=-1)
+    
+    # Juntar as partes: índices locais deslocados pelo início de cada parte
+    parts = [body_vertices, spout_vertices, handle_vertices, lid_vertices]
+    offsets = np.cumsum([0] + [len(p) for p in parts[:-1]])
+    vertices = np.vstack(parts)
+    edges = np.concatenate([body_edges + offsets[0], spout_edges + offsets[1],
+                            handle_edges + offsets[2], lid_edges + offsets[3]])
+    # Quads do corpo, bico e alça; triângulos da tampa
+    faces = np.concatenate([body_faces + offsets[0], spout_faces + offsets[1],
+                            handle_faces + offsets[2]]).tolist()
+    faces += (lid_faces + offsets[3]).tolist()
     
     return Object3D(vertices, edges, faces)
 
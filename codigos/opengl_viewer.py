@@ -6,12 +6,17 @@ from PyQt5.QtGui import QSurfaceFormat
 from PyQt5.QtCore import Qt
 from OpenGL.GL import *
 from OpenGL.GLU import *
+import ctypes
 import math
 import geometry3d as geo3d
 from typing import List, Optional, Tuple
 import numpy as np
 
 
+# Vértice intercalado nos VBOs: posição (3 floats) + normal (3 floats)
+_VERTEX_STRIDE = 6 * 4
+
+
 class OpenGLViewer(QOpenGLWidget):
     """Widget OpenGL para renderização 3D com iluminação"""
     
@@ -28,6 +33,16 @@ class OpenGLViewer(QOpenGLWidget):
         
         self.objects: List[geo3d.Object3D] = []
         self.current_object: Optional[geo3d.Object3D] = None
+        # Normais (face, vértice) por objeto, válidas enquanto geom_version não mudar:
+        # id(obj) -> (obj, geom_version, face_normals, vertex_normals)
+        self._normal_cache = {}
+        # Buffers de vértices/índices na GPU por objeto:
+        # id(obj) -> (obj, geom_version, transform, flat, (vbo, ibo, quantidade))
+        self._buffer_cache = {}
+        # Último material e modelo de shading enviados ao OpenGL (None = desconhecido),
+        # para não repetir glMaterialfv/glShadeModel com os mesmos valores
+        self._last_material = None
+        self._last_shade = None
         
         # Iluminação
         self.light_position = [200.0, 200.0, 200.0, 1.0]  # Posição da luz (x, y, z, w)
@@ -47,11 +62,20 @@ class OpenGLViewer(QOpenGLWidget):
         # Projeção
         self.is_perspective = False
         self.distance = 500.0
+        # Matriz de projeção (16 floats, column-major) e tamanho do viewport, recalculados
+        # só em resizeGL/set_projection
+        self._proj_matrix = None
+        self._viewport_size = None
         
         # Câmera
         self.camera_rot_x = 30.0
         self.camera_rot_y = 45.0
         self.camera_distance = 300.0
+        # Matriz da câmera e sua inversa (16 floats, column-major), recalculadas só quando
+        # (camera_rot_x, camera_rot_y, camera_distance) mudam
+        self._view_key = None
+        self._view_matrix = None
+        self._inv_view_matrix = None
         
         # Controle de mouse para rotação
         self.last_mouse_pos = None
@@ -77,49 +101,86 @@ class OpenGLViewer(QOpenGLWidget):
         glEnable(GL_LIGHT0)
         # Desabilitar GL_COLOR_MATERIAL para ter controle total sobre as cores do material
         glDisable(GL_COLOR_MATERIAL)
-        glEnable(GL_NORMALIZE)  # Normalizar normais automaticamente
+        # As normais já chegam unitárias (rotacionadas e renormalizadas na CPU, com a
+        # escala do objeto incluída) e a câmera é só rotação + translação: a GPU não
+        # precisa renormalizá-las a cada vértice
+        glDisable(GL_NORMALIZE)
         
         # Habilitar iluminação de dois lados para melhor visibilidade
         glLightModeli(GL_LIGHT_MODEL_TWO_SIDE, GL_TRUE)
         
         glClearColor(0.1, 0.1, 0.15, 1.0)
         glShadeModel(GL_SMOOTH)  # Inicia com Gouraud
+        self._last_shade = GL_SMOOTH
+        self._last_material = None  # Contexto novo: material ainda não enviado
         
         # Desabilitar face culling completamente para objetos pré-criados
         # Isso garante que todas as faces sejam renderizadas independente da ordem dos vértices
         glDisable(GL_CULL_FACE)
+        
+        self._init_light_buffers()
+    
+    def _init_light_buffers(self):
+        """Monta uma vez os buffers da representação da luz: esfera (20x20, raio 10) e raios"""
+        slices = 20
+        stacks = 20
+        radius = 10.0
+        
+        # Grade (stacks + 1) x (slices + 1) de latitude/longitude
+        lat = np.pi * (-0.5 + np.arange(stacks + 1) / stacks)
+        lng = 2.0 * np.pi * np.arange(slices + 1) / slices
+        ring_radius = np.cos(lat) * radius
+        sphere = np.empty((stacks + 1, slices + 1, 3), dtype=np.float32)
+        sphere[:, :, 0] = np.outer(ring_radius, np.cos(lng))
+        sphere[:, :, 1] = np.outer(ring_radius, np.sin(lng))
+        sphere[:, :, 2] = (np.sin(lat) * radius)[:, None]
+        
+        # Dois triângulos por célula: (i, j), (i, j+1), (i+1, j) e (i, j+1), (i+1, j+1), (i+1, j)
+        ii, jj = np.meshgrid(np.arange(stacks), np.arange(slices), indexing='ij')
+        v00 = ii * (slices + 1) + jj
+        v01 = v00 + 1
+        v10 = v00 + slices + 1
+        v11 = v10 + 1
+        indices = np.stack([v00, v01, v10, v01, v11, v10], axis=-1).astype(np.uint32).ravel()
+        
+        # Raios: 8 no plano XY e um ao longo de Z repetido por raio
+        num_rays = 8
+        ray_length = 15.0
+        angle = 2.0 * np.pi * np.arange(num_rays) / num_rays
+        rays = np.zeros((num_rays, 4, 3), dtype=np.float32)
+        rays[:, 1, 0] = np.cos(angle) * ray_length
+        rays[:, 1, 1] = np.sin(angle) * ray_length
+        rays[:, 3, 2] = ray_length
+        
+        self._light_sphere_vbo, self._light_sphere_ibo, self._light_rays_vbo = glGenBuffers(3)
+        glBindBuffer(GL_ARRAY_BUFFER, self._light_sphere_vbo)
+        glBufferData(GL_ARRAY_BUFFER, sphere.nbytes, sphere, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._light_sphere_ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, self._light_rays_vbo)
+        glBufferData(GL_ARRAY_BUFFER, rays.nbytes, rays, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._light_sphere_count = indices.size
+        self._light_rays_count = num_rays * 4
     
     def resizeGL(self, width, height):
         """Atualiza viewport quando o widget é redimensionado"""
         glViewport(0, 0, width, height)
+        self._viewport_size = (width, height)
+        self._proj_matrix = self._build_projection_matrix(width, height)
         self.update()
     
     def paintGL(self):
         """Renderiza a cena"""
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         
-        # Configurar projeção
+        # Configurar projeção (matriz recalculada só quando o viewport ou a projeção mudam)
+        if self._proj_matrix is None:
+            width, height = self._viewport_size or (self.width(), self.height())
+            self._proj_matrix = self._build_projection_matrix(width, height)
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        
-        width = self.width()
-        height = self.height()
-        aspect = width / height if height > 0 else 1.0
-        
-        if self.is_perspective:
-            # Calcular FOV baseado na distância da projeção
-            # Distância maior = FOV menor (menos distorção perspectiva)
-            # Fórmula: FOV é inversamente proporcional à distância
-            # Usar uma distância base de 500 para FOV de 45 graus
-            base_distance = 500.0
-            base_fov = 45.0
-            # FOV ajustado proporcionalmente à distância
-            fov_degrees = base_fov * (base_distance / self.distance)
-            # Limitar FOV entre 10 e 90 graus para evitar valores extremos
-            fov_degrees = max(10.0, min(90.0, fov_degrees))
-            gluPerspective(fov_degrees, aspect, 1.0, 2000.0)
-        else:
-            glOrtho(-200.0 * aspect, 200.0 * aspect, -200.0, 200.0, -1000.0, 1000.0)
+        glLoadMatrixf(self._proj_matrix)
         
         # Configurar view
         glMatrixMode(GL_MODELVIEW)
@@ -134,82 +195,113 @@ class OpenGLViewer(QOpenGLWidget):
         glLightfv(GL_LIGHT0, GL_DIFFUSE, self.light_diffuse)
         glLightfv(GL_LIGHT0, GL_SPECULAR, self.light_specular)
         
-        # Habilitar normalização de normais (importante quando há escalas não uniformes)
-        glEnable(GL_NORMALIZE)
-        
-        # Posicionar câmera (após definir a luz)
-        glTranslatef(0.0, 0.0, -self.camera_distance)
-        glRotatef(self.camera_rot_x, 1.0, 0.0, 0.0)
-        glRotatef(self.camera_rot_y, 0.0, 1.0, 0.0)
+        # Posicionar câmera (após definir a luz): translação + rotações X e Y numa só matriz
+        self._update_view_matrices()
+        glLoadMatrixf(self._view_matrix)
         
         # Garantir que face culling esteja desabilitado antes de desenhar objetos
         glDisable(GL_CULL_FACE)
         
         # Configurar material - usar as cores definidas pelo usuário
-        # Aplicar as cores diretamente no material
-        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, self.material_ambient)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, self.material_diffuse)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, self.material_specular)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SHININESS, self.material_shininess)
-        
-        # Definir modelo de shading
-        if self.shading_model == 'flat':
-            glShadeModel(GL_FLAT)
-        else:  # gouraud ou phong (ambos usam interpolação suave)
-            glShadeModel(GL_SMOOTH)
-        
-        # Desenhar todos os objetos na cena
+        # Cada objeto aplica o próprio material; o global só vale para uma cena vazia
+        if not self.objects:
+            self._apply_material(self.material_ambient, self.material_diffuse,
+                                 self.material_specular, self.material_shininess)
+        
+        # Definir modelo de shading (gouraud e phong usam interpolação suave)
+        shade = GL_FLAT if self.shading_model == 'flat' else GL_SMOOTH
+        if shade != self._last_shade:
+            glShadeModel(shade)
+            self._last_shade = shade
+        
+        # Desenhar todos os objetos na cena; o modo de shading e os arrays de
+        # vértices/normais são decididos e habilitados uma vez para todos
+        self._prune_object_caches()
+        flat = shade == GL_FLAT
+        phong = self.shading_model == 'phong'
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
         for obj in self.objects:
-            self._draw_object(obj)
+            self._draw_object(obj, flat, phong)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
         
         # Desenhar representação visual da fonte de luz
         if self.show_light_representation:
             self._draw_light_representation()
     
-    def _draw_object(self, obj: geo3d.Object3D):
-        """Desenha um objeto 3D"""
-        vertices = obj.get_transformed_vertices()
-        
-        if not vertices:
+    def _update_view_matrices(self):
+        """Recalcula a matriz da câmera, T(0, 0, -dist) * Rx * Ry, e sua inversa se a câmera mudou"""
+        key = (self.camera_rot_x, self.camera_rot_y, self.camera_distance)
+        if key == self._view_key:
             return
         
-        # Calcular normais das faces para iluminação
-        # IMPORTANTE: Calcular normais a partir dos vértices originais e depois
-        # aplicar apenas a rotação da transformação (não a translação)
-        face_normals = self._calculate_face_normals_from_original(obj)
-        vertex_normals = self._calculate_vertex_normals_from_original(obj, face_normals)
-        
-        # Aplicar rotação às normais (extrair apenas parte de rotação/escala da transformação)
-        rotation_matrix = obj.transform.matrix[:3, :3]  # Parte superior esquerda 3x3
+        ax = math.radians(self.camera_rot_x)
+        ay = math.radians(self.camera_rot_y)
+        cx, sx = math.cos(ax), math.sin(ax)
+        cy, sy = math.cos(ay), math.sin(ay)
+        rotation = np.array([
+            [cy, 0.0, sy],
+            [sx * sy, cx, -sx * cy],
+            [-cx * sy, sx, cx * cy]
+        ])
+        
+        view = np.eye(4)
+        view[:3, :3] = rotation
+        view[2, 3] = -self.camera_distance
+        # Inversa: rotação transposta e translação desfeita (R^T * T(0, 0, dist))
+        inverse = np.eye(4)
+        inverse[:3, :3] = rotation.T
+        inverse[:3, 3] = rotation.T[:, 2] * self.camera_distance
+        
+        # OpenGL lê a matriz por colunas
+        self._view_matrix = view.T.astype(np.float32).ravel()
+        self._inv_view_matrix = inverse.T.astype(np.float32).ravel()
+        self._view_key = key
+    
+    def _build_projection_matrix(self, width: int, height: int) -> np.ndarray:
+        """Monta a matriz de projeção (equivalente a gluPerspective/glOrtho) como 16 floats
+        em column-major, prontos para glLoadMatrixf"""
+        aspect = width / height if height > 0 else 1.0
+        m = np.zeros((4, 4), dtype=np.float64)
         
-        # Transformar normais das faces
-        transformed_face_normals = []
-        for normal_tuple in face_normals:
-            normal_vec = np.array([normal_tuple[0], normal_tuple[1], normal_tuple[2], 0.0])
-            transformed_normal = np.dot(rotation_matrix, normal_vec[:3])
-            # Normalizar após transformação
-            normal_length = np.linalg.norm(transformed_normal)
-            if normal_length > 0.0001:
-                transformed_normal = transformed_normal / normal_length
-            else:
-                transformed_normal = np.array([0.0, 0.0, 1.0])
-            transformed_face_normals.append(tuple(transformed_normal))
-        
-        # Transformar normais dos vértices
-        transformed_vertex_normals = []
-        for normal_tuple in vertex_normals:
-            normal_vec = np.array([normal_tuple[0], normal_tuple[1], normal_tuple[2], 0.0])
-            transformed_normal = np.dot(rotation_matrix, normal_vec[:3])
-            # Normalizar após transformação
-            normal_length = np.linalg.norm(transformed_normal)
-            if normal_length > 0.0001:
-                transformed_normal = transformed_normal / normal_length
-            else:
-                transformed_normal = np.array([0.0, 0.0, 1.0])
-            transformed_vertex_normals.append(tuple(transformed_normal))
+        if self.is_perspective:
+            # Calcular FOV baseado na distância da projeção
+            # Distância maior = FOV menor (menos distorção perspectiva)
+            # Fórmula: FOV é inversamente proporcional à distância
+            # Usar uma distância base de 500 para FOV de 45 graus
+            base_distance = 500.0
+            base_fov = 45.0
+            # FOV ajustado proporcionalmente à distância
+            fov_degrees = base_fov * (base_distance / self.distance)
+            # Limitar FOV entre 10 e 90 graus para evitar valores extremos
+            fov_degrees = max(10.0, min(90.0, fov_degrees))
+            # gluPerspective(fov_degrees, aspect, 1.0, 2000.0)
+            near, far = 1.0, 2000.0
+            f = 1.0 / math.tan(math.radians(fov_degrees) / 2.0)
+            m[0, 0] = f / aspect
+            m[1, 1] = f
+            m[2, 2] = (far + near) / (near - far)
+            m[2, 3] = 2.0 * far * near / (near - far)
+            m[3, 2] = -1.0
+        else:
+            # glOrtho(-200 * aspect, 200 * aspect, -200, 200, -1000, 1000)
+            half_w, half_h, depth = 200.0 * aspect, 200.0, 1000.0
+            m[0, 0] = 1.0 / half_w
+            m[1, 1] = 1.0 / half_h
+            m[2, 2] = -1.0 / depth
+            m[3, 3] = 1.0
+        
+        # OpenGL lê a matriz por colunas
+        return m.T.astype(np.float32).ravel()
+    
+    def _draw_object(self, obj: geo3d.Object3D, flat: bool, phong: bool):
+        """Desenha um objeto 3D (os arrays de vértices e normais já devem estar habilitados)"""
+        if len(obj.vertices) == 0:
+            return
         
-        face_normals = transformed_face_normals
-        vertex_normals = transformed_vertex_normals
+        buffers = self._get_object_buffers(obj, flat)
         
         # Desabilitar culling temporariamente para garantir que todas as faces sejam renderizadas
         glDisable(GL_CULL_FACE)
@@ -219,131 +311,189 @@ class OpenGLViewer(QOpenGLWidget):
         material_diffuse = [min(1.0, r * 1.2), min(1.0, g * 1.2), min(1.0, b * 1.2), alpha]
         material_ambient = [r * 0.3, g * 0.3, b * 0.3, alpha]
         # Para Phong, usar specular mais intenso para destacar highlights
-        if self.shading_model == 'phong':
+        if phong:
             material_specular = [1.2, 1.2, 1.2, alpha]  # Specular mais intenso
             shininess = [128.0]  # Brilho mais alto
         else:
             material_specular = [1.0, 1.0, 1.0, alpha]
             shininess = self.material_shininess
         
-        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, material_ambient)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, material_diffuse)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, material_specular)
+        self._apply_material(material_ambient, material_diffuse, material_specular, shininess)
+        
+        # Desenhar faces a partir dos buffers (posição e normal intercaladas)
+        vbo, ibo, count = buffers
+        if count == 0:
+            return
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glVertexPointer(3, GL_FLOAT, _VERTEX_STRIDE, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, _VERTEX_STRIDE, ctypes.c_void_p(12))
+        if flat:
+            # Vértices replicados por triângulo, cada um com a normal da face
+            glDrawArrays(GL_TRIANGLES, 0, count)
+        else:
+            # Vértices compartilhados com as normais dos vértices, indexados
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+            glDrawElements(GL_TRIANGLES, count, GL_UNSIGNED_INT, None)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+    
+    def _apply_material(self, ambient, diffuse, specular, shininess):
+        """Envia o material ao OpenGL, a menos que seja igual ao último enviado"""
+        key = (tuple(ambient), tuple(diffuse), tuple(specular), tuple(shininess))
+        if key == self._last_material:
+            return
+        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, ambient)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, diffuse)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, specular)
         glMaterialfv(GL_FRONT_AND_BACK, GL_SHININESS, shininess)
+        self._last_material = key
+    
+    def _get_object_buffers(self, obj: geo3d.Object3D, flat: bool) -> Tuple[int, int, int]:
+        """Retorna (vbo, ibo, quantidade) do objeto, reenviando os dados à GPU só quando a
+        geometria, a transformação do objeto ou o modo (flat/suave) mudam - girar a câmera
+        não reenvia nada"""
+        cached = self._buffer_cache.get(id(obj))
+        if (cached is not None and cached[0] is obj and cached[1] == obj.geom_version
+                and cached[2] is obj.transform and cached[3] == flat):
+            return cached[4]
+        if cached is not None:
+            vbo, ibo = cached[4][0], cached[4][1]
+        else:
+            vbo, ibo = glGenBuffers(2)
         
-        # Desenhar faces
-        glBegin(GL_TRIANGLES)
-        for face_idx, face in enumerate(obj.faces):
-            if len(face) < 3:
-                continue
-            
-            # Se for flat shading, usar normal da face
-            if self.shading_model == 'flat' and face_idx < len(face_normals):
-                normal = face_normals[face_idx]
-                glNormal3f(normal[0], normal[1], normal[2])
-            
-            # Triangulizar face (assumindo que é convexa)
-            for i in range(1, len(face) - 1):
-                idx0 = face[0]
-                idx1 = face[i]
-                idx2 = face[i + 1]
-                
-                if idx0 < len(vertices) and idx1 < len(vertices) and idx2 < len(vertices):
-                    v0 = vertices[idx0]
-                    v1 = vertices[idx1]
-                    v2 = vertices[idx2]
-                    
-                    # Se for Gouraud ou Phong, usar normal do vértice
-                    if self.shading_model in ['gouraud', 'phong']:
-                        if idx0 < len(vertex_normals):
-                            normal = vertex_normals[idx0]
-                            glNormal3f(normal[0], normal[1], normal[2])
-                    glVertex3f(v0[0], v0[1], v0[2])
-                    
-                    if self.shading_model in ['gouraud', 'phong'] and idx1 < len(vertex_normals):
-                        normal = vertex_normals[idx1]
-                        glNormal3f(normal[0], normal[1], normal[2])
-                    glVertex3f(v1[0], v1[1], v1[2])
-                    
-                    if self.shading_model in ['gouraud', 'phong'] and idx2 < len(vertex_normals):
-                        normal = vertex_normals[idx2]
-                        glNormal3f(normal[0], normal[1], normal[2])
-                    glVertex3f(v2[0], v2[1], v2[2])
-        glEnd()
+        vertices = obj.get_transformed_vertices()
+        
+        # Calcular normais das faces para iluminação
+        # IMPORTANTE: Calcular normais a partir dos vértices originais e depois
+        # aplicar apenas a rotação da transformação (não a translação)
+        face_normals, vertex_normals = self._get_normals_from_original(obj)
+        
+        # Triângulos das faces, triangulados e validados uma vez na criação do objeto
+        triangles = obj.triangles
+        
+        if flat:
+            # Normal da face em cada um dos três vértices do triângulo, escrita direto no buffer
+            normals = self._rotate_normals(face_normals, obj.transform)
+            data = np.empty((len(triangles), 3, 6), dtype=np.float32)
+            np.take(vertices, triangles, axis=0, out=data[:, :, :3], mode='clip')
+            np.take(normals, obj.triangle_faces, axis=0, out=data[:, 0, 3:], mode='clip')
+            data[:, 1:, 3:] = data[:, :1, 3:]
+            count = 3 * len(triangles)
+        else:
+            data = np.empty((len(vertices), 6), dtype=np.float32)
+            data[:, :3] = vertices
+            self._rotate_normals(vertex_normals, obj.transform, out=data[:, 3:])
+            indices = np.ascontiguousarray(triangles, dtype=np.uint32)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+            count = indices.size
+        
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        buffers = (vbo, ibo, count)
+        self._buffer_cache[id(obj)] = (obj, obj.geom_version, obj.transform, flat, buffers)
+        return buffers
     
-    def _calculate_face_normals_from_original(self, obj: geo3d.Object3D) -> List[Tuple[float, float, float]]:
-        """Calcula normais das faces a partir dos vértices originais (não transformados)"""
-        normals = []
-        
-        for face in obj.faces:
-            if len(face) < 3:
-                normals.append((0.0, 0.0, 1.0))
-                continue
-            
-            # Pegar três vértices da face em ordem CCW - usar vértices ORIGINAIS
-            idx0, idx1, idx2 = face[0], face[1], face[2]
-            
-            if idx0 >= len(obj.vertices) or idx1 >= len(obj.vertices) or idx2 >= len(obj.vertices):
-                normals.append((0.0, 0.0, 1.0))
-                continue
-            
-            v0 = geo3d.Vector3D.from_tuple(obj.vertices[idx0])
-            v1 = geo3d.Vector3D.from_tuple(obj.vertices[idx1])
-            v2 = geo3d.Vector3D.from_tuple(obj.vertices[idx2])
-            
-            # Calcular vetores da face
-            edge1 = v1 - v0
-            edge2 = v2 - v0
-            
-            # Calcular normal (produto vetorial): edge1 x edge2
-            # Em CCW, isso aponta para fora
-            normal = edge1.cross(edge2)
-            
-            # Normalizar
-            normal_length = normal.length()
-            if normal_length > 0.0001:  # Evitar divisão por zero
-                normal = normal.normalize()
-            else:
-                normal = geo3d.Vector3D(0.0, 0.0, 1.0)
-            
-            normals.append(normal.to_tuple())
+    @staticmethod
+    def _rotate_normals(normals: np.ndarray, transform: geo3d.Transform3D,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Aplica a parte 3x3 da transformação a um array (N, 3) de normais unitárias
+        
+        O resultado é escrito em out (pode ser a fatia de normais do buffer do VBO), sem
+        arrays intermediários. Só renormaliza quando a transformação tem escala: translação
+        e rotação preservam o comprimento das normais.
+        """
+        if transform.kind <= geo3d.TRANSFORM_TRANSLATION:
+            if out is None:
+                return normals.copy()
+            out[...] = normals
+            return out
+        
+        # Parte superior esquerda 3x3 (rotação/escala, sem a translação)
+        out = np.matmul(normals, transform.matrix[:3, :3].T, out=out)
+        if transform.kind > geo3d.TRANSFORM_RIGID:
+            # Normalizar após transformação
+            normal_length = np.sqrt(np.einsum('ij,ij->i', out, out))
+            ok = normal_length > 0.0001
+            out[ok] /= normal_length[ok, None]
+            out[~ok] = (0.0, 0.0, 1.0)
+        return out
+    
+    def _prune_object_caches(self):
+        """Descarta caches de objetos que saíram da cena (a lista de objetos pode ser trocada por fora)"""
+        if len(self._normal_cache) > len(self.objects) or len(self._buffer_cache) > len(self.objects):
+            live = {id(obj) for obj in self.objects}
+            self._normal_cache = {k: v for k, v in self._normal_cache.items() if k in live}
+            for key in [k for k in self._buffer_cache if k not in live]:
+                vbo, ibo, _ = self._buffer_cache.pop(key)[4]
+                glDeleteBuffers(2, [vbo, ibo])
+    
+    def _get_normals_from_original(self, obj: geo3d.Object3D) -> Tuple[np.ndarray, np.ndarray]:
+        """Normais das faces e dos vértices (originais), recalculadas só quando a geometria muda;
+        girar a câmera ou transformar o objeto reaproveita o cache"""
+        cached = self._normal_cache.get(id(obj))
+        if cached is not None and cached[0] is obj and cached[1] == obj.geom_version:
+            return cached[2], cached[3]
+        face_normals = self._calculate_face_normals_from_original(obj)
+        vertex_normals = self._calculate_vertex_normals_from_original(obj, face_normals)
+        self._normal_cache[id(obj)] = (obj, obj.geom_version, face_normals, vertex_normals)
+        return face_normals, vertex_normals
+    
+    def _calculate_face_normals_from_original(self, obj: geo3d.Object3D) -> np.ndarray:
+        """Calcula normais das faces a partir dos vértices originais (não transformados)
+        
+        Retorna um array (F, 3); faces degeneradas ou com índices inválidos recebem (0, 0, 1).
+        """
+        vertices = np.asarray(obj.vertices, dtype=np.float32)  # No-op para objetos float32 (padrão)
+        normals = np.tile(np.array([0.0, 0.0, 1.0], dtype=np.float32), (len(obj.faces), 1))
+        
+        # Três primeiros vértices de cada face, em ordem CCW - usar vértices ORIGINAIS
+        corners = np.array([face[:3] if len(face) >= 3 else (-1, -1, -1) for face in obj.faces],
+                           dtype=np.int64).reshape(-1, 3)
+        valid = ((corners >= 0) & (corners < len(vertices))).all(axis=1)
+        corners = corners[valid]
+        v0 = vertices[corners[:, 0]]
+        
+        # Normal = edge1 x edge2 (em CCW, aponta para fora)
+        normal = np.cross(vertices[corners[:, 1]] - v0, vertices[corners[:, 2]] - v0)
+        
+        # Normalizar (evitar divisão por zero)
+        normal_length = np.linalg.norm(normal, axis=1, keepdims=True)
+        ok = normal_length[:, 0] > 0.0001
+        normal[ok] /= normal_length[ok]
+        normal[~ok] = (0.0, 0.0, 1.0)
+        normals[valid] = normal
         
         return normals
     
     def _calculate_vertex_normals_from_original(self, obj: geo3d.Object3D, 
-                                  face_normals: List[Tuple[float, float, float]]) -> List[Tuple[float, float, float]]:
-        """Calcula normais dos vértices a partir dos vértices originais (média das normais das faces adjacentes)"""
-        vertex_normals = [(0.0, 0.0, 0.0) for _ in obj.vertices]
-        vertex_face_count = [0 for _ in obj.vertices]
+                                  face_normals: np.ndarray) -> np.ndarray:
+        """Calcula normais dos vértices a partir dos vértices originais (média das normais das faces adjacentes)
+        
+        Retorna um array (V, 3); vértices sem faces ou com soma nula recebem (0, 0, 1).
+        """
+        num_vertices = len(obj.vertices)
+        faces = obj.faces[:len(face_normals)]
+        
+        # Índices de todos os vértices de todas as faces, com a normal da face repetida
+        face_sizes = np.fromiter((len(face) for face in faces), dtype=np.int64, count=len(faces))
+        vertex_idx = np.fromiter((v for face in faces for v in face), dtype=np.int64, count=int(face_sizes.sum()))
+        normals_per_vertex = np.repeat(face_normals[:len(faces)], face_sizes, axis=0)
+        valid = (vertex_idx >= 0) & (vertex_idx < num_vertices)
         
         # Para cada face, adicionar sua normal aos vértices
-        for face_idx, face in enumerate(obj.faces):
-            if face_idx >= len(face_normals):
-                continue
-            
-            normal = geo3d.Vector3D.from_tuple(face_normals[face_idx])
-            
-            for vertex_idx in face:
-                if vertex_idx < len(obj.vertices):
-                    current_normal = geo3d.Vector3D.from_tuple(vertex_normals[vertex_idx])
-                    vertex_normals[vertex_idx] = (current_normal + normal).to_tuple()
-                    vertex_face_count[vertex_idx] += 1
-        
-        # Normalizar normais dos vértices
-        result = []
-        for i, normal in enumerate(vertex_normals):
-            if vertex_face_count[i] > 0:
-                normal_vec = geo3d.Vector3D.from_tuple(normal)
-                normal_length = normal_vec.length()
-                if normal_length > 0.0001:  # Evitar divisão por zero
-                    result.append(normal_vec.normalize().to_tuple())
-                else:
-                    # Se a normal é zero, usar normal padrão
-                    result.append((0.0, 0.0, 1.0))
-            else:
-                result.append((0.0, 0.0, 1.0))
+        vertex_normals = np.zeros((num_vertices, 3), dtype=np.float32)
+        np.add.at(vertex_normals, vertex_idx[valid], normals_per_vertex[valid])
+        
+        # Normalizar normais dos vértices (normal zero ou vértice sem faces: normal padrão)
+        normal_length = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+        ok = normal_length[:, 0] > 0.0001
+        vertex_normals[ok] /= normal_length[ok]
+        vertex_normals[~ok] = (0.0, 0.0, 1.0)
         
-        return result
+        return vertex_normals
     
     def add_object(self, obj: geo3d.Object3D):
         """Adiciona um objeto 3D"""
@@ -356,6 +506,15 @@ class OpenGLViewer(QOpenGLWidget):
         """Limpa todos os objetos"""
         self.objects.clear()
         self.current_object = None
+        self._normal_cache.clear()
+        if self._buffer_cache:
+            # Os buffers pertencem ao contexto do widget
+            self.makeCurrent()
+            for entry in self._buffer_cache.values():
+                vbo, ibo, _ = entry[4]
+                glDeleteBuffers(2, [vbo, ibo])
+            self.doneCurrent()
+            self._buffer_cache.clear()
         self.update()
     
     def set_current_object(self, index: int):
@@ -378,12 +537,15 @@ class OpenGLViewer(QOpenGLWidget):
                 self.material_shininess = [128.0]  # Brilho mais alto para Phong
             else:
                 self.material_shininess = [50.0]  # Brilho padrão
+            self._last_material = None
+            self._last_shade = None
             self.update()
     
     def set_projection(self, is_perspective: bool, distance: float = 500.0):
         """Alterna entre projeção perspectiva e ortográfica"""
         self.is_perspective = is_perspective
         self.distance = distance
+        self._proj_matrix = None
         self.update()
     
     def set_camera_rotation(self, rot_x: float, rot_y: float):
@@ -406,6 +568,7 @@ class OpenGLViewer(QOpenGLWidget):
         self.material_ambient = [r * 0.3, g * 0.3, b * 0.3, alpha]
         # Manter especular branco para highlights realistas
         self.material_specular = [1.0, 1.0, 1.0, alpha]
+        self._last_material = None
         self.update()
     
     def mousePressEvent(self, event):
@@ -507,9 +670,7 @@ class OpenGLViewer(QOpenGLWidget):
         
         # Desfazer transformações da câmera para voltar ao espaço do mundo
         # A luz está fixa no espaço do mundo, não acompanha o objeto
-        glRotatef(-self.camera_rot_y, 0.0, 1.0, 0.0)
-        glRotatef(-self.camera_rot_x, 1.0, 0.0, 0.0)
-        glTranslatef(0.0, 0.0, self.camera_distance)
+        glMultMatrixf(self._inv_view_matrix)
         
         # Desabilitar iluminação temporariamente para desenhar a luz
         glDisable(GL_LIGHTING)
@@ -522,62 +683,26 @@ class OpenGLViewer(QOpenGLWidget):
         # Desenhar esfera brilhante amarela
         glColor3f(1.0, 1.0, 0.6)  # Amarelo brilhante
         
-        # Desenhar esfera simples (usando gluSphere se disponível)
+        # Desenhar esfera e raios a partir dos buffers montados em initializeGL
         try:
-            import math
-            # Criar uma esfera usando primitivas
-            slices = 20
-            stacks = 20
-            radius = 10.0
+            glEnableClientState(GL_VERTEX_ARRAY)
             
             # Desenhar esfera
-            glBegin(GL_TRIANGLES)
-            for i in range(stacks):
-                lat1 = math.pi * (-0.5 + float(i) / stacks)
-                lat2 = math.pi * (-0.5 + float(i + 1) / stacks)
-                z1 = math.sin(lat1) * radius
-                z2 = math.sin(lat2) * radius
-                r1 = math.cos(lat1) * radius
-                r2 = math.cos(lat2) * radius
-                
-                for j in range(slices):
-                    lng1 = 2.0 * math.pi * float(j) / slices
-                    lng2 = 2.0 * math.pi * float(j + 1) / slices
-                    x1 = math.cos(lng1) * r1
-                    y1 = math.sin(lng1) * r1
-                    x2 = math.cos(lng2) * r1
-                    y2 = math.sin(lng2) * r1
-                    x3 = math.cos(lng1) * r2
-                    y3 = math.sin(lng1) * r2
-                    x4 = math.cos(lng2) * r2
-                    y4 = math.sin(lng2) * r2
-                    
-                    # Primeiro triângulo
-                    glVertex3f(x1, y1, z1)
-                    glVertex3f(x2, y2, z1)
-                    glVertex3f(x3, y3, z2)
-                    
-                    # Segundo triângulo
-                    glVertex3f(x2, y2, z1)
-                    glVertex3f(x4, y4, z2)
-                    glVertex3f(x3, y3, z2)
-            glEnd()
+            glBindBuffer(GL_ARRAY_BUFFER, self._light_sphere_vbo)
+            glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._light_sphere_ibo)
+            glDrawElements(GL_TRIANGLES, self._light_sphere_count, GL_UNSIGNED_INT, None)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
             
             # Desenhar raios de luz (linhas)
             glColor3f(1.0, 1.0, 0.8)  # Amarelo mais claro para raios
             glLineWidth(2.0)
-            glBegin(GL_LINES)
-            num_rays = 8
-            for i in range(num_rays):
-                angle = 2.0 * math.pi * i / num_rays
-                ray_length = 15.0
-                x_end = math.cos(angle) * ray_length
-                y_end = math.sin(angle) * ray_length
-                glVertex3f(0, 0, 0)
-                glVertex3f(x_end, y_end, 0)
-                glVertex3f(0, 0, 0)
-                glVertex3f(0, 0, ray_length)
-            glEnd()
+            glBindBuffer(GL_ARRAY_BUFFER, self._light_rays_vbo)
+            glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+            glDrawArrays(GL_LINES, 0, self._light_rays_count)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            
+            glDisableClientState(GL_VERTEX_ARRAY)
             
         except Exception:
             # Fallback: desenhar um cubo simples se houver problema
@@ -1,78 +1,200 @@
 ﻿from typing import List, Tuple
+import numpy as np
 
 Point = Tuple[int, int]
-Span = Tuple[int, int, int]  # (y, x_start, x_end)
+Span = Tuple[int, int, int]  # (y, x_start, x_end), one row of the span array
 
 
-class Edge:
-    def __init__(self, y_max: int, x_of_y_min: float, inv_slope: float):
-        self.y_max = y_max
-        self.x = x_of_y_min
-        self.inv_slope = inv_slope
+def points_collinear(pts: np.ndarray) -> bool:
+    # Exact integer collinearity test for an (n, 2) int64 array of points.
+    # Leading duplicates of pts[0] are skipped when picking the reference line.
+    distinct = np.flatnonzero(np.any(pts[1:] != pts[0], axis=1))
+    if distinct.size == 0:
+        return True
+    k = int(distinct[0]) + 1
 
-    def step(self):
-        self.x += self.inv_slope
+    x1, y1 = pts[0].tolist()
+    x2, y2 = pts[k].tolist()
+    dx = x2 - x1
+    dy = y2 - y1
+
+    # common case: the first tested point is already off the line
+    if k + 1 < len(pts):
+        x3, y3 = pts[k + 1].tolist()
+        if dx * (y3 - y1) - (x3 - x1) * dy != 0:
+            return False
+
+    dn = pts[k + 2:] - pts[0]
+    return not np.any(dx * dn[:, 1] - dy * dn[:, 0])
 
 
 def build_edge_table(points: List[Point]):
-    # Build Edge Table (ET) as dict: y_min -> list[Edge]
-    if not points:
-        return {}, 0, 0
-    n = len(points)
-    y_min_all = min(p[1] for p in points)
-    y_max_all = max(p[1] for p in points)
-    ET = {}
-
-    for i in range(n):
-        x0, y0 = points[i]
-        x1, y1 = points[(i + 1) % n]
-        # ignore horizontal edges per standard scanline rules
-        if y0 == y1:
-            continue
-        if y0 < y1:
-            y_min = y0
-            y_max = y1
-            x_at_y_min = x0
-        else:
-            y_min = y1
-            y_max = y0
-            x_at_y_min = x1
-        inv_slope = (x1 - x0) / (y1 - y0)
-        edge = Edge(y_max=y_max, x_of_y_min=float(x_at_y_min), inv_slope=float(inv_slope))
-        ET.setdefault(y_min, []).append(edge)
+    # Build Edge Table (ET) as structure-of-arrays columns, one entry per
+    # non-horizontal edge: y_min, y_max, x at y_min and inverse slope.
+    # Edges are ordered by y_min, so each scanline's bucket is a contiguous run.
+    if len(points) == 0:
+        return None, 0, 0
+    p = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    y_min_all = int(p[:, 1].min())
+    y_max_all = int(p[:, 1].max())
+
+    p_next = np.roll(p, -1, axis=0)
+    dy = p_next[:, 1] - p[:, 1]
+    # ignore horizontal edges per standard scanline rules
+    keep = dy != 0
+    p, p_next, dy = p[keep], p_next[keep], dy[keep]
+    inv_slopes = (p_next[:, 0] - p[:, 0]) / dy
+    upward = dy > 0
+    y_mins = np.where(upward, p[:, 1], p_next[:, 1])
+    y_maxs = np.where(upward, p_next[:, 1], p[:, 1])
+    xs = np.where(upward, p[:, 0], p_next[:, 0]).astype(np.float64)
+
+    order = np.argsort(y_mins, kind='stable')
+    ET = (y_mins[order], y_maxs[order], xs[order], inv_slopes[order])
     return ET, y_min_all, y_max_all
 
 
-def build_edge_table_and_fill(points: List[Point]) -> List[Span]:
-    ET, y_min, y_max = build_edge_table(points)
-    if not ET and not points:
-        return []
+def _edge_xs(x0: float, inv_slope: float, count: int) -> np.ndarray:
+    # x of an edge on `count` consecutive scanlines, accumulated step by step
+    # (sequential cumsum), i.e. x += inv_slope once per scanline
+    steps = np.full(count, inv_slope)
+    steps[0] = x0
+    return np.cumsum(steps)
+
+
+def fill_triangle(points) -> np.ndarray:
+    # Triangle fast path: no edge table, spans as an (n, 3) int32 array.
+    # Same coverage rules as build_edge_table_and_fill: an edge is active for
+    # y_min <= y < y_max, spans go from ceil(x_left) to floor(x_right).
+    (xa, ya), (xb, yb), (xc, yc) = sorted((tuple(p) for p in points), key=lambda p: p[1])
+    if ya == yc:
+        return np.empty((0, 3), dtype=np.int32)
+
+    ys = np.arange(ya, yc)
+    x_long = _edge_xs(xa, (xc - xa) / (yc - ya), yc - ya)
+    # short edges: a->b above yb, b->c from yb on (horizontal edges never apply)
+    x_short = np.empty(len(ys))
+    if yb != ya:
+        x_short[:yb - ya] = _edge_xs(xa, (xb - xa) / (yb - ya), yb - ya)
+    if yc != yb:
+        x_short[yb - ya:] = _edge_xs(xb, (xc - xb) / (yc - yb), yc - yb)
+
+    x_start = np.ceil(np.minimum(x_long, x_short)).astype(np.int32)
+    x_end = np.floor(np.maximum(x_long, x_short)).astype(np.int32)
+    keep = x_end >= x_start
+    return np.column_stack((ys[keep], x_start[keep], x_end[keep])).astype(np.int32)
+
+
+class PolygonFiller:
+    # Scanline filler that keeps its work buffers between calls, for polygons
+    # refilled many times per second (animation, interactive drag). Buffers
+    # are sized to the most edge/scanline intersections seen so far, growing
+    # by doubling, so the steady state barely allocates. fill() returns a view
+    # into the span buffer that is only valid until the next call.
 
-    AET: List[Edge] = []
-    spans: List[Span] = []
+    def __init__(self):
+        self._cap = 0
+        self._ys = None     # intersection y per edge/scanline (int64)
+        self._x = None      # intersection x per edge/scanline (float64)
+        self._acc = None    # padded cumsum scratch, reused for sorted x
+        self._rows = None   # padded y scratch, reused for sorted y
+        self._spans = None  # (y, x_start, x_end) rows, int32
 
-    for y in range(y_min, y_max + 1):
-        # Move edges starting at y into AET
-        if y in ET:
-            AET.extend(ET[y])
-        # Remove edges where y == y_max
-        AET = [e for e in AET if y < e.y_max]
-        # Sort AET by current x
-        AET.sort(key=lambda e: e.x)
+    def _reserve(self, n: int):
+        if n <= self._cap:
+            return
+        cap = max(n, 2 * self._cap, 64)
+        self._ys = np.empty(cap, dtype=np.int64)
+        self._x = np.empty(cap)
+        # padded groups hold less than twice their useful entries
+        self._acc = np.empty(2 * cap)
+        self._rows = np.empty(2 * cap, dtype=np.int64)
+        # every span consumes two intersections
+        self._spans = np.empty((cap // 2 + 1, 3), dtype=np.int32)
+        self._cap = cap
+
+    def _edge_intersections(self, y_mins: np.ndarray, counts: np.ndarray, xs: np.ndarray,
+                            inv_slopes: np.ndarray, ys_out: np.ndarray, x_out: np.ndarray):
+        # (y, x) of every edge on each of its `counts` scanlines. Edges are grouped
+        # by power-of-two scanline count and each group is accumulated as a padded
+        # 2D cumsum along its rows (sequential per edge, same values as _edge_xs);
+        # the padding never exceeds the useful entries.
+        group = np.log2(np.maximum(counts, 1)).astype(np.int64)
+        pos = 0
+        for g in np.unique(group[counts > 0]).tolist():
+            sel = np.flatnonzero((group == g) & (counts > 0))
+            width = int(counts[sel].max())
+            size = len(sel) * width
+            acc = self._acc[:size].reshape(len(sel), width)
+            acc[:] = inv_slopes[sel, None]
+            acc[:, 0] = xs[sel]
+            np.cumsum(acc, axis=1, out=acc)
+            offsets = np.arange(width)
+            rows = self._rows[:size].reshape(len(sel), width)
+            np.add(y_mins[sel, None], offsets, out=rows)
+            mask = (offsets < counts[sel, None]).ravel()
+            n = int(counts[sel].sum())
+            np.compress(mask, rows.ravel(), out=ys_out[pos:pos + n])
+            np.compress(mask, acc.ravel(), out=x_out[pos:pos + n])
+            pos += n
+
+    def _scanline_spans(self, ys: np.ndarray, x: np.ndarray) -> np.ndarray:
+        # All (y, x) intersections are sorted and paired inside each scanline:
+        # no per-scanline Python work.
+        order = np.lexsort((x, ys))
+        ys = np.take(ys, order, out=self._rows[:len(ys)], mode='clip')
+        x = np.take(x, order, out=self._acc[:len(x)], mode='clip')
+
+        # rank of each intersection inside its scanline; even ranks open a span
+        idx = np.arange(len(ys))
+        first = np.empty(len(ys), dtype=bool)
+        first[0] = True
+        first[1:] = ys[1:] != ys[:-1]
+        rank = idx - np.maximum.accumulate(np.where(first, idx, 0))
+        left = np.flatnonzero(rank % 2 == 0)
+        left = left[(left + 1 < len(ys))]
+        left = left[ys[left + 1] == ys[left]]
 
-        # Pair up intersections to form spans
-        x_list = [e.x for e in AET]
         # Round to int pixel coverage using ceil for start, floor for end
-        for i in range(0, len(x_list), 2):
-            if i + 1 >= len(x_list):
-                break
-            x_start = int(round(x_list[i] + 0.5)) if x_list[i] % 1 != 0 else int(x_list[i])
-            x_end = int(round(x_list[i + 1] - 0.5)) if x_list[i + 1] % 1 != 0 else int(x_list[i + 1])
-            if x_end >= x_start:
-                spans.append((y, x_start, x_end))
-
-        # Increment x by inverse slope for active edges
-        for e in AET:
-            e.step()
-
-    return spans
+        x_start = np.ceil(x[left]).astype(np.int64)
+        x_end = np.floor(x[left + 1]).astype(np.int64)
+        keep = x_end >= x_start
+        spans = self._spans[:np.count_nonzero(keep)]
+        spans[:, 0] = ys[left][keep]
+        spans[:, 1] = x_start[keep]
+        spans[:, 2] = x_end[keep]
+        return spans
+
+    def fill(self, points: List[Point]) -> np.ndarray:
+        # Spans as an (n, 3) int32 view of (y, x_start, x_end) rows. Each edge is
+        # active for y_min <= y < y_max.
+        ET, y_min, y_max = build_edge_table(points)
+        if ET is None or len(ET[0]) == 0:
+            return np.empty((0, 3), dtype=np.int32)
+
+        y_mins, y_maxs, xs, inv_slopes = ET
+        counts = y_maxs - y_mins
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty((0, 3), dtype=np.int32)
+        self._reserve(total)
+        ys, x = self._ys[:total], self._x[:total]
+        self._edge_intersections(y_mins, counts, xs, inv_slopes, ys, x)
+        return self._scanline_spans(ys, x)
+
+
+# shared instance behind build_edge_table_and_fill
+_filler = PolygonFiller()
+
+
+def build_edge_table_and_fill(points: List[Point], dtype=np.int32) -> np.ndarray:
+    # Spans as an (n, 3) array of (y, x_start, x_end) rows, int32 by default.
+    # A narrower dtype (e.g. np.int16) is used only when every coordinate fits
+    # in it; otherwise the spans stay int32. The result is copied out of the
+    # shared filler's buffers, so it stays valid across later calls.
+    spans = _filler.fill(points)
+    if np.dtype(dtype) != spans.dtype:
+        info = np.iinfo(dtype)
+        if len(spans) == 0 or (spans.min() >= info.min and spans.max() <= info.max):
+            return spans.astype(dtype)
+    return spans.copy()
@@ -2,6 +2,7 @@
 Algoritmo de Scan Line para renderização com Phong Shading (Verdadeiro)
 """
 from typing import List, Tuple, Optional
+import functools
 import math
 from PyQt5.QtGui import QImage, QColor
 import geometry3d as geo3d
@@ -11,6 +12,53 @@ Point3D = Tuple[float, float, float]
 Point2D = Tuple[float, float]
 ColorRGB = Tuple[float, float, float]
 
+# Resolução da tabela do fator especular (R·V)^brilho: erro abaixo de 1/4 de nível de cor
+# mesmo com brilho 128
+_SPECULAR_LUT_SIZE = 65536
+
+# Fragmentos sombreados por vez em _rasterize_rows
+_FRAGMENT_BLOCK = 16384
+
+
+def _edge_x(x_start: np.ndarray, dx: np.ndarray, dy: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """X em pixels de bordas na linha k (a partir de x_start, com inclinação dx/dy, dy > 0),
+    só com aritmética inteira; empates arredondam para o par, como round()"""
+    x, rest = np.divmod(2 * k * dx + dy, 2 * dy)
+    x -= (rest == 0) & ((x + x_start) % 2 == 1)
+    return x_start + x
+
+
+@functools.lru_cache(maxsize=16)
+def _specular_lut(shininess: float) -> np.ndarray:
+    """Tabela de x^brilho para x em [0, 1], com _SPECULAR_LUT_SIZE + 1 amostras; uma por
+    brilho, compartilhada entre renderizadores (somente leitura)"""
+    x = np.linspace(0.0, 1.0, _SPECULAR_LUT_SIZE + 1)
+    lut = np.power(x, shininess).astype(np.float32)
+    lut.flags.writeable = False
+    return lut
+
+
+def _pack_rgb(r, g, b):
+    """Empacota canais 0-255 (inteiros ou arrays uint32) num pixel ARGB32 opaco 0xFFRRGGBB"""
+    return 0xFF000000 | (r << 16) | (g << 8) | b
+
+
+def _round_points(points_2d) -> np.ndarray:
+    """Arredonda vértices projetados para pixels (int32), como int(round(v))"""
+    return np.round(np.asarray(points_2d, dtype=np.float64)).astype(np.int32)
+
+
+def unit_normals(normals) -> np.ndarray:
+    """Normaliza um array (..., 3) de normais (float32), para fazer uma vez ao carregar a malha;
+    normais nulas viram (0, 0, 1)"""
+    normals = np.asarray(normals, dtype=np.float32)
+    length2 = np.einsum('...i,...i->...', normals, normals)[..., None]
+    unit = np.empty_like(normals)
+    unit[...] = (0.0, 0.0, 1.0)
+    with np.errstate(divide='ignore'):
+        np.multiply(normals, 1.0 / np.sqrt(length2), out=unit, where=length2 > 1e-12)
+    return unit
+
 
 class ScanLinePhong:
     """Renderizador Scan Line com Phong Shading Verdadeiro (iluminação por pixel)"""
@@ -19,10 +67,22 @@ class ScanLinePhong:
         self.width = width
         self.height = height
         self.image = QImage(width, height, QImage.Format_RGB32)
-        # Usar numpy array para depth buffer (muito mais rápido)
-        self.depth_buffer = np.full((height, width), np.inf, dtype=np.float32)
+        self.image.fill(0)
+        # Pixels da imagem como array numpy (H, W) de uint32 0xFFRRGGBB, escrito diretamente
+        bits = self.image.bits()
+        bits.setsize(self.image.byteCount())
+        # (linhas de 32 bits por pixel não têm preenchimento)
+        self.pixels = np.frombuffer(bits, dtype=np.uint32).reshape(height, width)
+        # Depth buffer de 16 bits (metade da memória de float32): Z mapeado linearmente
+        # de [z_near, z_far] para 0..65534; 65535 é o fundo vazio
+        self.depth_buffer = np.full((height, width), 65535, dtype=np.uint16)
+        self.set_depth_range(-1000.0, 1000.0)
+        # Vistas 1D dos dois buffers: fragmentos endereçados por y * largura + x
+        self._pixels_flat = self.pixels.reshape(-1)
+        self._depth_flat = self.depth_buffer.reshape(-1)
         
-        # Flag para usar shading simplificado (sem especular)
+        # Flag para usar shading simplificado (sem especular). Nesse caso ambiente + difusa
+        # variam pouco no triângulo: a cor é calculada nos vértices e interpolada (Gouraud)
         self.use_simple_shading = use_simple_shading
         
         # Propriedades de iluminação
@@ -40,30 +100,70 @@ class ScanLinePhong:
         # Posição do observador (para cálculo do vetor de vista)
         self.viewer_position = np.array([0.0, 0.0, 300.0], dtype=np.float32)
         
-        # Cache de valores pré-calculados
-        self._ambient_color = self.light_ambient * self.material_ambient
+        # Cache de valores pré-calculados (constantes enquanto o material não muda)
+        self._ambient_color = np.empty(3, dtype=np.float32)
+        self._diffuse_color = np.empty(3, dtype=np.float32)
+        self._specular_color = np.empty(3, dtype=np.float32)
+        self._update_material_colors()
+        
+        # Malha guardada por prepare_mesh (SoA por triângulo)
+        self._mesh_points_2d: Optional[np.ndarray] = None
+        self._mesh_verts_3d: Optional[np.ndarray] = None
+        self._mesh_normals: Optional[np.ndarray] = None
+        
+        # Buffers de fragmentos reaproveitados entre chamadas (crescem por dobra)
+        self._frag_capacity = 0
+        self._reserve_fragments(4096)
+        # Posição 3D + normal interpoladas de um bloco de fragmentos
+        self._frag_attr = np.empty((_FRAGMENT_BLOCK, 6), dtype=np.float32)
+        self._frag_step = np.empty((_FRAGMENT_BLOCK, 6), dtype=np.float32)
+    
+    def _reserve_fragments(self, n: int):
+        """Garante buffers de rasterização para pelo menos n fragmentos"""
+        if n <= self._frag_capacity:
+            return
+        cap = max(n, 2 * self._frag_capacity)
+        self._frag_iota = np.arange(cap, dtype=np.int64)
+        self._frag_offset = np.empty(cap, dtype=np.int64)
+        self._frag_pixel = np.empty(cap, dtype=np.int64)
+        self._frag_t = np.empty(cap, dtype=np.float32)
+        self._frag_z = np.empty(cap, dtype=np.float32)
+        self._frag_capacity = cap
     
     def clear(self, bg_color: QColor = QColor(20, 20, 30)):
         """Limpa o buffer de imagem e depth buffer"""
         self.image.fill(bg_color)
-        self.depth_buffer.fill(np.inf)
+        self.depth_buffer.fill(65535)
+    
+    def set_depth_range(self, z_near: float, z_far: float):
+        """Define o intervalo de Z guardado no depth buffer; Z fora dele é saturado nos extremos"""
+        self._z_near = float(z_near)
+        self._z_scale = 65534.0 / (float(z_far) - self._z_near)
     
     def set_light_position(self, x: float, y: float, z: float):
         """Define posição da fonte de luz"""
-        self.light_position = np.array([x, y, z], dtype=np.float32)
+        self.light_position[:] = (x, y, z)
     
     def set_viewer_position(self, x: float, y: float, z: float):
         """Define posição do observador (câmera)"""
-        self.viewer_position = np.array([x, y, z], dtype=np.float32)
+        self.viewer_position[:] = (x, y, z)
     
     def set_material_properties(self, ambient: ColorRGB, diffuse: ColorRGB, 
                                specular: ColorRGB, shininess: float):
         """Define propriedades do material"""
-        self.material_ambient = np.array(ambient, dtype=np.float32)
-        self.material_diffuse = np.array(diffuse, dtype=np.float32)
-        self.material_specular = np.array(specular, dtype=np.float32)
+        # Arrays reaproveitados (atribuição no lugar, sem alocar a cada chamada)
+        self.material_ambient[:] = ambient
+        self.material_diffuse[:] = diffuse
+        self.material_specular[:] = specular
         self.material_shininess = shininess
-        self._ambient_color = self.light_ambient * self.material_ambient
+        self._update_material_colors()
+    
+    def _update_material_colors(self):
+        """Recalcula os produtos luz * material e a tabela especular do brilho atual"""
+        np.multiply(self.light_ambient, self.material_ambient, out=self._ambient_color)
+        np.multiply(self.light_diffuse, self.material_diffuse, out=self._diffuse_color)
+        np.multiply(self.light_specular, self.material_specular, out=self._specular_color)
+        self._specular_table = _specular_lut(float(self.material_shininess))
     
     def phong_shading(self, normal: np.ndarray, pos3d: np.ndarray) -> np.ndarray:
         """
@@ -77,280 +177,319 @@ class ScanLinePhong:
         Returns:
             Cor RGB (0.0-1.0) como array numpy
         """
-        # Normal já deve estar normalizada, mas garantir
-        normal_len = np.linalg.norm(normal)
-        if normal_len < 1e-6:
-            return self._ambient_color
-        if abs(normal_len - 1.0) > 1e-3:
-            normal = normal / normal_len
+        # Sem desvios por pixel: normalizar sempre (comprimento mínimo evita
+        # divisão por zero) e anular difusa/especular com máscaras
+        normal_len2 = np.dot(normal, normal)
+        normal = normal * (1.0 / math.sqrt(max(normal_len2, 1e-30)))
         
         # Vetor da luz (da posição do ponto até a luz)
         light_vec = self.light_position - pos3d
-        light_len = np.linalg.norm(light_vec)
-        if light_len < 1e-6:
-            return self._ambient_color
-        light_vec = light_vec / light_len
+        light_len2 = np.dot(light_vec, light_vec)
+        light_vec *= 1.0 / math.sqrt(max(light_len2, 1e-30))
         
-        # N·L (produto escalar)
+        # N·L; normal nula, luz sobre o ponto ou superfície de costas: só ambiente
         N_dot_L = np.dot(normal, light_vec)
-        if N_dot_L < 0:
-            # Superfície não está voltada para a luz
-            return self._ambient_color
+        lit = (normal_len2 >= 1e-12) * (light_len2 >= 1e-12) * (N_dot_L >= 0)
         
         # Componente Difusa
-        I_diff = self.light_diffuse * self.material_diffuse * N_dot_L
+        final_color = self._ambient_color + self._diffuse_color * (max(N_dot_L, 0.0) * lit)
         
-        if self.use_simple_shading:
-            # Versão simplificada: apenas ambiente + difusa
-            final_color = self._ambient_color + I_diff
-        else:
+        if not self.use_simple_shading:
             # Componente Especular (Phong completo)
-            # Vetor do observador
             view_vec = self.viewer_position - pos3d
-            view_len = np.linalg.norm(view_vec)
-            if view_len < 1e-6:
-                final_color = self._ambient_color + I_diff
-            else:
-                view_vec = view_vec / view_len
-                
-                # Vetor de reflexão: R = 2(N·L)N - L
-                reflection_vec = normal * (2.0 * N_dot_L) - light_vec
-                reflection_len = np.linalg.norm(reflection_vec)
-                if reflection_len > 1e-6:
-                    reflection_vec = reflection_vec / reflection_len
-                    
-                    # R·V (produto escalar)
-                    R_dot_V = np.dot(reflection_vec, view_vec)
-                    if R_dot_V > 0:
-                        specular_factor = math.pow(R_dot_V, self.material_shininess)
-                        I_spec = self.light_specular * self.material_specular * specular_factor
-                        final_color = self._ambient_color + I_diff + I_spec
-                    else:
-                        final_color = self._ambient_color + I_diff
-                else:
-                    final_color = self._ambient_color + I_diff
+            view_len2 = np.dot(view_vec, view_vec)
+            # Vetor de reflexão: R = 2(N·L)N - L
+            reflection_vec = normal * (2.0 * N_dot_L) - light_vec
+            reflection_len2 = np.dot(reflection_vec, reflection_vec)
+            R_dot_V = np.dot(reflection_vec, view_vec) / math.sqrt(max(reflection_len2 * view_len2, 1e-30))
+            has_spec = lit * (view_len2 >= 1e-12) * (reflection_len2 > 1e-12) * (R_dot_V > 0)
+            specular_factor = math.pow(min(max(R_dot_V, 0.0), 1.0), self.material_shininess) * has_spec
+            final_color += self._specular_color * specular_factor
         
         # Clamp para [0, 1]
         return np.clip(final_color, 0.0, 1.0)
     
+    def phong_shading_batch(self, normals: np.ndarray, pos3d: np.ndarray) -> np.ndarray:
+        """
+        Calcula iluminação Phong para vários pixels de uma vez (mesmo modelo de phong_shading)
+        
+        Args:
+            normals: Normais interpoladas dos pixels, array (K, 3)
+            pos3d: Posições 3D interpoladas dos pixels, array (K, 3)
+            
+        Returns:
+            Cores RGB (0.0-1.0) como array (K, 3)
+        """
+        # Normalizar multiplicando pelo inverso da raiz dos comprimentos ao quadrado;
+        # o comprimento mínimo evita divisão por zero sem precisar de desvios
+        normal_len2 = np.einsum('ij,ij->i', normals, normals)
+        light_vec = self.light_position - pos3d
+        light_len2 = np.einsum('ij,ij->i', light_vec, light_vec)
+        normals = normals * (1.0 / np.sqrt(np.maximum(normal_len2, 1e-30)))[:, None]
+        light_vec *= (1.0 / np.sqrt(np.maximum(light_len2, 1e-30)))[:, None]
+        
+        # N·L; normal nula, luz sobre o ponto ou superfície de costas: só ambiente
+        N_dot_L = np.einsum('ij,ij->i', normals, light_vec)
+        lit = (normal_len2 >= 1e-12) & (light_len2 >= 1e-12) & (N_dot_L >= 0)
+        diffuse_factor = np.maximum(N_dot_L, 0.0) * lit
+        
+        # Ambiente + difusa
+        final_color = self._ambient_color + self._diffuse_color * diffuse_factor[:, None]
+        
+        if not self.use_simple_shading:
+            # Componente Especular (Phong completo)
+            view_vec = self.viewer_position - pos3d
+            view_len2 = np.einsum('ij,ij->i', view_vec, view_vec)
+            # Vetor de reflexão: R = 2(N·L)N - L
+            reflection_vec = normals * (2.0 * N_dot_L)[:, None] - light_vec
+            reflection_len2 = np.einsum('ij,ij->i', reflection_vec, reflection_vec)
+            R_dot_V = np.einsum('ij,ij->i', reflection_vec, view_vec) / np.sqrt(np.maximum(reflection_len2 * view_len2, 1e-30))
+            has_spec = lit & (view_len2 >= 1e-12) & (reflection_len2 > 1e-12) & (R_dot_V > 0)
+            # (R·V)^brilho pela tabela: uma leitura por pixel em vez de um pow
+            lut_index = (np.clip(R_dot_V, 0.0, 1.0) * _SPECULAR_LUT_SIZE + 0.5).astype(np.intp)
+            specular_factor = self._specular_table[lut_index] * has_spec
+            final_color += self._specular_color * specular_factor[:, None]
+        
+        # Clamp para [0, 1]
+        return np.clip(final_color, 0.0, 1.0)
+    
+    def _rasterize_rows(self, ys: np.ndarray, x_left: np.ndarray, x_right: np.ndarray,
+                        attr_left: np.ndarray, attr_right: np.ndarray,
+                        triangle: Optional[np.ndarray] = None):
+        """
+        Pinta de uma vez todas as linhas de um ou mais triângulos
+        
+        Args:
+            ys: Linhas (dentro da imagem), array (n,)
+            x_left, x_right: X (pixel) das bordas em cada linha, arrays inteiros (n,)
+            attr_left, attr_right: Posição 3D e normal (x, y, z, nx, ny, nz) das bordas, arrays (n, 6);
+                em shading simplificado, posição 3D e cor RGB (0.0-1.0)
+            triangle: Ordem de desenho do triângulo de cada linha, array (n,); None se as
+                linhas são de um único triângulo (sem pixels repetidos)
+        """
+        lo = np.minimum(x_left, x_right)
+        hi = np.maximum(x_left, x_right)
+        x_start_clamped = np.maximum(lo, 0)
+        x_end_clamped = np.minimum(hi + 1, self.width)
+        # Linhas com um único pixel (ou fora da imagem) não são desenhadas
+        counts = np.where(hi > lo, np.maximum(x_end_clamped - x_start_clamped, 0), 0)
+        total = int(counts.sum())
+        if total == 0:
+            return
+        
+        # Um fragmento por pixel coberto: linha e deslocamento t a partir de x_start,
+        # montados nos buffers pré-alocados
+        self._reserve_fragments(total)
+        row = np.repeat(np.arange(len(ys)), counts)
+        first = np.cumsum(counts) - counts
+        offset = np.subtract(self._frag_iota[:total], first[row], out=self._frag_offset[:total])
+        offset += (x_start_clamped - lo)[row]
+        pixel = np.take(ys * self.width + lo, row, out=self._frag_pixel[:total])
+        pixel += offset
+        t = self._frag_t[:total]
+        t[:] = offset
+        
+        # Interpolação horizontal das bordas esquerda -> direita
+        dx = np.maximum(hi - lo, 1).astype(np.float32)
+        step = (attr_right - attr_left) / dx[:, None]
+        z = np.take(step[:, 2], row, out=self._frag_z[:total])
+        z *= t
+        z += attr_left[row, 2]
+        # Profundidade quantizada para o depth buffer de 16 bits
+        z -= self._z_near
+        z *= self._z_scale
+        z = np.clip(z, 0.0, 65534.0, out=z).astype(np.uint16)
+        
+        # Teste de profundidade antecipado: fragmentos atrás do que já está no depth buffer
+        # (objetos desenhados antes) são descartados antes de ordenar e sombrear
+        visible = z < self._depth_flat[pixel]
+        if not visible.any():
+            return
+        row, t, z, pixel = row[visible], t[visible], z[visible], pixel[visible]
+        
+        if triangle is not None:
+            # Triângulos diferentes podem cobrir o mesmo pixel: cada pixel fica só com o
+            # fragmento mais próximo (no empate, o do triângulo desenhado primeiro), o mesmo
+            # resultado de desenhá-los um a um com teste de profundidade
+            order = np.lexsort((triangle[row], z, pixel))
+            sorted_pixel = pixel[order]
+            nearest = np.empty(len(order), dtype=bool)
+            nearest[0] = True
+            nearest[1:] = sorted_pixel[1:] != sorted_pixel[:-1]
+            order = order[nearest]
+            row, t, z, pixel = row[order], t[order], z[order], sorted_pixel[nearest]
+        
+        self._depth_flat[pixel] = z
+        
+        ambient = (np.clip(self._ambient_color, 0.0, 1.0) * 255).astype(np.uint32)
+        ambient_packed = _pack_rgb(*ambient.tolist())
+        
+        # Interpolar, sombrear e escrever em blocos de linhas consecutivas: os temporários
+        # de cada bloco cabem no cache em vez de percorrer arrays do tamanho da imagem
+        for begin in range(0, len(row), _FRAGMENT_BLOCK):
+            block = slice(begin, begin + _FRAGMENT_BLOCK)
+            block_row, block_t = row[block], t[block]
+            block_count = len(block_row)
+            attr = np.take(step, block_row, axis=0, out=self._frag_attr[:block_count])
+            attr *= block_t[:, None]
+            attr += np.take(attr_left, block_row, axis=0, out=self._frag_step[:block_count])
+            
+            if self.use_simple_shading:
+                # Cor já interpolada dos vértices: só empacotar
+                color = (attr[:, 3:] * 255).astype(np.uint32)
+                self._pixels_flat[pixel[block]] = _pack_rgb(color[:, 0], color[:, 1], color[:, 2])
+                continue
+            
+            # Fragmentos de costas para a luz (N·L < 0) ficam todos com a mesma cor ambiente:
+            # preenchidos com o valor já empacotado, sem passar pelo sombreamento
+            normals, pos3d = attr[:, 3:], attr[:, :3]
+            facing = np.einsum('ij,ij->i', normals, self.light_position - pos3d) >= 0
+            packed = np.full(block_count, ambient_packed, dtype=np.uint32)
+            
+            # PHONG VERDADEIRO: calcular iluminação por pixel
+            if facing.any():
+                color = (self.phong_shading_batch(normals[facing], pos3d[facing]) * 255).astype(np.uint32)
+                packed[facing] = _pack_rgb(color[:, 0], color[:, 1], color[:, 2])
+            
+            # Desenhar pixels direto no buffer da imagem
+            self._pixels_flat[pixel[block]] = packed
+    
     def render_triangle(self, v0_2d: Point2D, v1_2d: Point2D, v2_2d: Point2D,
                        v0_3d: Point3D, v1_3d: Point3D, v2_3d: Point3D,
                        n0: Point3D, n1: Point3D, n2: Point3D):
         """
         Renderiza um triângulo usando scan line com Phong shading VERDADEIRO
         
-        Phong verdadeiro: interpola normais e posições 3D, calcula iluminação por pixel
+        Phong verdadeiro: interpola normais e posições 3D, calcula iluminação por pixel.
+        As normais n0, n1, n2 devem estar normalizadas (ver unit_normals).
+        """
+        self.render_triangles(((v0_2d, v1_2d, v2_2d),), ((v0_3d, v1_3d, v2_3d),), ((n0, n1, n2),))
+    
+    def render_triangles(self, verts_2d: np.ndarray, verts_3d: np.ndarray, normals: np.ndarray):
+        """
+        Renderiza vários triângulos de uma vez, com o mesmo resultado de chamar
+        render_triangle para cada um, em ordem
+        
+        Os fragmentos de todos os triângulos passam juntos pelo teste de profundidade e
+        pelo sombreamento, em vez de um triângulo por vez.
+        
+        Args:
+            verts_2d: Vértices projetados na tela, array (N, 3, 2)
+            verts_3d: Vértices 3D (espaço da câmera), array (N, 3, 3)
+            normals: Normais unitárias dos vértices, array (N, 3, 3); normalizadas uma vez
+                ao montar a malha (unit_normals), não a cada chamada
         """
-        # Converter para numpy arrays
-        points_2d = np.array([
-            [int(round(v0_2d[0])), int(round(v0_2d[1]))],
-            [int(round(v1_2d[0])), int(round(v1_2d[1]))],
-            [int(round(v2_2d[0])), int(round(v2_2d[1]))]
-        ], dtype=np.int32)
-        
-        # Ordenar por Y
-        indices = np.argsort(points_2d[:, 1])
-        p0 = points_2d[indices[0]]
-        p1 = points_2d[indices[1]]
-        p2 = points_2d[indices[2]]
-        
-        # Vértices 3D e normais correspondentes
-        verts_3d = np.array([v0_3d, v1_3d, v2_3d], dtype=np.float32)
-        normals = np.array([n0, n1, n2], dtype=np.float32)
-        
-        v0_3d_sorted = verts_3d[indices[0]]
-        v1_3d_sorted = verts_3d[indices[1]]
-        v2_3d_sorted = verts_3d[indices[2]]
-        n0_sorted = normals[indices[0]]
-        n1_sorted = normals[indices[1]]
-        n2_sorted = normals[indices[2]]
-        
-        y_min, y_mid, y_max = p0[1], p1[1], p2[1]
-        
-        # Caso especial: triângulo degenerado
-        if y_min == y_max:
+        self._render_soa(_round_points(verts_2d),
+                         np.asarray(verts_3d, dtype=np.float32),
+                         np.asarray(normals, dtype=np.float32))
+    
+    def prepare_mesh(self, vertices_2d: np.ndarray, vertices_3d: np.ndarray,
+                     triangles: np.ndarray, normals: np.ndarray):
+        """
+        Guarda uma malha para render_mesh, já no formato do rasterizador (SoA por triângulo)
+        
+        Args:
+            vertices_2d: Vértices projetados na tela, array (V, 2)
+            vertices_3d: Vértices 3D (espaço da câmera), array (V, 3)
+            triangles: Índices dos vértices de cada triângulo, array (N, 3)
+            normals: Normais dos vértices, array (V, 3); normalizadas aqui, uma vez por vértice
+        """
+        triangles = np.asarray(triangles, dtype=np.intp).reshape(-1, 3)
+        self._mesh_points_2d = _round_points(vertices_2d)[triangles]
+        self._mesh_verts_3d = np.asarray(vertices_3d, dtype=np.float32)[triangles]
+        self._mesh_normals = unit_normals(normals)[triangles]
+    
+    def render_mesh(self):
+        """Renderiza a malha guardada por prepare_mesh"""
+        if self._mesh_points_2d is not None:
+            self._render_soa(self._mesh_points_2d, self._mesh_verts_3d, self._mesh_normals)
+    
+    def _render_soa(self, points_2d: np.ndarray, verts_3d: np.ndarray, normals: np.ndarray):
+        """Rasteriza triângulos em SoA: pixels (N, 3, 2) int32, vértices (N, 3, 3) e normais
+        unitárias (N, 3, 3) float32"""
+        if self.use_simple_shading:
+            # Gouraud: sombrear os 3 vértices e interpolar a cor no lugar da normal
+            normals = self.phong_shading_batch(normals.reshape(-1, 3),
+                                               verts_3d.reshape(-1, 3)).reshape(normals.shape)
+        rows = self._mesh_rows(points_2d, verts_3d, normals)
+        if rows is None:
             return
+        if len(points_2d) == 1:
+            # Um único triângulo nunca repete pixels
+            rows = rows[:-1]
+        self._rasterize_rows(*rows)
+    
+    def _mesh_rows(self, points_2d: np.ndarray, verts_3d: np.ndarray, normals: np.ndarray):
+        """
+        Percorre as bordas de todos os triângulos de uma vez (scan line, metades superior e inferior)
+        
+        Returns:
+            (ys, x_esquerda, x_direita, attr_esquerda, attr_direita, triângulo) das linhas dentro
+            da imagem, no formato de _rasterize_rows, ou None se não há linhas a desenhar
+        """
+        # Ordenar os vértices de cada triângulo por Y
+        order = np.argsort(points_2d[:, :, 1], axis=1, kind='stable')[:, :, None]
+        p = np.take_along_axis(points_2d, order, axis=1).astype(np.int64)
+        attr = np.take_along_axis(np.concatenate((verts_3d, normals), axis=2), order, axis=1)
+        
+        # Caso especial: triângulos degenerados
+        triangle = np.flatnonzero(p[:, 0, 1] != p[:, 2, 1])
+        if len(triangle) == 0:
+            return None
+        p, attr = p[triangle], attr[triangle]
+        x0, x1, x2 = p[:, 0, 0], p[:, 1, 0], p[:, 2, 0]
+        y0, y1, y2 = p[:, 0, 1], p[:, 1, 1], p[:, 2, 1]
+        a0, a1, a2 = attr[:, 0], attr[:, 1], attr[:, 2]
+        
+        # Bordas em X com aritmética inteira: cada borda é (x inicial, dx, dy, linhas já
+        # percorridas); posição 3D + normal em float, com início e passo por linha
+        span = y2 - y0
+        attr_long_slope = (a2 - a0) / span.astype(np.float32)[:, None]
+        
+        # Parte superior do triângulo: linhas y0..y1
+        top = np.flatnonzero(y1 != y0)
+        t_factor32 = (1.0 / (y1[top] - y0[top])).astype(np.float32)[:, None]
+        a0_top = a0[top]
+        no_rows = np.zeros(len(top), dtype=np.int64)
+        top_half = (triangle[top], y0[top], y1[top] + 1,
+                    x0[top], x1[top] - x0[top], y1[top] - y0[top], no_rows,
+                    x0[top], x2[top] - x0[top], span[top], no_rows,
+                    a0_top, (a1[top] - a0_top) * t_factor32, a0_top, attr_long_slope[top])
+        
+        # Parte inferior do triângulo: linhas y1+1..y2; a borda longa continua de onde parou
+        bottom = np.flatnonzero(y2 != y1)
+        t_factor32 = (1.0 / (y2[bottom] - y1[bottom])).astype(np.float32)[:, None]
+        a1_bottom, a2_bottom = a1[bottom], a2[bottom]
+        rows_done = y1[bottom] - y0[bottom]
+        attr_right = a0[bottom] + rows_done.astype(np.float32)[:, None] * attr_long_slope[bottom]
+        bottom_half = (triangle[bottom], y1[bottom] + 1, y2[bottom] + 1,
+                       x1[bottom], x2[bottom] - x1[bottom], y2[bottom] - y1[bottom],
+                       np.zeros(len(bottom), dtype=np.int64),
+                       x0[bottom], x2[bottom] - x0[bottom], span[bottom], rows_done,
+                       a1_bottom, (a2_bottom - a1_bottom) * t_factor32,
+                       attr_right, (a2_bottom - attr_right) * t_factor32)
+        
+        (triangle, y_begin, y_end, xl, xl_dx, xl_dy, xl_rows, xr, xr_dx, xr_dy, xr_rows,
+         al, al_slope, ar, ar_slope) = (np.concatenate(column) for column in zip(top_half, bottom_half))
+        
+        # Linhas dentro da imagem. Como no percurso linha a linha, as bordas só avançam
+        # nas linhas visíveis (0 <= y < altura)
+        y_begin = np.maximum(y_begin, 0)
+        count = np.maximum(np.minimum(y_end, self.height) - y_begin, 0)
+        total = int(count.sum())
+        if total == 0:
+            return None
         
-        # Normalizar normais dos vértices
-        n0_len = np.linalg.norm(n0_sorted)
-        if n0_len > 1e-6:
-            n0_sorted = n0_sorted / n0_len
-        else:
-            n0_sorted = np.array([0.0, 0.0, 1.0], dtype=np.float32)
-        
-        n1_len = np.linalg.norm(n1_sorted)
-        if n1_len > 1e-6:
-            n1_sorted = n1_sorted / n1_len
-        else:
-            n1_sorted = np.array([0.0, 0.0, 1.0], dtype=np.float32)
-        
-        n2_len = np.linalg.norm(n2_sorted)
-        if n2_len > 1e-6:
-            n2_sorted = n2_sorted / n2_len
-        else:
-            n2_sorted = np.array([0.0, 0.0, 1.0], dtype=np.float32)
-        
-        # Renderizar parte superior do triângulo
-        if y_mid != y_min:
-            dy = float(y_mid - y_min)
-            if dy > 0:
-                t_factor = 1.0 / dy
-                
-                # Interpolação de X
-                x_left = float(p0[0])
-                x_right = float(p0[0])
-                x_left_inv_slope = (p1[0] - p0[0]) * t_factor
-                x_right_inv_slope = (p2[0] - p0[0]) / float(y_max - y_min) if (y_max - y_min) > 0 else 0.0
-                
-                # Interpolação de Z
-                z_left = v0_3d_sorted[2]
-                z_right = v0_3d_sorted[2]
-                z_left_inv_slope = (v1_3d_sorted[2] - v0_3d_sorted[2]) * t_factor
-                z_right_inv_slope = (v2_3d_sorted[2] - v0_3d_sorted[2]) / float(y_max - y_min) if (y_max - y_min) > 0 else 0.0
-                
-                # Interpolação de posições 3D (para Phong verdadeiro)
-                pos3d_left = v0_3d_sorted.copy()
-                pos3d_right = v0_3d_sorted.copy()
-                pos3d_left_inv_slope = (v1_3d_sorted - v0_3d_sorted) * t_factor
-                pos3d_right_inv_slope = (v2_3d_sorted - v0_3d_sorted) / float(y_max - y_min) if (y_max - y_min) > 0 else np.zeros(3, dtype=np.float32)
-                
-                # Interpolação de normais (PHONG VERDADEIRO - não cores!)
-                normal_left = n0_sorted.copy()
-                normal_right = n0_sorted.copy()
-                normal_left_inv_slope = (n1_sorted - n0_sorted) * t_factor
-                normal_right_inv_slope = (n2_sorted - n0_sorted) / float(y_max - y_min) if (y_max - y_min) > 0 else np.zeros(3, dtype=np.float32)
-                
-                for y in range(y_min, y_mid + 1):
-                    if 0 <= y < self.height:
-                        x_start = int(round(x_left))
-                        x_end = int(round(x_right))
-                        if x_start > x_end:
-                            x_start, x_end = x_end, x_start
-                        
-                        if x_end > x_start:
-                            dx = float(x_end - x_start)
-                            x_start_clamped = max(0, x_start)
-                            x_end_clamped = min(self.width, x_end + 1)
-                            
-                            # Interpolação horizontal
-                            z_step = (z_right - z_left) / dx if dx > 0 else 0.0
-                            pos3d_step = (pos3d_right - pos3d_left) / dx if dx > 0 else np.zeros(3, dtype=np.float32)
-                            normal_step = (normal_right - normal_left) / dx if dx > 0 else np.zeros(3, dtype=np.float32)
-                            
-                            z = z_left + (x_start_clamped - x_start) * z_step
-                            pos3d = pos3d_left + (x_start_clamped - x_start) * pos3d_step
-                            normal = normal_left + (x_start_clamped - x_start) * normal_step
-                            
-                            for x in range(x_start_clamped, x_end_clamped):
-                                # Teste de profundidade
-                                if z < self.depth_buffer[y, x]:
-                                    self.depth_buffer[y, x] = z
-                                    
-                                    # PHONG VERDADEIRO: calcular iluminação por pixel
-                                    color = self.phong_shading(normal, pos3d)
-                                    
-                                    # Desenhar pixel
-                                    r = int(color[0] * 255)
-                                    g = int(color[1] * 255)
-                                    b = int(color[2] * 255)
-                                    self.image.setPixel(x, y, QColor(r, g, b).rgb())
-                                
-                                # Atualizar para próximo pixel
-                                z += z_step
-                                pos3d += pos3d_step
-                                normal += normal_step
-                        
-                        # Atualizar para próxima linha
-                        x_left += x_left_inv_slope
-                        x_right += x_right_inv_slope
-                        z_left += z_left_inv_slope
-                        z_right += z_right_inv_slope
-                        pos3d_left += pos3d_left_inv_slope
-                        pos3d_right += pos3d_right_inv_slope
-                        normal_left += normal_left_inv_slope
-                        normal_right += normal_right_inv_slope
-        
-        # Renderizar parte inferior do triângulo
-        if y_max != y_mid:
-            dy = float(y_max - y_mid)
-            if dy > 0:
-                t_factor = 1.0 / dy
-                
-                # Interpolação de X
-                x_left = float(p1[0])
-                x_right = float(p0[0]) + (y_mid - y_min) * (p2[0] - p0[0]) / float(y_max - y_min) if (y_max - y_min) > 0 else float(p0[0])
-                x_left_inv_slope = (p2[0] - p1[0]) * t_factor
-                x_right_inv_slope = (p2[0] - p0[0]) / float(y_max - y_min) if (y_max - y_min) > 0 else 0.0
-                
-                # Interpolação de Z
-                z_left = v1_3d_sorted[2]
-                z_right = v0_3d_sorted[2] + (y_mid - y_min) * (v2_3d_sorted[2] - v0_3d_sorted[2]) / float(y_max - y_min) if (y_max - y_min) > 0 else v0_3d_sorted[2]
-                z_left_inv_slope = (v2_3d_sorted[2] - v1_3d_sorted[2]) * t_factor
-                z_right_inv_slope = (v2_3d_sorted[2] - v0_3d_sorted[2]) / float(y_max - y_min) if (y_max - y_min) > 0 else 0.0
-                
-                # Interpolação de posições 3D
-                pos3d_left = v1_3d_sorted.copy()
-                pos3d_right_interp = v0_3d_sorted + (y_mid - y_min) * (v2_3d_sorted - v0_3d_sorted) / float(y_max - y_min) if (y_max - y_min) > 0 else v0_3d_sorted
-                pos3d_right = pos3d_right_interp.copy()
-                pos3d_left_inv_slope = (v2_3d_sorted - v1_3d_sorted) * t_factor
-                pos3d_right_inv_slope = (v2_3d_sorted - pos3d_right_interp) * t_factor
-                
-                # Interpolação de normais (PHONG VERDADEIRO)
-                normal_left = n1_sorted.copy()
-                normal_right_interp = n0_sorted + (y_mid - y_min) * (n2_sorted - n0_sorted) / float(y_max - y_min) if (y_max - y_min) > 0 else n0_sorted
-                normal_right = normal_right_interp.copy()
-                normal_left_inv_slope = (n2_sorted - n1_sorted) * t_factor
-                normal_right_inv_slope = (n2_sorted - normal_right_interp) * t_factor
-                
-                for y in range(y_mid + 1, y_max + 1):
-                    if 0 <= y < self.height:
-                        x_start = int(round(x_left))
-                        x_end = int(round(x_right))
-                        if x_start > x_end:
-                            x_start, x_end = x_end, x_start
-                        
-                        if x_end > x_start:
-                            dx = float(x_end - x_start)
-                            x_start_clamped = max(0, x_start)
-                            x_end_clamped = min(self.width, x_end + 1)
-                            
-                            # Interpolação horizontal
-                            z_step = (z_right - z_left) / dx if dx > 0 else 0.0
-                            pos3d_step = (pos3d_right - pos3d_left) / dx if dx > 0 else np.zeros(3, dtype=np.float32)
-                            normal_step = (normal_right - normal_left) / dx if dx > 0 else np.zeros(3, dtype=np.float32)
-                            
-                            z = z_left + (x_start_clamped - x_start) * z_step
-                            pos3d = pos3d_left + (x_start_clamped - x_start) * pos3d_step
-                            normal = normal_left + (x_start_clamped - x_start) * normal_step
-                            
-                            for x in range(x_start_clamped, x_end_clamped):
-                                # Teste de profundidade
-                                if z < self.depth_buffer[y, x]:
-                                    self.depth_buffer[y, x] = z
-                                    
-                                    # PHONG VERDADEIRO: calcular iluminação por pixel
-                                    color = self.phong_shading(normal, pos3d)
-                                    
-                                    # Desenhar pixel
-                                    r = int(color[0] * 255)
-                                    g = int(color[1] * 255)
-                                    b = int(color[2] * 255)
-                                    self.image.setPixel(x, y, QColor(r, g, b).rgb())
-                                
-                                # Atualizar para próximo pixel
-                                z += z_step
-                                pos3d += pos3d_step
-                                normal += normal_step
-                        
-                        # Atualizar para próxima linha
-                        x_left += x_left_inv_slope
-                        x_right += x_right_inv_slope
-                        z_left += z_left_inv_slope
-                        z_right += z_right_inv_slope
-                        pos3d_left += pos3d_left_inv_slope
-                        pos3d_right += pos3d_right_inv_slope
-                        normal_left += normal_left_inv_slope
-                        normal_right += normal_right_inv_slope
+        # Uma entrada por linha: borda e número k da linha visível dentro da borda
+        edge = np.repeat(np.arange(len(count)), count)
+        k = np.arange(total) - (np.cumsum(count) - count)[edge]
+        k32 = k.astype(np.float32)[:, None]
+        return (y_begin[edge] + k,
+                _edge_x(xl[edge], xl_dx[edge], xl_dy[edge], k + xl_rows[edge]),
+                _edge_x(xr[edge], xr_dx[edge], xr_dy[edge], k + xr_rows[edge]),
+                al[edge] + k32 * al_slope[edge],
+                ar[edge] + k32 * ar_slope[edge],
+                triangle[edge])
     
     def get_image(self) -> QImage:
         """Retorna a imagem renderizada"""
@@ -12,17 +12,20 @@ Organização:
 - CanvasPhong: Renderização 3D com Phong shading (scan line)
 - MainWindow: Janela principal com controles e abas
 """
-from typing import List, Tuple, Optional
-from PyQt5.QtCore import Qt, QPoint
-from PyQt5.QtGui import QPainter, QPen, QColor
+from typing import Dict, List, Tuple, Optional
+from PyQt5.QtCore import Qt, QPoint, QLine, QTimer, QSignalBlocker
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygon, QIcon
 from PyQt5.QtWidgets import (
     QWidget, QMainWindow, QAction, QColorDialog, QSpinBox, QLabel,
     QToolBar, QMessageBox, QFileDialog, QStatusBar, QDoubleSpinBox,
     QComboBox, QPushButton, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QSplitter, QCheckBox
+    QSplitter, QCheckBox, QGridLayout, QDialog, QDialogButtonBox, QFormLayout,
+    QTabWidget, QScrollArea
 )
 import geometry3d as geo3d
 import math
+import os
+import weakref
 import numpy as np
 from opengl_viewer import OpenGLViewer
 from scanline_phong import ScanLinePhong
@@ -33,6 +36,39 @@ from canvas_2d import Canvas
 Point = Tuple[int, int]
 Span = Tuple[int, int, int]  # (y, x_start, x_end)
 
+# Formas da lista "Objetos 3D", na ordem dos itens (o item 0 é o placeholder):
+# (fábrica, título do diálogo, [(rótulo, padrão, mínimo, máximo) por parâmetro], mensagem de status)
+SHAPE_SPECS = (
+    (geo3d.create_cube, "Tamanho do Cubo",
+     [("Digite o tamanho do cubo:", 100.0, 10.0, 500.0)],
+     "Cubo criado com tamanho {0}. Veja na aba 'Phong (Scan Line)'"),
+    (geo3d.create_pyramid, "Pirâmide",
+     [("Digite o tamanho da base:", 100.0, 10.0, 500.0),
+      ("Digite a altura:", 150.0, 10.0, 500.0)],
+     "Pirâmide criada (base: {0}, altura: {1})"),
+    (geo3d.create_cylinder, "Cilindro",
+     [("Digite o raio:", 50.0, 10.0, 250.0),
+      ("Digite a altura:", 100.0, 10.0, 500.0)],
+     "Cilindro criado (raio: {0}, altura: {1})"),
+    (geo3d.create_hemisphere, "Raio da Semiesfera",
+     [("Digite o raio:", 50.0, 10.0, 250.0)],
+     "Semiesfera criada com raio {0}"),
+    (geo3d.create_sphere, "Raio da Esfera",
+     [("Digite o raio:", 50.0, 10.0, 250.0)],
+     "Esfera criada com raio {0}"),
+    (geo3d.create_torus, "Torus",
+     [("Digite o raio maior:", 50.0, 10.0, 250.0),
+      ("Digite o raio menor:", 20.0, 5.0, 100.0)],
+     "Torus criado (raios: {0}, {1})"),
+    (geo3d.create_cone, "Cone",
+     [("Digite o raio da base:", 50.0, 10.0, 250.0),
+      ("Digite a altura:", 100.0, 10.0, 500.0)],
+     "Cone criado (raio: {0}, altura: {1})"),
+    (geo3d.create_teapot, "Tamanho do Teapot",
+     [("Digite o tamanho:", 50.0, 20.0, 200.0)],
+     "Teapot criado com tamanho {0}"),
+)
+
 
 # ============================================================================
 # Canvas3D - Visualização 3D com QPainter
@@ -51,11 +87,15 @@ class Canvas3D(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.objects: List[geo3d.Object3D] = []
-        self.current_object: Optional[geo3d.Object3D] = None
+        # Viewers que acompanham o objeto atual deste canvas (veja current_object)
+        self.linked_viewers: List[QWidget] = []
+        self._current_object: Optional[geo3d.Object3D] = None
         self.projection: geo3d.Projection = geo3d.OrthographicProjection()
         self.is_perspective = False
         self.edge_color = QColor(0, 0, 0)
         self.fill_color = QColor(100, 150, 255, 100)
+        # fill_color normalizada (r, g, b, a) em [0, 1], no formato de Object3D.color
+        self.fill_color_norm = self._normalize_color(self.fill_color)
         self.show_faces = True
         self.show_edges = True
         
@@ -71,6 +111,18 @@ class Canvas3D(QWidget):
         # Habilitar foco para receber eventos de teclado
         self.setFocusPolicy(Qt.StrongFocus)
     
+    @property
+    def current_object(self) -> Optional[geo3d.Object3D]:
+        """Objeto atual (alvo das transformações)"""
+        return self._current_object
+    
+    @current_object.setter
+    def current_object(self, obj: Optional[geo3d.Object3D]):
+        # Propagar para os viewers ligados, que assim nunca ficam dessincronizados
+        self._current_object = obj
+        for viewer in self.linked_viewers:
+            viewer.current_object = obj
+    
     def add_object(self, obj: geo3d.Object3D):
         """Adiciona um objeto 3D"""
         self.objects.append(obj)
@@ -115,8 +167,15 @@ class Canvas3D(QWidget):
     
     def set_fill_color(self, color: QColor):
         self.fill_color = color
+        self.fill_color_norm = self._normalize_color(color)
         self.update()
     
+    @staticmethod
+    def _normalize_color(color: QColor) -> Tuple[float, float, float, float]:
+        """Converte QColor para (r, g, b, a) em [0, 1]"""
+        return (color.red() / 255.0, color.green() / 255.0,
+                color.blue() / 255.0, color.alpha() / 255.0)
+    
     def set_show_faces(self, show: bool):
         self.show_faces = show
         self.update()
@@ -170,20 +229,10 @@ class Canvas3D(QWidget):
         
         # Desenhar todos os objetos
         for obj in self.objects:
-            # Aplicar transformações da câmera aos vértices
-            vertices_3d = obj.get_transformed_vertices()
-            
-            # Aplicar transformação da câmera aos vértices
-            vertices_camera = []
-            for v3d in vertices_3d:
-                v_camera = camera_transform.apply_to_point(v3d)
-                vertices_camera.append(v_camera)
-            
-            # Projeta os vértices
-            vertices_2d = []
-            for v3d in vertices_camera:
-                v2d = self.projection.project(v3d)
-                vertices_2d.append(v2d)
+            # Câmera * transformação do objeto aplicadas aos vértices originais e
+            # projetadas de uma vez
+            model_view = (camera_transform * obj.transform).matrix
+            vertices_2d = self.projection.project_transformed(obj.vertices, model_view).tolist()
             
             # Desenha faces se habilitado
             if self.show_faces and obj.faces:
@@ -205,7 +254,6 @@ class Canvas3D(QWidget):
                                 points.append(QPoint(int(x), int(y)))
                         
                         if len(points) >= 3:
-                            from PyQt5.QtGui import QPolygon
                             polygon = QPolygon(points)
                             painter.drawPolygon(polygon)
             
@@ -215,7 +263,7 @@ class Canvas3D(QWidget):
                 pen.setWidth(2)
                 painter.setPen(pen)
                 
-                for i1, i2 in obj.edges:
+                for i1, i2 in obj.edges.tolist():
                     if i1 < len(vertices_2d) and i2 < len(vertices_2d):
                         x1, y1 = vertices_2d[i1]
                         x2, y2 = vertices_2d[i2]
@@ -289,6 +337,9 @@ class CanvasPhong(QWidget):
     - Iluminação Phong simplificada
     - Controle de câmera e luz
     """
+    # Direções (cos, sin) dos 8 raios desenhados em volta da fonte de luz
+    _RAY_DIRS = tuple((math.cos(2.0 * math.pi * i / 8), math.sin(2.0 * math.pi * i / 8)) for i in range(8))
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.objects: List[geo3d.Object3D] = []
@@ -298,6 +349,18 @@ class CanvasPhong(QWidget):
         
         # Renderizador Phong
         self.phong_renderer: Optional[ScanLinePhong] = None
+        # Transformação da câmera do quadro atual (montada em paintEvent), reaproveitada
+        # enquanto rotação e tamanho da tela não mudam
+        self._camera_transform: Optional[geo3d.Transform3D] = None
+        self._camera_key = None
+        # Buffers reaproveitados entre objetos e quadros: vértices no espaço da câmera e
+        # projetados (crescem para o maior objeto; cada objeto usa as primeiras linhas)
+        self._camera_buffer = np.empty((0, 3), dtype=np.float32)
+        self._projected_buffer = np.empty((0, 2), dtype=np.float32)
+        # Normais (vértices) por objeto, válidas enquanto geometria e transformação do objeto
+        # não mudarem (girar a câmera não as altera):
+        # id(obj) -> (obj, geom_version, transform, vertex_normals)
+        self._normal_cache = {}
         
         # Controle de câmera
         self.camera_rot_x = 30.0
@@ -305,6 +368,12 @@ class CanvasPhong(QWidget):
         self.camera_distance = 300.0
         self.last_mouse_pos = None
         self.mouse_sensitivity = 0.5
+        # Agrupa eventos de câmera em rajada (arrasto, roda, teclas) em no máximo
+        # uma renderização a cada 16 ms
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self.update)
         
         # Posição da luz (sincronizada com OpenGL)
         self.light_position = geo3d.Vector3D(200.0, 200.0, 200.0)
@@ -325,6 +394,7 @@ class CanvasPhong(QWidget):
         """Limpa todos os objetos"""
         self.objects.clear()
         self.current_object = None
+        self._normal_cache.clear()
         self.update()
     
     def set_projection(self, is_perspective: bool, distance: float = 500.0):
@@ -347,16 +417,16 @@ class CanvasPhong(QWidget):
     def resizeEvent(self, event):
         """Reinicializa o renderizador quando o tamanho muda"""
         self.phong_renderer = None
+        self._camera_key = None
         super().resizeEvent(event)
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Limpar fundo
-        painter.fillRect(self.rect(), QColor(20, 20, 30))
-        
         if not self.objects:
+            # Limpar fundo (com objetos, a imagem renderizada cobre o canvas inteiro)
+            painter.fillRect(self.rect(), QColor(20, 20, 30))
             # Mostrar aviso quando não há objetos
             painter.setPen(QColor(200, 200, 200))
             painter.drawText(self.rect(), Qt.AlignCenter, "Adicione objetos para visualizar com Phong Shading (Scan Line)")
@@ -384,46 +454,45 @@ class CanvasPhong(QWidget):
         rot_y_rad = math.radians(self.camera_rot_y)
         
         # Calcular posição do observador baseada na rotação da câmera
-        viewer_x = self.camera_distance * math.sin(rot_y_rad) * math.cos(rot_x_rad)
+        cos_x = math.cos(rot_x_rad)
+        viewer_x = self.camera_distance * math.sin(rot_y_rad) * cos_x
         viewer_y = self.camera_distance * math.sin(rot_x_rad)
-        viewer_z = self.camera_distance * math.cos(rot_y_rad) * math.cos(rot_x_rad)
+        viewer_z = self.camera_distance * math.cos(rot_y_rad) * cos_x
         
         self.phong_renderer.set_viewer_position(viewer_x, viewer_y, viewer_z)
         
-        # Transformação da câmera
-        camera_transform = geo3d.Transform3D.translation(
-            self.width() / 2.0,
-            self.height() / 2.0,
-            0.0
-        )
-        
-        # Rotação X (pitch)
-        rot_x_transform = geo3d.Transform3D.rotation_euler(rot_x_rad, 0, 0)
-        camera_transform = camera_transform * rot_x_transform
-        
-        # Rotação Y (yaw)
-        rot_y_transform = geo3d.Transform3D.rotation_euler(0, rot_y_rad, 0)
-        camera_transform = camera_transform * rot_y_transform
+        # Transformação da câmera (a luz usa a mesma): só é remontada quando a rotação
+        # ou o tamanho da tela mudam
+        camera_key = (self.camera_rot_x, self.camera_rot_y, self.width(), self.height())
+        if camera_key != self._camera_key:
+            self._camera_transform = self._build_camera_transform()
+            self._camera_key = camera_key
+        camera_transform = self._camera_transform
+        
+        # Intervalo do depth buffer de 16 bits ajustado à cena: a câmera só gira e desloca
+        # em X/Y, então o Z de câmera de cada vértice fica dentro de ±(maior distância à origem)
+        scene_radius = max((float(np.sqrt((np.asarray(obj.get_transformed_vertices(), dtype=np.float64) ** 2)
+                                          .sum(axis=1).max()))
+                            for obj in self.objects if len(obj.vertices)), default=0.0)
+        depth_limit = scene_radius + 1.0
+        self.phong_renderer.set_depth_range(-depth_limit, depth_limit)
         
         # Renderizar todos os objetos
+        self._prune_normal_cache()
         for obj in self.objects:
             vertices_3d = obj.get_transformed_vertices()
             
-            # Calcular normais
-            face_normals = self._calculate_face_normals(obj, vertices_3d)
-            vertex_normals = self._calculate_vertex_normals(obj, vertices_3d, face_normals)
+            # Normais dos vértices (do cache, se o objeto não mudou)
+            vertex_normals = self._get_vertex_normals(obj, vertices_3d)
             
-            # Aplicar transformação da câmera
-            vertices_camera = []
-            for v3d in vertices_3d:
-                v_camera = camera_transform.apply_to_point(v3d)
-                vertices_camera.append(v_camera)
-            
-            # Projetar vértices
-            vertices_2d = []
-            for v3d in vertices_camera:
-                v2d = self.projection.project(v3d)
-                vertices_2d.append(v2d)
+            # Aplicar transformação da câmera e projetar todos os vértices de uma vez,
+            # nos buffers do canvas (prepare_mesh copia o que usa)
+            num_vertices = len(vertices_3d)
+            if len(self._camera_buffer) < num_vertices or self._camera_buffer.dtype != vertices_3d.dtype:
+                self._camera_buffer = np.empty((num_vertices, 3), dtype=vertices_3d.dtype)
+                self._projected_buffer = np.empty((num_vertices, 2), dtype=np.float32)
+            vertices_camera = camera_transform.apply_to_points(vertices_3d, out=self._camera_buffer[:num_vertices])
+            vertices_2d = self.projection.project_batch(vertices_camera, out=self._projected_buffer[:num_vertices])
             
             # Configurar material baseado na cor do objeto
             if hasattr(obj, 'color'):
@@ -438,62 +507,23 @@ class CanvasPhong(QWidget):
                 shininess=128.0
             )
             
-            # Renderizar faces como triângulos
-            for face in obj.faces:
-                if len(face) < 3:
-                    continue
-                
-                # Triangulizar face de forma mais equilibrada
-                # Para faces com 4 vértices (quadrados), usar divisão diagonal oposta
-                if len(face) == 4:
-                    # Dividir quadrado em 2 triângulos usando diagonal oposta
-                    # Triângulo 1: (0, 1, 2)
-                    idx0, idx1, idx2 = face[0], face[1], face[2]
-                    if (idx0 < len(vertices_2d) and idx1 < len(vertices_2d) and 
-                        idx2 < len(vertices_2d) and
-                        idx0 < len(vertices_camera) and idx1 < len(vertices_camera) and
-                        idx2 < len(vertices_camera) and
-                        idx0 < len(vertex_normals) and idx1 < len(vertex_normals) and
-                        idx2 < len(vertex_normals)):
-                        self.phong_renderer.render_triangle(
-                            vertices_2d[idx0], vertices_2d[idx1], vertices_2d[idx2],
-                            vertices_camera[idx0], vertices_camera[idx1], vertices_camera[idx2],
-                            vertex_normals[idx0], vertex_normals[idx1], vertex_normals[idx2]
-                        )
-                    
-                    # Triângulo 2: (0, 2, 3) - usando diagonal oposta
-                    idx0, idx1, idx2 = face[0], face[2], face[3]
-                    if (idx0 < len(vertices_2d) and idx1 < len(vertices_2d) and 
-                        idx2 < len(vertices_2d) and
-                        idx0 < len(vertices_camera) and idx1 < len(vertices_camera) and
-                        idx2 < len(vertices_camera) and
-                        idx0 < len(vertex_normals) and idx1 < len(vertex_normals) and
-                        idx2 < len(vertex_normals)):
-                        self.phong_renderer.render_triangle(
-                            vertices_2d[idx0], vertices_2d[idx1], vertices_2d[idx2],
-                            vertices_camera[idx0], vertices_camera[idx1], vertices_camera[idx2],
-                            vertex_normals[idx0], vertex_normals[idx1], vertex_normals[idx2]
-                        )
-                else:
-                    # Para outras faces (triângulos ou polígonos com mais de 4 vértices)
-                    # Usar triangulação em fan a partir do primeiro vértice
-                    for i in range(1, len(face) - 1):
-                        idx0 = face[0]
-                        idx1 = face[i]
-                        idx2 = face[i + 1]
-                        
-                        if (idx0 < len(vertices_2d) and idx1 < len(vertices_2d) and 
-                            idx2 < len(vertices_2d) and
-                            idx0 < len(vertices_camera) and idx1 < len(vertices_camera) and
-                            idx2 < len(vertices_camera) and
-                            idx0 < len(vertex_normals) and idx1 < len(vertex_normals) and
-                            idx2 < len(vertex_normals)):
-                            
-                            self.phong_renderer.render_triangle(
-                                vertices_2d[idx0], vertices_2d[idx1], vertices_2d[idx2],
-                                vertices_camera[idx0], vertices_camera[idx1], vertices_camera[idx2],
-                                vertex_normals[idx0], vertex_normals[idx1], vertex_normals[idx2]
-                            )
+            # Triângulos do objeto, montados uma vez na criação (faces em leque, índices já
+            # verificados contra o número de vértices)
+            triangles = obj.triangles
+            
+            # Descartar triângulos cuja caixa envolvente 2D está toda fora da tela
+            # (margem de 1 pixel para o arredondamento do rasterizador)
+            if len(triangles):
+                tri_x = vertices_2d[:, 0][triangles]
+                tri_y = vertices_2d[:, 1][triangles]
+                on_screen = ((tri_x.max(axis=1) >= -1.0) & (tri_x.min(axis=1) <= self.width()) &
+                             (tri_y.max(axis=1) >= -1.0) & (tri_y.min(axis=1) <= self.height()))
+                triangles = triangles[on_screen]
+            
+            # Uma única passada vetorizada (scan line + Phong por pixel) para o objeto inteiro
+            if len(triangles):
+                self.phong_renderer.prepare_mesh(vertices_2d, vertices_camera, triangles, vertex_normals)
+                self.phong_renderer.render_mesh()
         
         # Desenhar a imagem renderizada
         painter.drawImage(0, 0, self.phong_renderer.get_image())
@@ -501,65 +531,8 @@ class CanvasPhong(QWidget):
         # Desenhar representação visual da fonte de luz
         self._draw_light_representation(painter)
     
-    def _calculate_face_normals(self, obj: geo3d.Object3D, vertices: List[geo3d.Point3D]) -> List[Tuple[float, float, float]]:
-        """Calcula normais das faces"""
-        normals = []
-        for face in obj.faces:
-            if len(face) < 3:
-                normals.append((0.0, 0.0, 1.0))
-                continue
-            
-            idx0, idx1, idx2 = face[0], face[1], face[2]
-            if idx0 >= len(vertices) or idx1 >= len(vertices) or idx2 >= len(vertices):
-                normals.append((0.0, 0.0, 1.0))
-                continue
-            
-            v0 = geo3d.Vector3D.from_tuple(vertices[idx0])
-            v1 = geo3d.Vector3D.from_tuple(vertices[idx1])
-            v2 = geo3d.Vector3D.from_tuple(vertices[idx2])
-            
-            edge1 = v1 - v0
-            edge2 = v2 - v0
-            normal = edge1.cross(edge2).normalize()
-            
-            normals.append(normal.to_tuple())
-        return normals
-    
-    def _calculate_vertex_normals(self, obj: geo3d.Object3D, vertices: List[geo3d.Point3D],
-                                  face_normals: List[Tuple[float, float, float]]) -> List[Tuple[float, float, float]]:
-        """Calcula normais dos vértices (média das normais das faces adjacentes)"""
-        vertex_normals = [(0.0, 0.0, 0.0) for _ in vertices]
-        vertex_face_count = [0 for _ in vertices]
-        
-        for face_idx, face in enumerate(obj.faces):
-            if face_idx >= len(face_normals):
-                continue
-            
-            normal = geo3d.Vector3D.from_tuple(face_normals[face_idx])
-            
-            for vertex_idx in face:
-                if vertex_idx < len(vertices):
-                    current_normal = geo3d.Vector3D.from_tuple(vertex_normals[vertex_idx])
-                    vertex_normals[vertex_idx] = (current_normal + normal).to_tuple()
-                    vertex_face_count[vertex_idx] += 1
-        
-        # Normalizar
-        result = []
-        for i, normal in enumerate(vertex_normals):
-            if vertex_face_count[i] > 0:
-                normal_vec = geo3d.Vector3D.from_tuple(normal).normalize()
-                result.append(normal_vec.to_tuple())
-            else:
-                result.append((0.0, 0.0, 1.0))
-        
-        return result
-    
-    def _draw_light_representation(self, painter: QPainter):
-        """Desenha uma representação visual da fonte de luz"""
-        if not self.objects:
-            return
-        
-        # Aplicar a mesma transformação de câmera usada para os objetos
+    def _build_camera_transform(self) -> geo3d.Transform3D:
+        """Transformação da câmera: centro da tela * rotação X (pitch) * rotação Y (yaw)"""
         rot_x_rad = math.radians(self.camera_rot_x)
         rot_y_rad = math.radians(self.camera_rot_y)
         
@@ -570,12 +543,90 @@ class CanvasPhong(QWidget):
         )
         
         # Rotação X (pitch)
-        rot_x_transform = geo3d.Transform3D.rotation_euler(rot_x_rad, 0, 0)
-        camera_transform = camera_transform * rot_x_transform
+        camera_transform = camera_transform * geo3d.Transform3D.rotation_euler(rot_x_rad, 0, 0)
         
         # Rotação Y (yaw)
-        rot_y_transform = geo3d.Transform3D.rotation_euler(0, rot_y_rad, 0)
-        camera_transform = camera_transform * rot_y_transform
+        camera_transform = camera_transform * geo3d.Transform3D.rotation_euler(0, rot_y_rad, 0)
+        return camera_transform
+    
+    def _prune_normal_cache(self):
+        """Descarta normais de objetos que saíram da cena (a lista de objetos pode ser trocada por fora)"""
+        if len(self._normal_cache) > len(self.objects):
+            live = {id(obj) for obj in self.objects}
+            self._normal_cache = {k: v for k, v in self._normal_cache.items() if k in live}
+    
+    def _get_vertex_normals(self, obj: geo3d.Object3D, vertices: np.ndarray) -> np.ndarray:
+        """Normais dos vértices transformados, recalculadas só quando a geometria ou a
+        transformação do objeto mudam"""
+        cached = self._normal_cache.get(id(obj))
+        if (cached is not None and cached[0] is obj and cached[1] == obj.geom_version
+                and cached[2] is obj.transform):
+            return cached[3]
+        face_normals = self._calculate_face_normals(obj, vertices)
+        vertex_normals = self._calculate_vertex_normals(obj, vertices, face_normals)
+        self._normal_cache[id(obj)] = (obj, obj.geom_version, obj.transform, vertex_normals)
+        return vertex_normals
+    
+    def _calculate_face_normals(self, obj: geo3d.Object3D, vertices: np.ndarray) -> np.ndarray:
+        """Calcula normais das faces
+        
+        Retorna um array (F, 3); faces com menos de 3 vértices ou índices inválidos recebem
+        (0, 0, 1) e faces degeneradas ficam com normal nula.
+        """
+        vertices = np.asarray(vertices, dtype=np.float32)
+        normals = np.tile(np.array([0.0, 0.0, 1.0], dtype=np.float32), (len(obj.faces), 1))
+        
+        # Três primeiros vértices de cada face
+        corners = np.array([face[:3] if len(face) >= 3 else (-1, -1, -1) for face in obj.faces],
+                           dtype=np.int64).reshape(-1, 3)
+        valid = ((corners >= 0) & (corners < len(vertices))).all(axis=1)
+        corners = corners[valid]
+        v0 = vertices[corners[:, 0]]
+        
+        # Normal = edge1 x edge2, normalizada
+        normal = np.cross(vertices[corners[:, 1]] - v0, vertices[corners[:, 2]] - v0)
+        normal_length = np.linalg.norm(normal, axis=1, keepdims=True)
+        np.divide(normal, normal_length, out=normal, where=normal_length > 0)
+        normals[valid] = normal
+        
+        return normals
+    
+    def _calculate_vertex_normals(self, obj: geo3d.Object3D, vertices: np.ndarray,
+                                  face_normals: np.ndarray) -> np.ndarray:
+        """Calcula normais dos vértices (média das normais das faces adjacentes)
+        
+        Retorna um array (V, 3); vértices sem faces recebem (0, 0, 1).
+        """
+        num_vertices = len(vertices)
+        faces = obj.faces[:len(face_normals)]
+        
+        # Índices de todos os vértices de todas as faces, com a normal da face repetida
+        face_sizes = np.fromiter((len(face) for face in faces), dtype=np.int64, count=len(faces))
+        vertex_idx = np.fromiter((v for face in faces for v in face), dtype=np.int64, count=int(face_sizes.sum()))
+        normals_per_vertex = np.repeat(face_normals[:len(faces)], face_sizes, axis=0)
+        valid = (vertex_idx >= 0) & (vertex_idx < num_vertices)
+        vertex_idx = vertex_idx[valid]
+        
+        # Para cada face, adicionar sua normal aos vértices
+        vertex_normals = np.zeros((num_vertices, 3), dtype=np.float32)
+        np.add.at(vertex_normals, vertex_idx, normals_per_vertex[valid])
+        
+        # Normalizar (soma nula continua nula; vértice sem faces: normal padrão)
+        normal_length = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+        np.divide(vertex_normals, normal_length, out=vertex_normals, where=normal_length > 0)
+        has_faces = np.zeros(num_vertices, dtype=bool)
+        has_faces[vertex_idx] = True
+        vertex_normals[~has_faces] = (0.0, 0.0, 1.0)
+        
+        return vertex_normals
+    
+    def _draw_light_representation(self, painter: QPainter):
+        """Desenha uma representação visual da fonte de luz"""
+        if not self.objects:
+            return
+        
+        # Aplicar a mesma transformação de câmera usada para os objetos neste quadro
+        camera_transform = self._camera_transform or self._build_camera_transform()
         
         # Posição 3D da luz
         light_pos_3d = (self.light_position.x, self.light_position.y, self.light_position.z)
@@ -604,14 +655,12 @@ class CanvasPhong(QWidget):
         
         # Desenhar raios de luz (linhas amarelas)
         painter.setPen(QPen(QColor(255, 255, 200), 1.5))
-        num_rays = 8
         ray_length = 18.0
         
-        for i in range(num_rays):
-            angle = 2.0 * math.pi * i / num_rays
-            end_x = x + math.cos(angle) * ray_length
-            end_y = y + math.sin(angle) * ray_length
-            painter.drawLine(int(x), int(y), int(end_x), int(end_y))
+        # Todos os raios numa única chamada ao QPainter
+        center_x, center_y = int(x), int(y)
+        painter.drawLines([QLine(center_x, center_y, int(x + dir_x * ray_length), int(y + dir_y * ray_length))
+                           for dir_x, dir_y in self._RAY_DIRS])
         
         # Círculo interno mais brilhante
         painter.setBrush(QColor(255, 255, 200))
@@ -627,6 +676,11 @@ class CanvasPhong(QWidget):
             # Garantir foco para receber eventos de teclado
             self.setFocus()
     
+    def _request_update(self):
+        """Agenda uma nova renderização; pedidos feitos antes do disparo são agrupados"""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+    
     def mouseMoveEvent(self, event):
         if event.buttons() & Qt.LeftButton and self.last_mouse_pos:
             dx = event.x() - self.last_mouse_pos.x()
@@ -639,7 +693,7 @@ class CanvasPhong(QWidget):
             self.camera_rot_x = max(-90.0, min(90.0, self.camera_rot_x))
             
             self.last_mouse_pos = event.pos()
-            self.update()
+            self._request_update()
     
     def mouseReleaseEvent(self, event):
         self.last_mouse_pos = None
@@ -647,7 +701,7 @@ class CanvasPhong(QWidget):
     def wheelEvent(self, event):
         delta = event.angleDelta().y() / 120.0
         self.camera_distance = max(50.0, min(1000.0, self.camera_distance - delta * 10.0))
-        self.update()
+        self._request_update()
     
     def keyPressEvent(self, event):
         """Zoom com teclas 1 e 2"""
@@ -656,17 +710,72 @@ class CanvasPhong(QWidget):
             zoom_factor = 1.1
             self.camera_distance *= zoom_factor
             self.camera_distance = max(50.0, min(1000.0, self.camera_distance))
-            self.update()
+            self._request_update()
         elif event.key() == Qt.Key_2:
             # Zoom out (tecla 2)
             zoom_factor = 0.9
             self.camera_distance *= zoom_factor
             self.camera_distance = max(50.0, min(1000.0, self.camera_distance))
-            self.update()
+            self._request_update()
         else:
             super().keyPressEvent(event)
 
 
+# ============================================================================
+# ParameterDialog - Diálogo de parâmetros numéricos (reaproveitado)
+# ============================================================================
+
+class ParameterDialog(QDialog):
+    """
+    Diálogo modal com uma caixa numérica por parâmetro
+    
+    Uma única instância serve a todas as perguntas: as linhas são criadas sob
+    demanda (até o maior número de parâmetros já pedido) e as que sobram ficam
+    escondidas, em vez de construir um QInputDialog novo por valor.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._form = QFormLayout()
+        self._rows: List[Tuple[QLabel, QDoubleSpinBox]] = []
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout = QVBoxLayout(self)
+        layout.addLayout(self._form)
+        layout.addWidget(buttons)
+    
+    def get_values(self, title: str, fields) -> Optional[List[float]]:
+        """Pergunta os valores de `fields` [(rótulo, padrão, mínimo, máximo), ...]
+        
+        Returns:
+            Lista de valores na ordem dos campos, ou None se o diálogo foi cancelado
+        """
+        while len(self._rows) < len(fields):
+            label, spin = QLabel(), QDoubleSpinBox()
+            spin.setDecimals(1)
+            self._form.addRow(label, spin)
+            self._rows.append((label, spin))
+        
+        for i, (label, spin) in enumerate(self._rows):
+            used = i < len(fields)
+            label.setVisible(used)
+            spin.setVisible(used)
+            if used:
+                text, default, minimum, maximum = fields[i]
+                label.setText(text)
+                spin.setRange(minimum, maximum)
+                spin.setValue(default)
+        
+        self.setWindowTitle(title)
+        first_spin = self._rows[0][1]
+        first_spin.setFocus()
+        first_spin.selectAll()
+        if self.exec_() != QDialog.Accepted:
+            return None
+        return [spin.value() for _, spin in self._rows[:len(fields)]]
+
+
 # ============================================================================
 # MainWindow - Janela Principal
 # ============================================================================
@@ -685,8 +794,6 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("SimplePaint - Computação Gráfica")
         
         # Definir ícone da aplicação
-        from PyQt5.QtGui import QIcon
-        import os
         icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'icon.ico')
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
@@ -695,7 +802,6 @@ class MainWindow(QMainWindow):
         splitter = QSplitter(Qt.Horizontal, self)
         
         # Painel esquerdo: Visualização (50% da tela)
-        from PyQt5.QtWidgets import QTabWidget, QScrollArea
         self.viewer_tabs = QTabWidget()
         
         # Canvas 2D como primeira aba
@@ -714,6 +820,19 @@ class MainWindow(QMainWindow):
         self.phong_viewer = CanvasPhong(self)
         self.viewer_tabs.addTab(self.phong_viewer, "Phong (Scan Line)")
         
+        # Cena única: os três viewers 3D desenham a mesma lista de objetos (mesmas
+        # instâncias), então criar, substituir ou remover um objeto é feito uma só vez.
+        # O OpenGL guarda os buffers de cada objeto e só os reenvia quando ele muda
+        self.scene_objects: List[geo3d.Object3D] = self.canvas3d.objects
+        self.opengl_viewer.objects = self.scene_objects
+        self.phong_viewer.objects = self.scene_objects
+        # ... e o mesmo objeto atual: definido no canvas3d, propagado aos outros dois
+        self.canvas3d.linked_viewers = [self.opengl_viewer, self.phong_viewer]
+        # Os três viewers 3D (mesma interface de projeção e repaint)
+        self._viewers: Tuple[QWidget, ...] = (self.canvas3d, self.opengl_viewer, self.phong_viewer)
+        # Posição de cada objeto na cena: id(obj) -> índice (refeito quando fica desatualizado)
+        self._scene_index: Dict[int, int] = {}
+        
         # Conectar callback para sincronizar posição da luz
         self.opengl_viewer.on_light_position_changed = self._sync_light_controls
         
@@ -744,6 +863,39 @@ class MainWindow(QMainWindow):
         splitter.setStretchFactor(1, 1)
         
         self.setCentralWidget(splitter)
+        
+        # Transformações dos controles (translação, rotação, escala) montadas só quando
+        # o grupo muda; None = grupo alterado desde a última composição
+        self._cached_T: Optional[Tuple[float, float, float]] = None
+        self._cached_R: Optional[geo3d.Transform3D] = None
+        self._cached_S: Optional[geo3d.Transform3D] = None
+        # Produto R * S, refeito só quando rotação ou escala mudam
+        self._cached_RS: Optional[geo3d.Transform3D] = None
+        # Transformação composta aplicada por último (objeto, transformação instalada nele);
+        # referência fraca ao objeto para não mantê-lo vivo depois de removido da cena
+        self._applied_transform: Optional[Tuple[weakref.ref, geo3d.Transform3D]] = None
+        
+        # Mudanças seguidas nos controles (spin box segurado, reset dos nove valores) são
+        # agrupadas: a transformação e a luz são aplicadas uma vez, quando o laço de eventos
+        # volta a ficar livre
+        self._transform_timer = QTimer(self)
+        self._transform_timer.setSingleShot(True)
+        self._transform_timer.setInterval(0)
+        self._transform_timer.timeout.connect(self._update_transform)
+        self._light_timer = QTimer(self)
+        self._light_timer.setSingleShot(True)
+        self._light_timer.setInterval(0)
+        self._light_timer.timeout.connect(self._update_light_position)
+        # Viewers a redesenhar, pedidos agrupados até o laço de eventos ficar livre
+        self._pending_repaint = set()
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(0)
+        self._repaint_timer.timeout.connect(self._flush_repaints)
+        
+        # Diálogo de parâmetros único (formas e extrusão), reaproveitado a cada pergunta
+        self._param_dialog = ParameterDialog(self)
+        
         self.status = QStatusBar(self)
         self.setStatusBar(self.status)
         self._create_toolbar()
@@ -771,7 +923,7 @@ class MainWindow(QMainWindow):
         tb.addWidget(self.create_elements_combo)
         
         self.create_element_btn = QPushButton("Criar")
-        self.create_element_btn.clicked.connect(lambda: self._on_create_element_selected(self.create_elements_combo.currentIndex()))
+        self.create_element_btn.clicked.connect(self._on_create_btn_clicked)
         tb.addWidget(self.create_element_btn)
         
         tb.addSeparator()
@@ -870,89 +1022,28 @@ class MainWindow(QMainWindow):
         transform_group = QGroupBox("🔄 Transformações")
         transform_layout = QVBoxLayout()
         
-        # Translação
-        trans_layout = QHBoxLayout()
-        trans_layout.addWidget(QLabel("Translação:"))
-        self.tx_spin = QDoubleSpinBox()
-        self.tx_spin.setRange(-500.0, 500.0)
-        self.tx_spin.setValue(0.0)
-        self.tx_spin.setSingleStep(10.0)
-        self.tx_spin.valueChanged.connect(self._update_transform)
-        trans_layout.addWidget(QLabel("X:"))
-        trans_layout.addWidget(self.tx_spin)
-        
-        self.ty_spin = QDoubleSpinBox()
-        self.ty_spin.setRange(-500.0, 500.0)
-        self.ty_spin.setValue(0.0)
-        self.ty_spin.setSingleStep(10.0)
-        self.ty_spin.valueChanged.connect(self._update_transform)
-        trans_layout.addWidget(QLabel("Y:"))
-        trans_layout.addWidget(self.ty_spin)
+        # Grade única para as nove caixas: cabeçalho X/Y/Z compartilhado e uma
+        # linha por grupo (translação, rotação em graus, escala)
+        grid = QGridLayout()
+        for col, axis in enumerate(("X", "Y", "Z"), start=1):
+            grid.addWidget(QLabel(axis), 0, col, Qt.AlignCenter)
         
-        self.tz_spin = QDoubleSpinBox()
-        self.tz_spin.setRange(-500.0, 500.0)
-        self.tz_spin.setValue(0.0)
-        self.tz_spin.setSingleStep(10.0)
-        self.tz_spin.valueChanged.connect(self._update_transform)
-        trans_layout.addWidget(QLabel("Z:"))
-        trans_layout.addWidget(self.tz_spin)
-        transform_layout.addLayout(trans_layout)
-        
-        # Rotação (em graus)
-        rot_layout = QHBoxLayout()
-        rot_layout.addWidget(QLabel("Rotação (graus):"))
-        self.rx_spin = QDoubleSpinBox()
-        self.rx_spin.setRange(-360.0, 360.0)
-        self.rx_spin.setValue(0.0)
-        self.rx_spin.setSingleStep(10.0)
-        self.rx_spin.valueChanged.connect(self._update_transform)
-        rot_layout.addWidget(QLabel("X:"))
-        rot_layout.addWidget(self.rx_spin)
-        
-        self.ry_spin = QDoubleSpinBox()
-        self.ry_spin.setRange(-360.0, 360.0)
-        self.ry_spin.setValue(0.0)
-        self.ry_spin.setSingleStep(10.0)
-        self.ry_spin.valueChanged.connect(self._update_transform)
-        rot_layout.addWidget(QLabel("Y:"))
-        rot_layout.addWidget(self.ry_spin)
-        
-        self.rz_spin = QDoubleSpinBox()
-        self.rz_spin.setRange(-360.0, 360.0)
-        self.rz_spin.setValue(0.0)
-        self.rz_spin.setSingleStep(10.0)
-        self.rz_spin.valueChanged.connect(self._update_transform)
-        rot_layout.addWidget(QLabel("Z:"))
-        rot_layout.addWidget(self.rz_spin)
-        transform_layout.addLayout(rot_layout)
-        
-        # Escala
-        scale_layout = QHBoxLayout()
-        scale_layout.addWidget(QLabel("Escala:"))
-        self.sx_spin = QDoubleSpinBox()
-        self.sx_spin.setRange(0.1, 5.0)
-        self.sx_spin.setValue(1.0)
-        self.sx_spin.setSingleStep(0.1)
-        self.sx_spin.valueChanged.connect(self._update_transform)
-        scale_layout.addWidget(QLabel("X:"))
-        scale_layout.addWidget(self.sx_spin)
-        
-        self.sy_spin = QDoubleSpinBox()
-        self.sy_spin.setRange(0.1, 5.0)
-        self.sy_spin.setValue(1.0)
-        self.sy_spin.setSingleStep(0.1)
-        self.sy_spin.valueChanged.connect(self._update_transform)
-        scale_layout.addWidget(QLabel("Y:"))
-        scale_layout.addWidget(self.sy_spin)
-        
-        self.sz_spin = QDoubleSpinBox()
-        self.sz_spin.setRange(0.1, 5.0)
-        self.sz_spin.setValue(1.0)
-        self.sz_spin.setSingleStep(0.1)
-        self.sz_spin.valueChanged.connect(self._update_transform)
-        scale_layout.addWidget(QLabel("Z:"))
-        scale_layout.addWidget(self.sz_spin)
-        transform_layout.addLayout(scale_layout)
+        rows = (
+            ("Translação:", ("tx_spin", "ty_spin", "tz_spin"), -500.0, 500.0, 0.0, 10.0, self._on_translate_changed),
+            ("Rotação (graus):", ("rx_spin", "ry_spin", "rz_spin"), -360.0, 360.0, 0.0, 10.0, self._on_rotate_changed),
+            ("Escala:", ("sx_spin", "sy_spin", "sz_spin"), 0.1, 5.0, 1.0, 0.1, self._on_scale_changed),
+        )
+        for row, (label, names, minimum, maximum, value, step, slot) in enumerate(rows, start=1):
+            grid.addWidget(QLabel(label), row, 0)
+            for col, name in enumerate(names, start=1):
+                spin = QDoubleSpinBox()
+                spin.setRange(minimum, maximum)
+                spin.setValue(value)
+                spin.setSingleStep(step)
+                spin.valueChanged.connect(slot)
+                setattr(self, name, spin)
+                grid.addWidget(spin, row, col)
+        transform_layout.addLayout(grid)
         
         # Botão reset
         reset_btn = QPushButton("Reset Transformações")
@@ -1008,21 +1099,21 @@ class MainWindow(QMainWindow):
         self.light_x_spin = QDoubleSpinBox()
         self.light_x_spin.setRange(-500.0, 500.0)
         self.light_x_spin.setValue(200.0)
-        self.light_x_spin.valueChanged.connect(self._update_light_position)
+        self.light_x_spin.valueChanged.connect(self._schedule_light_update)
         light_pos_layout.addWidget(QLabel("X:"))
         light_pos_layout.addWidget(self.light_x_spin)
         
         self.light_y_spin = QDoubleSpinBox()
         self.light_y_spin.setRange(-500.0, 500.0)
         self.light_y_spin.setValue(200.0)
-        self.light_y_spin.valueChanged.connect(self._update_light_position)
+        self.light_y_spin.valueChanged.connect(self._schedule_light_update)
         light_pos_layout.addWidget(QLabel("Y:"))
         light_pos_layout.addWidget(self.light_y_spin)
         
         self.light_z_spin = QDoubleSpinBox()
         self.light_z_spin.setRange(-500.0, 500.0)
         self.light_z_spin.setValue(200.0)
-        self.light_z_spin.valueChanged.connect(self._update_light_position)
+        self.light_z_spin.valueChanged.connect(self._schedule_light_update)
         light_pos_layout.addWidget(QLabel("Z:"))
         light_pos_layout.addWidget(self.light_z_spin)
         light_layout.addLayout(light_pos_layout)
@@ -1057,52 +1148,81 @@ class MainWindow(QMainWindow):
         layout.addStretch()
         return widget
 
+    def _open_color_dialog(self, initial: QColor, title: str, on_selected,
+                           on_preview=None, on_cancel=None):
+        """Abre um QColorDialog sem bloquear o laço de eventos (open() em vez de getColor)
+        
+        Os viewers continuam redesenhando enquanto o diálogo está aberto. on_selected
+        recebe a cor confirmada; on_preview (opcional) recebe cada cor enquanto o usuário
+        escolhe; on_cancel (opcional) é chamado se o diálogo for cancelado.
+        """
+        dlg = QColorDialog(initial, self)
+        dlg.setWindowTitle(title)
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        if on_preview is not None:
+            # O diálogo do Qt emite currentColorChanged em todas as plataformas
+            dlg.setOption(QColorDialog.DontUseNativeDialog)
+            dlg.currentColorChanged.connect(on_preview)
+        dlg.colorSelected.connect(on_selected)
+        if on_cancel is not None:
+            dlg.rejected.connect(on_cancel)
+        dlg.open()
+        return dlg
+
     def _choose_stroke_color(self):
-        color = QColorDialog.getColor(self.canvas.stroke_color, self, "Choose Stroke Color")
+        self._open_color_dialog(self.canvas.stroke_color, "Choose Stroke Color", self._apply_stroke_color)
+
+    def _apply_stroke_color(self, color: QColor):
         if color.isValid():
             self.canvas.set_stroke_color(color)
             self.canvas3d.set_edge_color(color)
 
     def _choose_fill_color(self):
-        color = QColorDialog.getColor(self.canvas.fill_color, self, "Choose Fill Color")
+        self._open_color_dialog(self.canvas.fill_color, "Choose Fill Color", self._apply_fill_color)
+
+    def _apply_fill_color(self, color: QColor):
         if color.isValid():
             self.canvas.set_fill_color(color)
             self.canvas3d.set_fill_color(color)
             # Atualizar cor do material no OpenGL
-            r = color.red() / 255.0
-            g = color.green() / 255.0
-            b = color.blue() / 255.0
-            alpha = color.alpha() / 255.0
-            self.opengl_viewer.set_material_color(r, g, b, alpha)
+            self.opengl_viewer.set_material_color(*self.canvas3d.fill_color_norm)
             # Atualizar botão de cor 3D também
             self._update_3d_color_button(color)
     
     def _choose_3d_color(self):
         """Abre diálogo para escolher cor do objeto 3D ativo"""
-        if not self.canvas3d.current_object:
+        obj = self.canvas3d.current_object
+        if not obj:
             QMessageBox.warning(self, "Aviso", "Selecione um objeto primeiro!")
             return
         
         # Obter cor atual do objeto selecionado
-        if hasattr(self.canvas3d.current_object, 'color'):
-            r, g, b, alpha = self.canvas3d.current_object.color
-            current_color = QColor(int(r * 255), int(g * 255), int(b * 255), int(alpha * 255))
-        else:
-            current_color = self.canvas3d.fill_color
+        original_color = obj.color
+        r, g, b, alpha = original_color
+        current_color = QColor(int(r * 255), int(g * 255), int(b * 255), int(alpha * 255))
+        
+        def restore():
+            # Cancelado: desfazer a pré-visualização
+            obj.color = original_color
+            self._schedule_repaint()
+        
+        self._open_color_dialog(
+            current_color, "Escolher Cor do Objeto 3D",
+            on_selected=lambda color: self._apply_3d_color(obj, color, final=True),
+            on_preview=lambda color: self._apply_3d_color(obj, color),
+            on_cancel=restore)
+    
+    def _apply_3d_color(self, obj: geo3d.Object3D, color: QColor, final: bool = False):
+        """Aplica a cor a um objeto 3D (pré-visualização ou escolha final)"""
+        if not color.isValid():
+            return
+        # Atualizar cor apenas do objeto escolhido
+        obj.color = Canvas3D._normalize_color(color)
         
-        color = QColorDialog.getColor(current_color, self, "Escolher Cor do Objeto 3D")
-        if color.isValid():
-            # Atualizar cor apenas do objeto selecionado
-            r = color.red() / 255.0
-            g = color.green() / 255.0
-            b = color.blue() / 255.0
-            alpha = color.alpha() / 255.0
-            self.canvas3d.current_object.color = (r, g, b, alpha)
-            
-            # Atualizar visualizações
-            self.canvas3d.update()
-            self.opengl_viewer.update()
-            
+        # Atualizar visualizações (repaints agrupados pelo agendador)
+        self._schedule_repaint()
+        
+        if final:
             # Atualizar botão com a nova cor
             self._update_3d_color_button(color)
     
@@ -1115,17 +1235,17 @@ class MainWindow(QMainWindow):
         """Muda o tipo de projeção"""
         is_perspective = (index == 1)
         distance = self.distance_spin.value()
-        self.canvas3d.set_projection(is_perspective, distance)
-        self.opengl_viewer.set_projection(is_perspective, distance)
-        self.phong_viewer.set_projection(is_perspective, distance)
+        for viewer in self._viewers:
+            viewer.set_projection(is_perspective, distance)
         self.distance_spin.setEnabled(is_perspective)
     
     def _on_distance_changed(self, value: float):
         """Atualiza distância da projeção perspectiva"""
-        if self.canvas3d.is_perspective:
-            self.canvas3d.set_projection(True, value)
-        self.opengl_viewer.set_projection(True, value)
-        self.phong_viewer.set_projection(True, value)
+        # Em modo ortográfico a distância não se aplica a nenhum viewer
+        if not self.canvas3d.is_perspective:
+            return
+        for viewer in self._viewers:
+            viewer.set_projection(True, value)
     
     def _on_shading_changed(self, index: int):
         """Muda o modelo de shading"""
@@ -1137,6 +1257,11 @@ class MainWindow(QMainWindow):
             model = 'phong'
         self.opengl_viewer.set_shading_model(model)
     
+    def _schedule_light_update(self):
+        """Agenda _update_light_position; pedidos feitos antes do disparo são agrupados"""
+        if not self._light_timer.isActive():
+            self._light_timer.start()
+    
     def _update_light_position(self):
         """Atualiza a posição da luz"""
         x = self.light_x_spin.value()
@@ -1147,59 +1272,92 @@ class MainWindow(QMainWindow):
     
     def _sync_light_controls(self, x: float, y: float, z: float):
         """Sincroniza os controles com a posição da luz (quando movida por teclado)"""
-        self.light_x_spin.blockSignals(True)
-        self.light_y_spin.blockSignals(True)
-        self.light_z_spin.blockSignals(True)
-        
-        self.light_x_spin.setValue(x)
-        self.light_y_spin.setValue(y)
-        self.light_z_spin.setValue(z)
-        
-        self.light_x_spin.blockSignals(False)
-        self.light_y_spin.blockSignals(False)
-        self.light_z_spin.blockSignals(False)
+        with QSignalBlocker(self.light_x_spin), QSignalBlocker(self.light_y_spin), \
+                QSignalBlocker(self.light_z_spin):
+            self.light_x_spin.setValue(x)
+            self.light_y_spin.setValue(y)
+            self.light_z_spin.setValue(z)
     
     def _toggle_light_representation(self, checked: bool):
         """Alterna a visualização da fonte de luz"""
         self.opengl_viewer.show_light_representation = checked
-        self.opengl_viewer.update()
+        self._schedule_repaint(self.opengl_viewer)
+    
+    def _schedule_repaint(self, *viewers: QWidget):
+        """Agenda o redesenho dos viewers indicados (padrão: os três viewers 3D)
+        
+        Pedidos repetidos antes do disparo viram um único update() por viewer. Abas
+        escondidas não pintam: o Qt as redesenha quando voltam a ser exibidas.
+        """
+        self._pending_repaint.update(viewers or self._viewers)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
+    def _flush_repaints(self):
+        """Dispara os redesenhos agendados"""
+        pending, self._pending_repaint = self._pending_repaint, set()
+        for viewer in pending:
+            viewer.update()
+    
+    def _schedule_transform(self):
+        """Agenda _update_transform; pedidos feitos antes do disparo são agrupados"""
+        if not self._transform_timer.isActive():
+            self._transform_timer.start()
+    
+    def _on_translate_changed(self):
+        """Translação alterada: só ela precisa ser remontada"""
+        self._cached_T = None
+        self._schedule_transform()
+    
+    def _on_rotate_changed(self):
+        """Rotação alterada: só ela precisa ser remontada"""
+        self._cached_R = None
+        self._cached_RS = None
+        self._schedule_transform()
+    
+    def _on_scale_changed(self):
+        """Escala alterada: só ela precisa ser remontada"""
+        self._cached_S = None
+        self._cached_RS = None
+        self._schedule_transform()
     
     def _update_transform(self):
         """Atualiza transformações do objeto 3D atual"""
-        if not self.canvas3d.current_object:
+        obj = self.canvas3d.current_object
+        if not obj:
             return
         
-        # Reset transformação antes de aplicar novas
-        self.canvas3d.current_object.reset_transform()
-        
-        # Criar todas as transformações e compor
-        tx = self.tx_spin.value()
-        ty = self.ty_spin.value()
-        tz = self.tz_spin.value()
-        T = geo3d.Transform3D.translation(tx, ty, tz)
-        
-        # Rotação (convertendo graus para radianos)
-        rx = math.radians(self.rx_spin.value())
-        ry = math.radians(self.ry_spin.value())
-        rz = math.radians(self.rz_spin.value())
-        R = geo3d.Transform3D.rotation_euler(rx, ry, rz)
-        
-        # Escala
-        sx = self.sx_spin.value()
-        sy = self.sy_spin.value()
-        sz = self.sz_spin.value()
-        S = geo3d.Transform3D.scale(sx, sy, sz)
-        
-        # Compor transformações: Scale -> Rotate -> Translate (ordem correta)
-        combined = T * R * S
-        self.canvas3d.current_object.apply_transform(combined)
-        if self.opengl_viewer.current_object == self.canvas3d.current_object:
-            # Compartilhar o mesmo objeto, já aplicou transformação
-            pass
-        
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
+        # Nada mudou desde a última aplicação neste objeto
+        if (self._cached_T is not None and self._cached_RS is not None
+                and self._applied_transform is not None and self._applied_transform[0]() is obj
+                and self._applied_transform[1] is obj.transform):
+            return
+        
+        # Remontar só os grupos alterados
+        if self._cached_T is None:
+            self._cached_T = (self.tx_spin.value(), self.ty_spin.value(), self.tz_spin.value())
+        
+        if self._cached_R is None:
+            # Rotação (convertendo graus para radianos)
+            self._cached_R = geo3d.Transform3D.rotation_euler(
+                math.radians(self.rx_spin.value()),
+                math.radians(self.ry_spin.value()),
+                math.radians(self.rz_spin.value()))
+        
+        if self._cached_S is None:
+            self._cached_S = geo3d.Transform3D.scale(
+                self.sx_spin.value(), self.sy_spin.value(), self.sz_spin.value())
+        
+        # Compor transformações: Scale -> Rotate -> Translate (ordem correta).
+        # R * S só é multiplicado quando rotação ou escala mudam; a translação
+        # entra direto na coluna de translação (T * RS sem produto de matrizes)
+        if self._cached_RS is None:
+            self._cached_RS = self._cached_R * self._cached_S
+        combined = self._cached_RS.translated(*self._cached_T)
+        obj.set_transform(combined)
+        self._applied_transform = (weakref.ref(obj), combined)
+        
+        self._schedule_repaint()
     
     def _on_object_selected(self, index: int):
         """Handler para quando um objeto é selecionado na lista"""
@@ -1209,8 +1367,6 @@ class MainWindow(QMainWindow):
         # Definir o objeto atual
         selected_obj = self.canvas3d.objects[index]
         self.canvas3d.current_object = selected_obj
-        self.opengl_viewer.current_object = selected_obj
-        self.phong_viewer.current_object = selected_obj
         
         # Atualizar controles de transformação com os valores do objeto
         self._update_transform_controls_from_object(selected_obj)
@@ -1224,9 +1380,7 @@ class MainWindow(QMainWindow):
         self._update_3d_color_button(obj_color)
         
         # Atualizar visualizações
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
+        self._schedule_repaint()
     
     def _update_transform_controls_from_object(self, obj: geo3d.Object3D):
         """Atualiza os controles de transformação com os valores do objeto"""
@@ -1235,30 +1389,66 @@ class MainWindow(QMainWindow):
         # O usuário pode ajustar manualmente
         pass
     
-    def _update_object_list(self):
-        """Atualiza a lista de objetos na interface"""
-        self.object_selection_combo.blockSignals(True)
-        self.object_selection_combo.clear()
-        
-        for i, obj in enumerate(self.canvas3d.objects):
-            obj_name = f"Objeto {i + 1}"
-            # Tentar identificar o tipo de objeto
-            if hasattr(obj, 'vertices') and len(obj.vertices) == 8:
-                obj_name = f"Cubo {i + 1}"
-            elif hasattr(obj, 'vertices') and len(obj.vertices) == 5:
-                obj_name = f"Pirâmide {i + 1}"
-            # Adicionar mais identificações conforme necessário
-            
-            self.object_selection_combo.addItem(obj_name)
-        
-        # Selecionar o objeto atual
-        if self.canvas3d.current_object and self.canvas3d.current_object in self.canvas3d.objects:
-            current_idx = self.canvas3d.objects.index(self.canvas3d.current_object)
+    def _scene_index_of(self, obj: Optional[geo3d.Object3D]) -> int:
+        """Índice do objeto na cena, ou -1 se ele não está nela
+        
+        Consulta o dicionário id -> índice; se a entrada não confere (a lista mudou desde a
+        última consulta), o dicionário é refeito uma vez a partir da cena.
+        """
+        if obj is None:
+            return -1
+        idx = self._scene_index.get(id(obj), -1)
+        if 0 <= idx < len(self.scene_objects) and self.scene_objects[idx] is obj:
+            return idx
+        self._scene_index = {id(o): i for i, o in enumerate(self.scene_objects)}
+        return self._scene_index.get(id(obj), -1)
+    
+    @staticmethod
+    def _object_display_name(obj: geo3d.Object3D, index: int) -> str:
+        """Nome do objeto na lista (tipo identificado pelo número de vértices)"""
+        if hasattr(obj, 'vertices') and len(obj.vertices) == 8:
+            return f"Cubo {index + 1}"
+        elif hasattr(obj, 'vertices') and len(obj.vertices) == 5:
+            return f"Pirâmide {index + 1}"
+        # Adicionar mais identificações conforme necessário
+        return f"Objeto {index + 1}"
+    
+    def _select_current_in_list(self):
+        """Seleciona o objeto atual na lista (sinais já bloqueados por quem chama)"""
+        current_idx = self._scene_index_of(self.canvas3d.current_object)
+        if current_idx >= 0:
             self.object_selection_combo.setCurrentIndex(current_idx)
         elif len(self.canvas3d.objects) > 0:
             self.object_selection_combo.setCurrentIndex(0)
-        
-        self.object_selection_combo.blockSignals(False)
+    
+    def _update_object_list(self):
+        """Refaz a lista de objetos na interface a partir da cena"""
+        with QSignalBlocker(self.object_selection_combo):
+            self.object_selection_combo.clear()
+            
+            for i, obj in enumerate(self.canvas3d.objects):
+                self.object_selection_combo.addItem(self._object_display_name(obj, i))
+            
+            self._select_current_in_list()
+    
+    def _object_added(self, obj: geo3d.Object3D):
+        """Acrescenta à lista o objeto recém-adicionado ao fim da cena"""
+        if self.object_selection_combo.count() != len(self.scene_objects) - 1:
+            # Lista fora de sincronia com a cena (alterada por fora): refazer
+            self._update_object_list()
+            return
+        with QSignalBlocker(self.object_selection_combo):
+            self.object_selection_combo.addItem(self._object_display_name(obj, len(self.scene_objects) - 1))
+            self._select_current_in_list()
+    
+    def _object_replaced(self, index: int):
+        """Atualiza o item da lista cujo objeto foi substituído na cena"""
+        if self.object_selection_combo.count() != len(self.scene_objects):
+            self._update_object_list()
+            return
+        with QSignalBlocker(self.object_selection_combo):
+            self.object_selection_combo.setItemText(index, self._object_display_name(self.scene_objects[index], index))
+            self._select_current_in_list()
     
     def _reset_transform(self):
         """Reseta todas as transformações"""
@@ -1274,8 +1464,31 @@ class MainWindow(QMainWindow):
         
         if self.canvas3d.current_object:
             self.canvas3d.current_object.reset_transform()
-            self.canvas3d.update()
-            self.opengl_viewer.update()
+            self._schedule_repaint()
+    
+    def _replace_scene_object(self, old_obj, new_obj) -> bool:
+        """Substitui old_obj por new_obj na cena compartilhada pelos três viewers.
+        
+        Faz a troca na lista uma única vez, corrige o objeto atual de cada viewer,
+        atualiza o item da lista de objetos e agenda o repaint. Retorna False se
+        old_obj não está na cena.
+        """
+        idx = self._scene_index_of(old_obj)
+        if idx < 0:
+            return False
+        
+        self.scene_objects[idx] = new_obj
+        self._scene_index.pop(id(old_obj), None)
+        self._scene_index[id(new_obj)] = idx
+        
+        # Se era o objeto atual, atualizar referência (propagada aos outros viewers)
+        if self.canvas3d.current_object is old_obj:
+            self.canvas3d.current_object = new_obj
+        
+        # Atualizar só o item substituído na lista de objetos
+        self._object_replaced(idx)
+        self._schedule_repaint()
+        return True
     
     def _extrude_polygon(self):
         """Extrui o polígono 2D atual para 3D"""
@@ -1284,59 +1497,34 @@ class MainWindow(QMainWindow):
             return
         
         # Perguntar profundidade (ou usar a profundidade anterior se já existir)
-        from PyQt5.QtWidgets import QInputDialog
         current_depth = self.canvas.extrusion_depth if hasattr(self.canvas, 'extrusion_depth') else 100.0
-        depth, ok = QInputDialog.getDouble(
-            self, "Profundidade", "Digite a profundidade da extrusão:",
-            current_depth, 10.0, 500.0, 1
-        )
+        values = self._param_dialog.get_values(
+            "Profundidade", [("Digite a profundidade da extrusão:", current_depth, 10.0, 500.0)])
         
-        if not ok:
+        if values is None:
             return
+        depth = values[0]
         
         try:
             obj_3d = geo3d.extrude_polygon_2d(self.canvas.points, depth)
             # Definir cor inicial do objeto
             fill_color = self.canvas3d.fill_color
-            obj_3d.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                            fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
+            obj_3d.color = self.canvas3d.fill_color_norm
             
             self.canvas.extruded_object = obj_3d
             self.canvas.extrusion_depth = depth
             
             # Se já existe objeto 3D, substituir; senão adicionar
-            if self.canvas3d.current_object and self.canvas3d.current_object in self.canvas3d.objects:
-                idx = self.canvas3d.objects.index(self.canvas3d.current_object)
-                self.canvas3d.objects[idx] = obj_3d
-                self.canvas3d.current_object = obj_3d
-                
-                # Atualizar também no OpenGL e Phong
-                if idx < len(self.opengl_viewer.objects):
-                    self.opengl_viewer.objects[idx] = obj_3d
-                    if self.opengl_viewer.current_object == self.canvas3d.objects[idx]:
-                        self.opengl_viewer.current_object = obj_3d
-                if idx < len(self.phong_viewer.objects):
-                    self.phong_viewer.objects[idx] = obj_3d
-                    if self.phong_viewer.current_object == self.canvas3d.objects[idx]:
-                        self.phong_viewer.current_object = obj_3d
-            else:
+            if not self._replace_scene_object(self.canvas3d.current_object, obj_3d):
                 # Adicionar novo objeto sem limpar os existentes
                 self.canvas3d.add_object(obj_3d)
-                # Adicionar também no OpenGL e Phong
-                self.opengl_viewer.objects = list(self.canvas3d.objects)
-                self.opengl_viewer.current_object = self.canvas3d.current_object
-                self.phong_viewer.objects = list(self.canvas3d.objects)
-                self.phong_viewer.current_object = self.canvas3d.current_object
-            
-            # Atualizar lista de objetos
-            self._update_object_list()
+                # Acrescentar o novo item à lista de objetos
+                self._object_added(obj_3d)
             
             # Atualizar botão de cor
             self._update_3d_color_button(fill_color)
             
-            self.canvas3d.update()
-            self.opengl_viewer.update()
-            self.phong_viewer.update()
+            self._schedule_repaint()
             self.status.showMessage(f"Polígono extrudado com profundidade {depth}", 3000)
         except Exception as e:
             QMessageBox.critical(self, "Erro", f"Erro ao extrudar polígono: {str(e)}")
@@ -1344,366 +1532,59 @@ class MainWindow(QMainWindow):
     def _on_polygon_2d_changed(self):
         """Callback chamado quando o polígono 2D é modificado"""
         # Se há um objeto extrudado, atualizar automaticamente
-        if self.canvas.extruded_object and self.canvas.is_closed and len(self.canvas.points) >= 3:
-            obj_3d = self.canvas.update_extruded_object()
-            
-            if obj_3d:
-                # Atualizar o objeto no canvas 3D
-                old_obj = self.canvas.extruded_object
-                
-                # Preservar cor do objeto antigo
-                if hasattr(old_obj, 'color'):
-                    obj_3d.color = old_obj.color
-                
-                # Encontrar e substituir o objeto antigo na lista
-                if old_obj in self.canvas3d.objects:
-                    idx = self.canvas3d.objects.index(old_obj)
-                    self.canvas3d.objects[idx] = obj_3d
-                    
-                    # Atualizar também no OpenGL e Phong
-                    if idx < len(self.opengl_viewer.objects):
-                        self.opengl_viewer.objects[idx] = obj_3d
-                    if idx < len(self.phong_viewer.objects):
-                        self.phong_viewer.objects[idx] = obj_3d
-                    
-                    # Se era o objeto atual, atualizar referência
-                    if self.canvas3d.current_object == old_obj:
-                        self.canvas3d.current_object = obj_3d
-                    if self.opengl_viewer.current_object == old_obj:
-                        self.opengl_viewer.current_object = obj_3d
-                    if self.phong_viewer.current_object == old_obj:
-                        self.phong_viewer.current_object = obj_3d
-                    
-                    self.canvas3d.update()
-                    self.opengl_viewer.update()
-                    self.phong_viewer.update()
-                    # Atualizar transformações visuais também
-                    self._update_transform()
+        obj_3d = self.canvas.extruded_object
+        if obj_3d and self.canvas.is_closed and len(self.canvas.points) >= 3:
+            version = obj_3d.geom_version
+            # A malha é reescrita no próprio objeto: cor, transformação e lugar na cena ficam
+            if self.canvas.update_extruded_object() is obj_3d and obj_3d.geom_version != version:
+                idx = self._scene_index_of(obj_3d)
+                if idx >= 0:
+                    # O nome na lista depende do número de vértices
+                    self._object_replaced(idx)
+                    self._schedule_repaint()
+    
+    def _on_create_btn_clicked(self):
+        """Botão "Criar": cria a forma selecionada na lista suspensa"""
+        self._on_create_element_selected(self.create_elements_combo.currentIndex())
     
     def _on_create_element_selected(self, index: int):
         """Handler para quando uma forma é selecionada na lista suspensa"""
         if index == 0:  # "-- Selecionar Forma --"
             return
         
-        if index == 1:  # Cubo
-            self._create_cube()
-        elif index == 2:  # Pirâmide
-            self._create_pyramid()
-        elif index == 3:  # Cilindro
-            self._create_cylinder()
-        elif index == 4:  # Semiesfera
-            self._create_hemisphere()
-        elif index == 5:  # Esfera
-            self._create_sphere()
-        elif index == 6:  # Torus
-            self._create_torus()
-        elif index == 7:  # Cone
-            self._create_cone()
-        elif index == 8:  # Teapot
-            self._create_teapot()
+        if index <= len(SHAPE_SPECS):
+            self._create_shape(*SHAPE_SPECS[index - 1])
         
         # Resetar combo box após criar
-        self.create_elements_combo.blockSignals(True)
-        self.create_elements_combo.setCurrentIndex(0)
-        self.create_elements_combo.blockSignals(False)
-    
-    def _create_cube(self):
-        """Cria um cubo 3D"""
-        from PyQt5.QtWidgets import QInputDialog
-        size, ok = QInputDialog.getDouble(
-            self, "Tamanho do Cubo", "Digite o tamanho do cubo:",
-            100.0, 10.0, 500.0, 1
-        )
-        
-        if not ok:
-            return
-        
-        cube = geo3d.create_cube(size)
-        # Definir cor inicial do objeto
-        fill_color = self.canvas3d.fill_color
-        cube.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                      fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
-        
-        # Adicionar o mesmo objeto em ambos os viewers
-        self.canvas3d.add_object(cube)
-        # Sincronizar objetos: copiar a lista mas manter as mesmas instâncias
-        self.opengl_viewer.objects = list(self.canvas3d.objects)
-        self.opengl_viewer.current_object = self.canvas3d.current_object
-        self.phong_viewer.objects = list(self.canvas3d.objects)
-        self.phong_viewer.current_object = self.canvas3d.current_object
-        
-        # Atualizar lista de objetos
-        self._update_object_list()
-        
-        # Atualizar botão de cor
-        self._update_3d_color_button(fill_color)
-        
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
-        self.status.showMessage(f"Cubo criado com tamanho {size}. Veja na aba 'Phong (Scan Line)'", 3000)
-    
-    def _create_pyramid(self):
-        """Cria uma pirâmide 3D"""
-        from PyQt5.QtWidgets import QInputDialog
-        size, ok1 = QInputDialog.getDouble(
-            self, "Base da Pirâmide", "Digite o tamanho da base:",
-            100.0, 10.0, 500.0, 1
-        )
-        if not ok1:
-            return
-        
-        height, ok2 = QInputDialog.getDouble(
-            self, "Altura da Pirâmide", "Digite a altura:",
-            150.0, 10.0, 500.0, 1
-        )
-        if not ok2:
-            return
-        
-        pyramid = geo3d.create_pyramid(size, height)
-        # Definir cor inicial do objeto
-        fill_color = self.canvas3d.fill_color
-        pyramid.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                         fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
-        
-        self.canvas3d.add_object(pyramid)
-        self.opengl_viewer.objects = list(self.canvas3d.objects)
-        self.opengl_viewer.current_object = self.canvas3d.current_object
-        self.phong_viewer.objects = list(self.canvas3d.objects)
-        self.phong_viewer.current_object = self.canvas3d.current_object
-        
-        # Atualizar lista de objetos
-        self._update_object_list()
-        
-        # Atualizar botão de cor
-        self._update_3d_color_button(fill_color)
-        
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
-        self.status.showMessage(f"Pirâmide criada (base: {size}, altura: {height})", 3000)
-    
-    def _create_cylinder(self):
-        """Cria um cilindro 3D"""
-        from PyQt5.QtWidgets import QInputDialog
-        radius, ok1 = QInputDialog.getDouble(
-            self, "Raio do Cilindro", "Digite o raio:",
-            50.0, 10.0, 250.0, 1
-        )
-        if not ok1:
-            return
-        
-        height, ok2 = QInputDialog.getDouble(
-            self, "Altura do Cilindro", "Digite a altura:",
-            100.0, 10.0, 500.0, 1
-        )
-        if not ok2:
-            return
-        
-        cylinder = geo3d.create_cylinder(radius, height)
-        # Definir cor inicial do objeto
-        fill_color = self.canvas3d.fill_color
-        cylinder.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                          fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
-        
-        self.canvas3d.add_object(cylinder)
-        self.opengl_viewer.objects = list(self.canvas3d.objects)
-        self.opengl_viewer.current_object = self.canvas3d.current_object
-        self.phong_viewer.objects = list(self.canvas3d.objects)
-        self.phong_viewer.current_object = self.canvas3d.current_object
-        
-        # Atualizar lista de objetos
-        self._update_object_list()
-        
-        # Atualizar botão de cor
-        self._update_3d_color_button(fill_color)
-        
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
-        self.status.showMessage(f"Cilindro criado (raio: {radius}, altura: {height})", 3000)
-    
-    def _create_hemisphere(self):
-        """Cria uma semiesfera 3D"""
-        from PyQt5.QtWidgets import QInputDialog
-        radius, ok = QInputDialog.getDouble(
-            self, "Raio da Semiesfera", "Digite o raio:",
-            50.0, 10.0, 250.0, 1
-        )
-        
-        if not ok:
-            return
-        
-        hemisphere = geo3d.create_hemisphere(radius)
-        # Definir cor inicial do objeto
-        fill_color = self.canvas3d.fill_color
-        hemisphere.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                            fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
-        
-        self.canvas3d.add_object(hemisphere)
-        self.opengl_viewer.objects = list(self.canvas3d.objects)
-        self.opengl_viewer.current_object = self.canvas3d.current_object
-        self.phong_viewer.objects = list(self.canvas3d.objects)
-        self.phong_viewer.current_object = self.canvas3d.current_object
-        
-        # Atualizar lista de objetos
-        self._update_object_list()
-        
-        # Atualizar botão de cor
-        self._update_3d_color_button(fill_color)
-        
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
-        self.status.showMessage(f"Semiesfera criada com raio {radius}", 3000)
-    
-    def _create_sphere(self):
-        """Cria uma esfera 3D"""
-        from PyQt5.QtWidgets import QInputDialog
-        radius, ok = QInputDialog.getDouble(
-            self, "Raio da Esfera", "Digite o raio:",
-            50.0, 10.0, 250.0, 1
-        )
-        
-        if not ok:
-            return
-        
-        sphere = geo3d.create_sphere(radius)
-        # Definir cor inicial do objeto
-        fill_color = self.canvas3d.fill_color
-        sphere.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                        fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
-        
-        self.canvas3d.add_object(sphere)
-        self.opengl_viewer.objects = list(self.canvas3d.objects)
-        self.opengl_viewer.current_object = self.canvas3d.current_object
-        self.phong_viewer.objects = list(self.canvas3d.objects)
-        self.phong_viewer.current_object = self.canvas3d.current_object
-        
-        # Atualizar lista de objetos
-        self._update_object_list()
-        
-        # Atualizar botão de cor
-        self._update_3d_color_button(fill_color)
-        
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
-        self.status.showMessage(f"Esfera criada com raio {radius}", 3000)
-    
-    def _create_torus(self):
-        """Cria um torus 3D"""
-        from PyQt5.QtWidgets import QInputDialog
-        major_radius, ok1 = QInputDialog.getDouble(
-            self, "Raio Maior do Torus", "Digite o raio maior:",
-            50.0, 10.0, 250.0, 1
-        )
-        if not ok1:
-            return
-        
-        minor_radius, ok2 = QInputDialog.getDouble(
-            self, "Raio Menor do Torus", "Digite o raio menor:",
-            20.0, 5.0, 100.0, 1
-        )
-        if not ok2:
-            return
-        
-        torus = geo3d.create_torus(major_radius, minor_radius)
-        # Definir cor inicial do objeto
-        fill_color = self.canvas3d.fill_color
-        torus.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                       fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
-        
-        self.canvas3d.add_object(torus)
-        self.opengl_viewer.objects = list(self.canvas3d.objects)
-        self.opengl_viewer.current_object = self.canvas3d.current_object
-        self.phong_viewer.objects = list(self.canvas3d.objects)
-        self.phong_viewer.current_object = self.canvas3d.current_object
-        
-        # Atualizar lista de objetos
-        self._update_object_list()
-        
-        # Atualizar botão de cor
-        self._update_3d_color_button(fill_color)
-        
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
-        self.status.showMessage(f"Torus criado (raios: {major_radius}, {minor_radius})", 3000)
-    
-    def _create_cone(self):
-        """Cria um cone 3D"""
-        from PyQt5.QtWidgets import QInputDialog
-        radius, ok1 = QInputDialog.getDouble(
-            self, "Raio da Base do Cone", "Digite o raio:",
-            50.0, 10.0, 250.0, 1
-        )
-        if not ok1:
-            return
-        
-        height, ok2 = QInputDialog.getDouble(
-            self, "Altura do Cone", "Digite a altura:",
-            100.0, 10.0, 500.0, 1
-        )
-        if not ok2:
-            return
-        
-        cone = geo3d.create_cone(radius, height)
-        # Definir cor inicial do objeto
-        fill_color = self.canvas3d.fill_color
-        cone.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                      fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
-        
-        self.canvas3d.add_object(cone)
-        self.opengl_viewer.objects = list(self.canvas3d.objects)
-        self.opengl_viewer.current_object = self.canvas3d.current_object
-        self.phong_viewer.objects = list(self.canvas3d.objects)
-        self.phong_viewer.current_object = self.canvas3d.current_object
-        
-        # Atualizar lista de objetos
-        self._update_object_list()
-        
-        # Atualizar botão de cor
-        self._update_3d_color_button(fill_color)
-        
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
-        self.status.showMessage(f"Cone criado (raio: {radius}, altura: {height})", 3000)
-    
-    def _create_teapot(self):
-        """Cria um teapot 3D (Utah Teapot simplificado)"""
-        from PyQt5.QtWidgets import QInputDialog
-        size, ok = QInputDialog.getDouble(
-            self, "Tamanho do Teapot", "Digite o tamanho:",
-            50.0, 20.0, 200.0, 1
-        )
-        
-        if not ok:
+        with QSignalBlocker(self.create_elements_combo):
+            self.create_elements_combo.setCurrentIndex(0)
+    
+    def _create_shape(self, factory, title: str, fields, status_fmt: str):
+        """Cria uma forma 3D a partir de uma entrada de SHAPE_SPECS
+        
+        Pergunta os parâmetros num único diálogo (cancelar desiste), cria o objeto com a
+        cor de preenchimento atual e o adiciona à cena.
+        """
+        values = self._param_dialog.get_values(title, fields)
+        if values is None:
             return
         
-        teapot = geo3d.create_teapot(size)
+        obj = factory(*values)
         # Definir cor inicial do objeto
         fill_color = self.canvas3d.fill_color
-        teapot.color = (fill_color.red() / 255.0, fill_color.green() / 255.0, 
-                        fill_color.blue() / 255.0, fill_color.alpha() / 255.0)
+        obj.color = self.canvas3d.fill_color_norm
         
-        self.canvas3d.add_object(teapot)
-        self.opengl_viewer.objects = list(self.canvas3d.objects)
-        self.opengl_viewer.current_object = self.canvas3d.current_object
-        self.phong_viewer.objects = list(self.canvas3d.objects)
-        self.phong_viewer.current_object = self.canvas3d.current_object
+        # Adicionar à cena (a mesma lista nos três viewers)
+        self.canvas3d.add_object(obj)
         
-        # Atualizar lista de objetos
-        self._update_object_list()
+        # Acrescentar o novo item à lista de objetos
+        self._object_added(obj)
         
         # Atualizar botão de cor
         self._update_3d_color_button(fill_color)
         
-        self.canvas3d.update()
-        self.opengl_viewer.update()
-        self.phong_viewer.update()
-        self.status.showMessage(f"Teapot criado com tamanho {size}", 3000)
+        self._schedule_repaint()
+        self.status.showMessage(status_fmt.format(*values), 3000)
     
     def _clear_3d_objects(self):
         """Limpa todos os objetos 3D"""